@@ -0,0 +1,250 @@
+# ============================================================
+# PACOTE DE ASSETS - asset_bundle.py
+# ============================================================
+"""
+Empacota todos os assets num único arquivo e os lê via mmap.
+
+Formato (`assets.pak`):
+
+    cabeçalho  <8sII>  assinatura, versão, tamanho do índice
+    índice     JSON    {caminho: [offset, tamanho, tipo, hash]}
+    dados      blocos alinhados em 16 bytes, na ordem do índice
+
+Em tempo de execução o arquivo é mapeado na memória uma vez; cada asset
+vira um `BundleFile`, um arquivo somente leitura sobre uma fatia do mmap,
+que `pygame.image.load`, `pygame.font.Font` e `pygame.mixer.Sound` leem
+direto, sem abrir arquivos nem copiar o asset inteiro antes.
+
+Gerar/verificar o pacote (na raiz do projeto):
+
+    python asset_bundle.py             # grava assets.pak
+    python asset_bundle.py --verify    # confere os hashes de um pacote existente
+
+O pacote não se atualiza sozinho: gere de novo depois de mudar os assets.
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"JOGOPAK\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 16
+DEFAULT_BUNDLE_PATH = "assets.pak"
+DEFAULT_SOURCES = ("assets/*", "Texture/*", "*.png")
+
+ASSET_TYPES = {
+    ".png": "image", ".jpg": "image", ".jpeg": "image", ".bmp": "image",
+    ".ttf": "font", ".otf": "font",
+    ".wav": "sound", ".ogg": "sound",
+    ".json": "data", ".tmj": "data",
+}
+
+
+def normalize(path):
+    """Chave do índice: caminho relativo com '/' (igual em qualquer sistema)."""
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# -----------------------------
+# Empacotamento
+# -----------------------------
+def collect_sources(patterns=DEFAULT_SOURCES):
+    paths = set()
+    for pattern in patterns:
+        paths.update(path for path in glob.glob(pattern)
+                     if os.path.isfile(path) and os.path.splitext(path)[1].lower() in ASSET_TYPES)
+    return sorted(normalize(path) for path in paths)
+
+
+def build_bundle(output=DEFAULT_BUNDLE_PATH, paths=None):
+    """Grava o pacote com `paths` (padrão: todos os assets do jogo). Retorna o índice."""
+    paths = collect_sources() if paths is None else [normalize(path) for path in paths]
+    blobs = []
+    for path in paths:
+        with open(path, "rb") as f:
+            blobs.append(f.read())
+
+    # Os offsets dependem do tamanho do índice, que depende dos offsets:
+    # reserva espaço com offsets de largura fixa e depois preenche.
+    def encode_index(offsets):
+        return json.dumps({
+            path: [offset, len(blob), ASSET_TYPES[os.path.splitext(path)[1].lower()], content_hash(blob)]
+            for path, blob, offset in zip(paths, blobs, offsets)
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    index_size = len(encode_index([10 ** 12] * len(paths)))
+    offsets = []
+    position = _align(HEADER.size + index_size)
+    for blob in blobs:
+        offsets.append(position)
+        position = _align(position + len(blob))
+    index = encode_index(offsets).ljust(index_size)
+
+    temp_path = output + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, index_size))
+        f.write(index)
+        for offset, blob in zip(offsets, blobs):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(blob)
+    os.replace(temp_path, output)
+    return json.loads(index)
+
+
+def _align(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+# -----------------------------
+# Leitura
+# -----------------------------
+class BundleFile(io.RawIOBase):
+    """Arquivo somente leitura sobre uma fatia do pacote mapeado."""
+
+    def __init__(self, view, name):
+        super().__init__()
+        self._view = view
+        self._position = 0
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._view) - self._position)
+        if size <= 0:
+            return 0
+        buffer[:size] = self._view[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._position + size)
+        data = self._view[self._position:end].tobytes()
+        self._position = max(self._position, end)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, offset)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class AssetBundle:
+    def __init__(self, path=DEFAULT_BUNDLE_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_size = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} não é um pacote de assets")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão de pacote não suportada: {version}")
+        self._data = memoryview(self._map)
+        self.index = json.loads(self._data[HEADER.size:HEADER.size + index_size].tobytes())
+
+    def __contains__(self, path):
+        return normalize(path) in self.index
+
+    def view(self, path):
+        """Fatia (memoryview) do asset dentro do mmap, sem cópia."""
+        offset, size, _, _ = self.index[normalize(path)]
+        return self._data[offset:offset + size]
+
+    def digest(self, path):
+        """Hash do conteúdo registrado no índice."""
+        return self.index[normalize(path)][3]
+
+    def open(self, path):
+        return BundleFile(self.view(path), normalize(path))
+
+    def verify(self):
+        """Caminhos cujo conteúdo não confere com o hash do índice."""
+        return [path for path, (offset, size, _, digest) in self.index.items()
+                if content_hash(self._data[offset:offset + size]) != digest]
+
+
+# -----------------------------
+# Acesso aos arquivos (pacote ou disco)
+# -----------------------------
+# Com um assets.pak presente (ou JOGO_BUNDLE apontando para um), os assets
+# são lidos do pacote mapeado na memória; sem ele, direto do disco. Não
+# depende do pygame: a lógica pura (ex.: a biblioteca de cartas) também lê por aqui.
+_bundle = None
+
+
+def get_bundle():
+    """Pacote de assets aberto, ou None se não houver."""
+    global _bundle
+    if _bundle is None:
+        path = os.environ.get("JOGO_BUNDLE", DEFAULT_BUNDLE_PATH)
+        _bundle = AssetBundle(path) if path and os.path.isfile(path) else False
+    return _bundle or None
+
+
+def open_asset(path):
+    """Arquivo binário do asset `path` (do pacote, se estiver lá)."""
+    bundle = get_bundle()
+    if bundle is not None and path in bundle:
+        return bundle.open(path)
+    return open(path, "rb")
+
+
+def read_asset(path):
+    """Conteúdo do asset: uma fatia do pacote sem cópia, ou os bytes do disco."""
+    bundle = get_bundle()
+    if bundle is not None and path in bundle:
+        return bundle.view(path)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def asset_stamp(path):
+    """Carimbo que muda quando o conteúdo do asset muda (para caches derivados)."""
+    bundle = get_bundle()
+    if bundle is not None and path in bundle:
+        return bundle.digest(path)
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Empacota os assets do jogo num único arquivo.")
+    parser.add_argument("--output", default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--verify", action="store_true", help="só verifica um pacote existente")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        bad = AssetBundle(args.output).verify()
+        print("Pacote íntegro." if not bad else f"Conteúdo divergente: {', '.join(bad)}")
+        return 1 if bad else 0
+
+    index = build_bundle(args.output)
+    total = sum(size for _, size, _, _ in index.values())
+    print(f"{len(index)} assets ({total / 1024:.1f} KiB) em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
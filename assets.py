@@ -1,5 +1,15 @@
 import pygame
 
+import memory_tracker
+import pixel_cache
+# Acesso aos arquivos (pacote ou disco) fica em asset_bundle, sem pygame
+from asset_bundle import get_bundle, open_asset, read_asset, asset_stamp  # noqa: F401
+
+
+def load_image(path):
+    return pygame.image.load(open_asset(path), path)
+
+
 class Assets:
     def __init__(self):
         self.images = {}
@@ -7,19 +17,153 @@ class Assets:
         self.fonts = {}
 
     def load_image(self, key, path):
-        self.images[key] = pygame.image.load(path).convert_alpha()
+        self.images[key] = memory_tracker.track_surface(load_image(path).convert_alpha(), path)
 
     def get_image(self, key):
         return self.images.get(key)
 
     def load_sound(self, key, path):
-        self.sounds[key] = pygame.mixer.Sound(path)
+        self.sounds[key] = pygame.mixer.Sound(open_asset(path))
 
     def get_sound(self, key):
         return self.sounds.get(key)
 
     def load_font(self, key, path, size):
-        self.fonts[key] = pygame.font.Font(path, size)
+        self.fonts[key] = pygame.font.Font(open_asset(path), size)
 
     def get_font(self, key):
         return self.fonts.get(key)
+
+
+# -----------------------------
+# Cache de superfícies compartilhadas
+# -----------------------------
+# Imagens usadas por várias entidades (ex.: inimigos repetidos numa horda) são
+# carregadas e redimensionadas uma única vez e compartilhadas entre elas.
+_surface_cache = {}
+_scaled_cache = {}
+_decoded = {}   # caminho -> pixels decodificados por `preload`, ainda não convertidos
+
+
+def decode_surface(path):
+    """
+    Pixels de `path` decodificados, sem conversão para o formato da tela.
+    Não depende da janela: pode rodar fora da thread principal.
+    """
+    stamp = asset_stamp(path)
+    surface = pixel_cache.get(path, stamp, convert=pygame.Surface.copy)
+    if surface is None:
+        surface = load_image(path)
+        pixel_cache.put(path, stamp, surface)
+    return surface
+
+
+def preload(paths):
+    """Decodifica de antemão (ex.: numa thread de fundo) as imagens ainda não carregadas."""
+    for path in paths:
+        if path not in _surface_cache and path not in _decoded:
+            surface = decode_surface(path)
+            if path not in _surface_cache:
+                _decoded[path] = surface
+
+
+def load_surface(path):
+    """Carrega (uma vez) a imagem em `path` já convertida para a tela."""
+    surface = _surface_cache.get(path)
+    if surface is None:
+        decoded = _decoded.pop(path, None)
+        if decoded is not None:
+            # Já decodificada por `preload`: falta só a conversão
+            surface = decoded.convert_alpha()
+        else:
+            stamp = asset_stamp(path)
+            surface = pixel_cache.get(path, stamp)
+            if surface is None:
+                surface = load_image(path).convert_alpha()
+                pixel_cache.put(path, stamp, surface)
+        _surface_cache[path] = memory_tracker.track_surface(surface, path)
+    return surface
+
+
+def get_scaled_surface(path, size):
+    """Imagem de `path` redimensionada para `size`, compartilhada por chave."""
+    key = (path, size)
+    surface = _scaled_cache.get(key)
+    if surface is None:
+        stamp = asset_stamp(path)
+        surface = pixel_cache.get(path, stamp, size)
+        if surface is None:
+            surface = pygame.transform.smoothscale(load_surface(path), size)
+            pixel_cache.put(path, stamp, surface, size)
+        _scaled_cache[key] = memory_tracker.track_surface(surface, f"{path} {size[0]}x{size[1]}")
+    return surface
+
+
+# -----------------------------
+# Caminho de blit
+# -----------------------------
+# Tudo chega aqui via convert_alpha(), mas blit com alpha por pixel é várias
+# vezes mais lento que uma cópia opaca. Cada superfície é classificada pelo
+# canal alfa e convertida para o caminho mais barato que a desenha igual.
+BLIT_OPAQUE = "opaca"        # alfa 255 em tudo: convert(), cópia direta
+BLIT_COLORKEY = "colorkey"   # só alfa 0 ou 255: colorkey com RLE
+BLIT_ALPHA = "alpha"         # transparência parcial de verdade: mantém o alfa
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 254, 3))
+
+
+def classify_alpha(surface):
+    """BLIT_OPAQUE, BLIT_COLORKEY ou BLIT_ALPHA conforme o canal alfa da superfície."""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return BLIT_OPAQUE
+    width, height = surface.get_size()
+    opaque = pygame.mask.from_surface(surface, 254).count()
+    if opaque == width * height:
+        return BLIT_OPAQUE
+    visible = pygame.mask.from_surface(surface, 0).count()
+    return BLIT_COLORKEY if visible == opaque else BLIT_ALPHA
+
+
+def _free_colorkey(surface):
+    """Uma cor candidata que nenhum pixel visível usa, ou None."""
+    opaque = pygame.mask.from_surface(surface, 254)
+    for color in COLORKEY_CANDIDATES:
+        # from_threshold ignora o alfa; só importam os pixels visíveis
+        if not pygame.mask.from_threshold(surface, color, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+            return color
+    return None
+
+
+def optimize_surface(surface):
+    """(superfície, tipo): cópia no formato de blit mais barato, ou a própria se precisar de alfa."""
+    kind = classify_alpha(surface)
+    if kind == BLIT_OPAQUE:
+        return surface.convert(), kind
+    if kind == BLIT_COLORKEY:
+        color = _free_colorkey(surface)
+        if color is not None:
+            optimized = pygame.Surface(surface.get_size()).convert()
+            optimized.fill(color)
+            optimized.blit(surface, (0, 0))
+            optimized.set_colorkey(color, pygame.RLEACCEL)
+            return optimized, kind
+    return surface, BLIT_ALPHA
+
+
+def release(paths):
+    """Esquece as imagens de `paths` (originais, decodificadas e redimensionadas)."""
+    paths = set(paths)
+    for path in paths:
+        _surface_cache.pop(path, None)
+        _decoded.pop(path, None)
+    for key in [key for key in _scaled_cache if key[0] in paths]:
+        del _scaled_cache[key]
+
+
+def is_loaded(path):
+    return path in _surface_cache or path in _decoded
+
+
+def clear_surface_cache():
+    _surface_cache.clear()
+    _scaled_cache.clear()
+    _decoded.clear()
@@ -0,0 +1,79 @@
+import heapq
+import itertools
+
+
+class ActionScheduler:
+    """
+    Linha do tempo de ações da batalha, sobre um heap.
+
+    Cada entrada é (tempo, prioridade, sequência, ator, ação): sai primeiro
+    quem tem o menor tempo; empates vão para a menor prioridade e, depois,
+    para a ordem de agendamento. `ação` é chamada como `ação(ator)`.
+
+    - time_scale acelera (ou desacelera) o relógio da batalha.
+    - instant resolve tudo que estiver agendado no próximo `update`,
+      sem esperar (útil para simulação e para pular a vez dos inimigos).
+    """
+
+    def __init__(self, time_scale=1.0):
+        self._heap = []
+        self._sequence = itertools.count()
+        self._pending = set()      # sequências no heap ainda não canceladas
+        self.now = 0.0
+        self.time_scale = time_scale
+        self.instant = False
+
+    def schedule(self, delay, action, actor=None, priority=0):
+        """Agenda `action` para daqui a `delay` ms (no relógio da batalha)."""
+        return self.schedule_at(self.now + delay, action, actor, priority)
+
+    def schedule_at(self, time, action, actor=None, priority=0):
+        """Agenda `action` para o instante absoluto `time`. Retorna um id."""
+        sequence = next(self._sequence)
+        heapq.heappush(self._heap, (time, priority, sequence, actor, action))
+        self._pending.add(sequence)
+        return sequence
+
+    def cancel(self, entry_id):
+        """Cancela uma ação agendada (remoção preguiçosa); ids já executados são ignorados."""
+        self._pending.discard(entry_id)
+
+    def cancel_actor(self, actor):
+        """Cancela todas as ações pendentes de um ator."""
+        for _, _, sequence, entry_actor, _ in self._heap:
+            if entry_actor is actor:
+                self._pending.discard(sequence)
+
+    def clear(self):
+        self._heap.clear()
+        self._pending.clear()
+
+    def update(self, dt):
+        """Avança o relógio e executa as ações vencidas, em ordem."""
+        if self.instant:
+            return self.run_all()
+
+        self.now += dt * self.time_scale
+        executed = 0
+        while self._heap and self._heap[0][0] <= self.now:
+            executed += self._run_next()
+        return executed
+
+    def run_all(self):
+        """Executa todas as ações pendentes, inclusive as agendadas durante a execução."""
+        executed = 0
+        while self._heap:
+            self.now = max(self.now, self._heap[0][0])
+            executed += self._run_next()
+        return executed
+
+    def _run_next(self):
+        _, _, sequence, actor, action = heapq.heappop(self._heap)
+        if sequence not in self._pending:
+            return 0
+        self._pending.discard(sequence)
+        action(actor)
+        return 1
+
+    def __len__(self):
+        return len(self._pending)
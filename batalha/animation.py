@@ -1,35 +1,132 @@
 import pygame
 
 
+# -----------------------------
+# Curvas de easing (t em [0, 1])
+# -----------------------------
+def linear(t):
+    return t
 
-class DamageAnimation:
-    def __init__(self, target, amount, is_player=False, screen_width=800, hand_y=400):
+
+def ease_in_quad(t):
+    return t * t
+
+
+def ease_out_quad(t):
+    return t * (2 - t)
+
+
+def ease_out_cubic(t):
+    t -= 1
+    return t * t * t + 1
+
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+def ease_out_back(t):
+    c1 = 1.70158
+    t -= 1
+    return 1 + (c1 + 1) * t * t * t + c1 * t * t
+
+
+# -----------------------------
+# Textos renderizados em cache
+# -----------------------------
+_font = None
+_text_cache = {}
+TEXT_CACHE_LIMIT = 256
+
+
+def render_text(text, color):
+    """Superfície do texto (com alpha por superfície), reaproveitada por (texto, cor)."""
+    global _font
+    key = (text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if _font is None:
+            _font = pygame.font.SysFont(None, 36)
+        if len(_text_cache) >= TEXT_CACHE_LIMIT:
+            _text_cache.clear()
+        surface = _font.render(text, True, color).convert_alpha()
+        _text_cache[key] = surface
+    return surface
+
+
+class Tween:
+    """
+    Registro de animação: interpola posição, alpha e escala de uma superfície
+    ao longo de `duration` ms. Os registros são reaproveitados pelo pool do
+    AnimationManager, por isso não guardam nada além destes campos.
+    """
+    __slots__ = (
+        "surface", "target",
+        "x0", "y0", "dx", "dy",
+        "alpha0", "alpha1", "scale0", "scale1",
+        "elapsed", "duration", "easing", "scale_easing", "on_complete",
+        "x", "y", "alpha", "scale",
+    )
+
+    def reset(self, surface, x, y, dx=0.0, dy=0.0, duration=1000.0,
+              alpha=(255, 0), scale=(1.0, 1.0), easing=linear,
+              scale_easing=ease_out_back, on_complete=None, target=None):
+        self.surface = surface
         self.target = target
-        self.amount = amount
-        self.is_player = is_player
-        self.screen_width = screen_width
-        self.hand_y = hand_y
-        
-        if is_player:
-            self.position = (screen_width // 2, hand_y - 100)
-        else:
-            self.position = (target.rect.centerx, target.rect.top - 30)
-            
-        self.lifetime = 60  # frames
-        self.current_frame = 0
-        self.is_finished = False
-        
-        
-    def update(self):
-        self.current_frame += 1
-        self.position = (self.position[0], self.position[1] - 1)  # Move para cima
-        if self.current_frame >= self.lifetime:
-            self.is_finished = True
-            
+        self.x0, self.y0 = x, y
+        self.dx, self.dy = dx, dy
+        self.alpha0, self.alpha1 = alpha
+        self.scale0, self.scale1 = scale
+        self.elapsed = 0.0
+        self.duration = float(duration)
+        self.easing = easing
+        self.scale_easing = scale_easing
+        self.on_complete = on_complete
+        self.x, self.y = x, y
+        self.alpha = self.alpha0
+        self.scale = self.scale0
+        return self
+
+    def restart(self):
+        """Recomeça a animação do início, mantendo o registro."""
+        self.elapsed = 0.0
+
+    @property
+    def is_finished(self):
+        return self.elapsed >= self.duration
+
+    def update(self, dt):
+        """Avança `dt` ms. Retorna True quando a animação terminou."""
+        self.elapsed += dt
+        t = self.elapsed / self.duration
+        if t >= 1.0:
+            t = 1.0
+        k = self.easing(t)
+        self.x = self.x0 + self.dx * k
+        self.y = self.y0 + self.dy * k
+        self.alpha = self.alpha0 + (self.alpha1 - self.alpha0) * k
+        self.scale = self.scale0 + (self.scale1 - self.scale0) * self.scale_easing(t)
+        return t >= 1.0
+
     def draw(self, surface):
-        alpha = 255 * (1 - self.current_frame / self.lifetime)  # Fade out
-        font = pygame.font.SysFont(None, 36)
-        color = (255, 0, 0) if self.amount > 0 else (0, 255, 0)
-        text = font.render(str(self.amount), True, color)
-        text.set_alpha(alpha)
-        surface.blit(text, (self.position[0] - text.get_width()//2, self.position[1]))
\ No newline at end of file
+        image = self.surface
+        if abs(self.scale - 1.0) > 0.05:
+            image = _scaled(image, round(self.scale, 1))
+        image.set_alpha(int(self.alpha))
+        surface.blit(image, (self.x - image.get_width() // 2, self.y))
+
+
+_scaled_cache = {}
+
+
+def _scaled(image, scale):
+    """Versões escaladas (quantizadas em passos de 0.1) de uma superfície em cache."""
+    key = (id(image), scale)
+    entry = _scaled_cache.get(key)
+    if entry is None or entry[0] is not image:
+        if len(_scaled_cache) >= TEXT_CACHE_LIMIT:
+            _scaled_cache.clear()
+        size = (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale)))
+        entry = (image, pygame.transform.smoothscale(image, size))
+        _scaled_cache[key] = entry
+    return entry[1]
@@ -1,40 +1,87 @@
+from batalha.battle_events import DamageDealt
+from batalha.animation import Tween, render_text, ease_out_quad, ease_in_quad
+from batalha.damage_feedback import DamageFeedback
+
+DAMAGE_TEXT_DURATION = 1000   # ms
+DAMAGE_TEXT_RISE = 60         # px que o número sobe
+POOL_PREALLOCATED = 64
+
+
 class AnimationManager:
     def __init__(self, battle_manager):
         self.battle_manager = battle_manager
         self.animations = []
+        # Registros livres para reaproveitar (sem alocação por animação)
+        self._pool = [Tween() for _ in range(POOL_PREALLOCATED)]
+        self.damage_feedback = DamageFeedback(self)
+        battle_manager.battle_log.subscribe(DamageDealt, self._on_damage_dealt)
+
+    def _on_damage_dealt(self, event):
+        """Acertos próximos no mesmo alvo viram um único número animado."""
+        is_player = event.target is self.battle_manager.game.player
+        self.damage_feedback.add_hit(event.target, event.amount, event.absorbed,
+                                     event.critical, is_player)
+
+    def update(self, dt=16):
+        """Avança todas as animações `dt` ms; remove as terminadas por troca com a última."""
+        animations = self.animations
+        i = 0
+        while i < len(animations):
+            anim = animations[i]
+            if anim.update(dt):
+                animations[i] = animations[-1]
+                animations.pop()
+                callback = anim.on_complete
+                self._release(anim)
+                if callback is not None:
+                    callback()
+            else:
+                i += 1
 
-    def update(self):
-        """Atualiza todas as animações."""
-        for anim in self.animations[:]:
-            anim.update()
-            if anim.is_finished:
-                self.animations.remove(anim)
+    def _acquire(self):
+        return self._pool.pop() if self._pool else Tween()
 
-    def spawn_damage_animation(self, target, damage, is_player=False):
+    def _release(self, anim):
+        anim.surface = None
+        anim.target = None
+        anim.on_complete = None
+        self._pool.append(anim)
+
+    def _anchor(self, target, is_player):
+        """Ponto de onde sobe o texto: acima do alvo, ou acima da mão para o jogador."""
+        if is_player or not hasattr(target, "rect"):
+            return (self.battle_manager.game.screen_width // 2,
+                    self.battle_manager.hand_renderer.hand_y - 100)
+        return (target.rect.centerx, target.rect.top - 30)
+
+    def spawn_text(self, target, text, color, is_player=False, on_complete=None, surface=None):
+        """Texto flutuante que sobe e some sobre o alvo (ou uma superfície já pronta)."""
+        x, y = self._anchor(target, is_player)
+        anim = self._acquire().reset(
+            surface if surface is not None else render_text(text, color), x, y,
+            dy=-DAMAGE_TEXT_RISE, duration=DAMAGE_TEXT_DURATION,
+            alpha=(255, 0), scale=(1.4, 1.0),
+            easing=ease_out_quad, on_complete=on_complete, target=target)
+        self.animations.append(anim)
+        return anim
+
+    def spawn_damage_animation(self, target, damage, is_player=False, on_complete=None):
         """Cria animação de dano."""
-        from .animation import DamageAnimation
-        self.animations.append(DamageAnimation(
-            target, damage,
-            is_player=is_player,
-            screen_width=self.battle_manager.game.screen_width,
-            hand_y=self.battle_manager.hand_renderer.hand_y
-        ))
-
-    def spawn_status_animation(self, target, status_name):
+        color = (255, 0, 0) if damage > 0 else (0, 255, 0)
+        return self.spawn_text(target, str(damage), color, is_player, on_complete)
+
+    def spawn_status_animation(self, target, status_name, on_complete=None):
         """Cria animação para indicar aplicação de status."""
-        from .animation import TextAnimation
-        self.animations.append(TextAnimation(
-            target, status_name.upper(),
-            color=(255, 215, 0),
-            screen_width=self.battle_manager.game.screen_width,
-            hand_y=self.battle_manager.hand_renderer.hand_y
-        ))
+        is_player = target is self.battle_manager.game.player
+        anim = self.spawn_text(target, status_name.upper(), (255, 215, 0), is_player, on_complete)
+        anim.easing = ease_in_quad
+        return anim
 
     def has_active_animations(self):
         """Verifica se há animações em andamento."""
-        return any(not anim.is_finished for anim in self.animations)
+        return bool(self.animations)
 
     def draw(self, surface):
         """Desenha todas as animações."""
         for anim in self.animations:
-            anim.draw(surface)
\ No newline at end of file
+            anim.draw(surface)
@@ -0,0 +1,112 @@
+from typing import NamedTuple
+
+
+# -----------------------------
+# Eventos tipados da batalha
+# -----------------------------
+class DamageDealt(NamedTuple):
+    source: object
+    target: object
+    amount: int
+    absorbed: int = 0        # parte do dano que o escudo do alvo vai absorver
+    critical: bool = False
+
+
+class ShieldGained(NamedTuple):
+    source: object
+    target: object
+    amount: int
+
+
+class Healed(NamedTuple):
+    source: object
+    target: object
+    amount: int
+
+
+class StatusApplied(NamedTuple):
+    source: object
+    target: object
+    status: str
+    kwargs: dict
+
+
+class CardUsed(NamedTuple):
+    card: object
+    target: object
+
+
+class TurnEnded(NamedTuple):
+    side: str   # "player" ou "enemy"
+    turn: int
+
+
+def _name(entity):
+    return getattr(entity, "name", "-") if entity is not None else "-"
+
+
+def format_event(event):
+    """Texto curto e legível de um evento (para logs e depuração)."""
+    if isinstance(event, DamageDealt):
+        return f"Dano {event.amount} em {_name(event.target)} (origem: {_name(event.source)})"
+    if isinstance(event, ShieldGained):
+        return f"Escudo +{event.amount} para {_name(event.target)}"
+    if isinstance(event, Healed):
+        return f"Cura {event.amount} em {_name(event.target)}"
+    if isinstance(event, StatusApplied):
+        return f"Status {event.status} em {_name(event.target)} {event.kwargs}"
+    if isinstance(event, CardUsed):
+        return f"Carta usada: {event.card} → {_name(event.target)}"
+    if isinstance(event, TurnEnded):
+        return f"Fim do turno {event.turn} ({event.side})"
+    return repr(event)
+
+
+class BattleLog:
+    """
+    Fluxo de eventos da batalha.
+
+    Toda mudança de estado do combate passa por `emit`: o evento é anexado a um
+    buffer append-only e entregue aos assinantes do seu tipo, na ordem de
+    inscrição. O BattleManager se inscreve primeiro para aplicar a mutação;
+    animações, HUD e logs reagem depois só aos eventos que lhes interessam.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._subscribers = {}
+        self._wildcard = []
+
+    def subscribe(self, event_type, callback):
+        """Inscreve `callback` para eventos de `event_type`."""
+        self._subscribers.setdefault(event_type, []).append(callback)
+
+    def subscribe_all(self, callback):
+        """Inscreve `callback` para todos os eventos."""
+        self._wildcard.append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        callbacks = self._subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def emit(self, event):
+        """Registra o evento e o entrega aos assinantes."""
+        self.events.append(event)
+        for callback in self._subscribers.get(type(event), ()):
+            callback(event)
+        for callback in self._wildcard:
+            callback(event)
+        return event
+
+    def replay(self, callback, start=0):
+        """Reentrega os eventos registrados (a partir de `start`) a `callback`."""
+        for event in self.events[start:]:
+            callback(event)
+
+    def of_type(self, event_type):
+        """Eventos registrados de um tipo (útil para análise pós-batalha)."""
+        return [event for event in self.events if type(event) is event_type]
+
+    def __len__(self):
+        return len(self.events)
@@ -1,12 +1,25 @@
+import logging
 import pygame
 from .battle_state import BattleState
 from .enemy import Enemy
+from .formation import formation_layout, enemy_area
+from .hit_test import HitTestMap, Z_ENEMY, Z_BUTTON
+from .ui import END_TURN_BUTTON
+from .particles import ParticleSystem
+from .battle_events import (
+    BattleLog, DamageDealt, ShieldGained, Healed, StatusApplied, CardUsed, TurnEnded, format_event
+)
 from characters.hand_renderer import HandRenderer
 from batalha.animation_manager import AnimationManager
 from batalha.status_manager import StatusManager
 from batalha.turn_manager import TurnManager
 from batalha.render_manager import RenderManager
 from batalha.input_manager import InputManager
+from log import get_logger
+
+log = get_logger("batalha")
+
+MAX_FRAME_DT = 100  # ms
 
 
 class BattleManager:
@@ -14,65 +27,152 @@ class BattleManager:
         self.game = game
         self.font = game.assets.get_font("default")
         self.state = BattleState.PLAYER_TURN
-        
+        self.turn = 1
+
+        # Fluxo de eventos: os aplicadores de mutação se inscrevem primeiro
+        self.battle_log = BattleLog()
+        self.battle_log.subscribe(DamageDealt, self._on_damage_dealt)
+        self.battle_log.subscribe(ShieldGained, self._on_shield_gained)
+        self.battle_log.subscribe(Healed, self._on_healed)
+        self.battle_log.subscribe(StatusApplied, self._on_status_applied)
+        self.battle_log.subscribe(CardUsed, self._on_card_used)
+        self.battle_log.subscribe_all(self._log_event)
+
         # Módulos especializados
         self.animation_manager = AnimationManager(self)
         self.status_manager = StatusManager(self)
         self.turn_manager = TurnManager(self)
         self.render_manager = RenderManager(self)
         self.input_manager = InputManager(self)
+
+        # Efeitos elementais disparados pela resolução das cartas
+        self.particles = ParticleSystem()
+        self.battle_log.subscribe(CardUsed, self._emit_card_particles)
         
         # Grupos de entidades
         self.enemies = pygame.sprite.Group()
-        
+        self.enemy_draw_order = []          # de trás para a frente
+
+        # Mapa de cliques compartilhado por renderização e input
+        self.hit_map = HitTestMap(cell_size=64)
+        self.hit_map.register("end_turn", END_TURN_BUTTON, Z_BUTTON, "end_turn")
+        self.battle_log.subscribe(DamageDealt, self._on_damage_hit_map)
+
         # Renderizador da mão
         self.hand_renderer = HandRenderer(
             game.player,
             screen_width=game.screen_width - 200,
             hand_y=game.screen_height - 150,
-            align="center"
+            align="center",
+            hit_map=self.hit_map
         )
 
     def setup_battle(self, enemies_data):
         """Inicializa os inimigos e reseta estado do jogador."""
-        positions = self._enemy_positions()
+        positions, size = self._enemy_positions(len(enemies_data))
 
-        for i, data in enumerate(enemies_data[:len(positions)]):
+        # A ordem de criação segue a formação: de trás para a frente
+        for order, (data, position) in enumerate(zip(enemies_data, positions)):
             enemy = Enemy(
                 data["name"], data["health"], data["attack"],
-                data["image"], positions[i]
+                data["image"], position, speed=data.get("speed", 1.0), size=size
             )
             self.enemies.add(enemy)
+            self.enemy_draw_order.append(enemy)
+            self.hit_map.register(("enemy", id(enemy)), enemy.rect, Z_ENEMY + order, "enemy", enemy)
 
+        self.render_manager.invalidate_health_bars()
         self.turn_manager.reset_player_turn()
         self.turn_manager.enemy_turn_started = False
 
-    def _enemy_positions(self):
-        """Retorna posições pré-definidas para até 3 inimigos."""
-        return [
-            (self.game.screen_width * (i + 1) // 4, self.game.screen_height // 4)
-            for i in range(3)
-        ]
+    def _enemy_positions(self, count):
+        """Formação automática (fileiras, escala e sobreposição) para `count` inimigos."""
+        area = enemy_area(self.game.screen_width, self.game.screen_height)
+        return formation_layout(count, area)
+
+    def enemy_at(self, pos):
+        """Inimigo vivo visível no topo em `pos`, pelo mapa de cliques."""
+        hit = self.hit_map.query(pos, kind="enemy")
+        return hit[1] if hit is not None else None
+
+    def _on_damage_hit_map(self, event):
+        # Inimigos mortos deixam de ser alvo: o clique passa para quem está atrás
+        if event.target in self.enemies and event.target.health <= 0:
+            self.hit_map.unregister(("enemy", id(event.target)))
 
     def handle_click(self, pos):
         """Delega o tratamento de clique para o input manager."""
         return self.input_manager.handle_click(pos)
 
     def update(self, dt=16):
-        """Atualiza o estado da batalha."""
-        self.animation_manager.update()
+        """Atualiza o estado da batalha (`dt` em ms desde o último frame)."""
+        dt = min(dt, MAX_FRAME_DT)  # evita saltos depois de travadas/carregamentos
+        self.animation_manager.update(dt)
+        self.particles.update(dt)
+        self.hand_renderer.update(dt)
         
         if self.state in [BattleState.VICTORY, BattleState.DEFEAT]:
             return
 
         self.turn_manager.update(dt)
 
-    def apply_damage_to_enemy(self, enemy, damage):
+    def apply_damage_to_enemy(self, enemy, damage, source=None):
         """Aplica dano ao inimigo e verifica condições de fim de batalha."""
-        enemy.take_damage(damage)
-        self.animation_manager.spawn_damage_animation(enemy, damage, is_player=False)
+        self.deal_damage(enemy, damage, source)
         self.check_battle_end_conditions()
-        
+
+    # -------------------------
+    # Comandos (emitem eventos)
+    # -------------------------
+    def deal_damage(self, target, amount, source=None, critical=False):
+        absorbed = min(amount, getattr(target, "shield", 0))
+        return self.battle_log.emit(DamageDealt(source, target, amount, absorbed, critical))
+
+    def gain_shield(self, target, amount, source=None):
+        return self.battle_log.emit(ShieldGained(source, target, amount))
+
+    def heal(self, target, amount, source=None):
+        return self.battle_log.emit(Healed(source, target, amount))
+
+    def apply_status(self, target, status, source=None, **kwargs):
+        return self.battle_log.emit(StatusApplied(source, target, status, kwargs))
+
+    def use_card(self, card, target=None):
+        return self.battle_log.emit(CardUsed(card, target))
+
+    def end_turn(self, side):
+        event = self.battle_log.emit(TurnEnded(side, self.turn))
+        if side == "enemy":
+            self.turn += 1
+        return event
+
+    # -------------------------
+    # Aplicadores de eventos
+    # -------------------------
+    def _on_damage_dealt(self, event):
+        event.target.take_damage(event.amount)
+
+    def _on_shield_gained(self, event):
+        event.target.shield += event.amount
+
+    def _on_healed(self, event):
+        event.target.heal(event.amount)
+
+    def _on_status_applied(self, event):
+        if hasattr(event.target, "add_status"):
+            event.target.add_status(event.status, **event.kwargs)
+
+    def _on_card_used(self, event):
+        event.card.use()
+
+    def _emit_card_particles(self, event):
+        target_rect = getattr(event.target, "rect", None)
+        if target_rect is not None:
+            self.particles.emit(event.card.element, *target_rect.center)
+
+    def _log_event(self, event):
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(format_event(event))
 
     def draw(self, surface):
         """Delega a renderização para o render manager."""
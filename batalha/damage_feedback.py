@@ -0,0 +1,88 @@
+import pygame
+
+from batalha.animation import render_text
+
+MERGE_WINDOW_MS = 300
+_small_font = None
+_damage_cache = {}
+DAMAGE_CACHE_LIMIT = 128
+
+
+def render_damage_text(total, hits, absorbed, critical, color):
+    """Número de dano com o detalhamento (acertos, escudo, crítico) numa superfície só."""
+    key = (total, hits, absorbed, critical, color)
+    surface = _damage_cache.get(key)
+    if surface is not None:
+        return surface
+
+    global _small_font
+    if _small_font is None:
+        _small_font = pygame.font.SysFont(None, 20)
+
+    main = render_text(f"{total}!" if critical else str(total), color)
+    details = []
+    if hits > 1:
+        details.append(f"x{hits}")
+    if absorbed:
+        details.append(f"escudo -{absorbed}")
+    if not details:
+        surface = main
+    else:
+        detail = _small_font.render("  ".join(details), True, (230, 230, 230))
+        surface = pygame.Surface((max(main.get_width(), detail.get_width()),
+                                  main.get_height() + detail.get_height()), pygame.SRCALPHA)
+        surface.blit(main, ((surface.get_width() - main.get_width()) // 2, 0))
+        surface.blit(detail, ((surface.get_width() - detail.get_width()) // 2, main.get_height()))
+
+    if len(_damage_cache) >= DAMAGE_CACHE_LIMIT:
+        _damage_cache.clear()
+    _damage_cache[key] = surface
+    return surface
+
+
+class _HitGroup:
+    __slots__ = ("anim", "total", "hits", "absorbed", "critical", "color")
+
+
+class DamageFeedback:
+    """
+    Agrega os acertos num mesmo alvo: enquanto o número atual ainda está no
+    início da animação (`window_ms`), um novo acerto soma no mesmo número em
+    vez de criar outro texto por cima. O texto só é re-renderizado quando o
+    total muda, e a animação recomeça para destacar o combo.
+    """
+
+    def __init__(self, animation_manager, window_ms=MERGE_WINDOW_MS):
+        self.animation_manager = animation_manager
+        self.window_ms = window_ms
+        self._groups = {}
+
+    def add_hit(self, target, amount, absorbed=0, critical=False, is_player=False):
+        group = self._groups.get(target)
+        if group is not None and group.anim.elapsed < self.window_ms:
+            group.total += amount
+            group.hits += 1
+            group.absorbed += absorbed
+            group.critical = group.critical or critical
+            group.anim.surface = self._render(group)
+            group.anim.restart()
+            return group.anim
+
+        group = _HitGroup()
+        group.total, group.hits, group.absorbed, group.critical = amount, 1, absorbed, critical
+        group.color = (255, 0, 0) if amount > 0 else (0, 255, 0)
+        group.anim = self.animation_manager.spawn_text(
+            target, None, group.color, is_player,
+            on_complete=lambda: self._finish(target, group), surface=self._render(group))
+        self._groups[target] = group
+        return group.anim
+
+    def _render(self, group):
+        return render_damage_text(group.total, group.hits, group.absorbed, group.critical, group.color)
+
+    def _finish(self, target, group):
+        if self._groups.get(target) is group:
+            del self._groups[target]
+
+    def clear(self):
+        self._groups.clear()
@@ -0,0 +1,59 @@
+import math
+import pygame
+
+MAX_ENEMY_SIZE = 150
+MIN_ENEMY_SIZE = 40
+ROW_OVERLAP = 0.35   # fração da altura que uma fileira cobre da fileira de trás
+COLUMN_GAP = 0.15    # fração do espaçamento horizontal deixada livre entre sprites
+
+
+def formation_layout(count, area, max_size=MAX_ENEMY_SIZE, min_size=MIN_ENEMY_SIZE,
+                     overlap=ROW_OVERLAP):
+    """
+    Distribui `count` inimigos em fileiras dentro de `area` (pygame.Rect).
+
+    Escolhe o número de fileiras que deixa os sprites maiores, encolhendo-os
+    até `min_size` e sobrepondo fileiras quando não há espaço. Retorna
+    (centros, tamanho), com os centros ordenados da fileira de trás para a
+    da frente — a mesma ordem em que devem ser desenhados.
+    """
+    if count <= 0:
+        return [], max_size
+
+    best_rows, best_size = 1, 0
+    for rows in range(1, count + 1):
+        cols = math.ceil(count / rows)
+        size_by_width = area.width / (cols + 1) * (1 - COLUMN_GAP)
+        size_by_height = area.height / (1 + (rows - 1) * (1 - overlap))
+        size = min(max_size, size_by_width, size_by_height)
+        if size > best_size:
+            best_rows, best_size = rows, size
+        if size_by_height < min_size:
+            break
+
+    rows = best_rows
+    size = max(min_size, int(best_size))
+    cols = math.ceil(count / rows)
+    row_step = size * (1 - overlap)
+    total_height = size + (rows - 1) * row_step
+    top = area.centery - total_height / 2
+
+    centers = []
+    remaining = count
+    for row in range(rows):
+        # A fileira da frente (última desenhada) fica com os inimigos que sobrarem
+        in_row = min(cols, remaining) if row < rows - 1 else remaining
+        remaining -= in_row
+        y = top + size / 2 + row * row_step
+        spacing = area.width / (in_row + 1)
+        # Fileiras alternadas ficam deslocadas meia coluna para não se esconderem
+        stagger = spacing / 2 if (rows - 1 - row) % 2 else 0
+        for i in range(in_row):
+            x = area.left + spacing * (i + 1) + stagger
+            centers.append((int(x), int(y)))
+    return centers, size
+
+
+def enemy_area(screen_width, screen_height):
+    """Região da tela reservada aos inimigos (acima do status e da mão)."""
+    return pygame.Rect(0, 50, screen_width, screen_height // 3)
@@ -0,0 +1,75 @@
+from batalha.spatial_index import SpatialGrid
+
+# Profundidade (maior = por cima)
+Z_PLAYER = 0
+Z_ENEMY = 100          # + ordem de desenho na formação
+Z_CARD = 1000          # + índice na mão
+Z_BUTTON = 2000
+
+
+class HitTestMap:
+    """
+    Mapa único de áreas clicáveis da batalha, com ordem de profundidade.
+
+    A renderização registra o que desenha (retângulo, z, tipo e alvo) e o
+    input consulta o mesmo mapa, então hover e clique sempre concordam sobre
+    qual objeto está visível no topo. Registrar de novo um item com o mesmo
+    retângulo e z não custa nada; o índice espacial só é reconstruído quando
+    algum retângulo realmente muda.
+
+    Um item pode ser composto: com `resolve`, o retângulo registrado é só a
+    área total e `resolve(pos)` devolve o alvo exato (ou None para deixar o
+    clique passar para o item de baixo).
+    """
+
+    def __init__(self, cell_size=64):
+        self._entries = {}   # chave -> (rect, z, kind, target, resolve)
+        self._index = SpatialGrid(cell_size)
+        self._dirty = False
+
+    def register(self, key, rect, z, kind, target=None, resolve=None):
+        current = self._entries.get(key)
+        if (current is not None and current[0] == rect and current[1] == z
+                and current[3] is target and current[4] == resolve):
+            return
+        self._entries[key] = (rect.copy(), z, kind, target, resolve)
+        self._dirty = True
+
+    def unregister(self, key):
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def unregister_kind(self, kind):
+        keys = [key for key, entry in self._entries.items() if entry[2] == kind]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self._dirty = True
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def query(self, pos, kind=None):
+        """(tipo, alvo) do item de maior z em `pos`, opcionalmente só de um tipo."""
+        if self._dirty:
+            self._rebuild()
+        entries = [self._entries[key] for key in self._index.query_point(pos)]
+        if kind is not None:
+            entries = [entry for entry in entries if entry[2] == kind]
+        entries.sort(key=lambda entry: entry[1], reverse=True)
+        for _, _, entry_kind, target, resolve in entries:
+            if resolve is not None:
+                target = resolve(pos)
+                if target is None:
+                    continue
+            return entry_kind, target
+        return None
+
+    def _rebuild(self):
+        self._index.clear()
+        for key, (rect, *_) in self._entries.items():
+            self._index.insert(rect, key)
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._entries)
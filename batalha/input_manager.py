@@ -1,7 +1,9 @@
 import pygame
 from batalha.battle_state import BattleState
 from characters.cards import CardType
-from batalha.ui import END_TURN_BUTTON
+from log import get_logger
+
+log = get_logger("input")
 
 
 class InputManager:
@@ -13,77 +15,61 @@ class InputManager:
 
     def handle_click(self, pos):
         """Gerencia cliques durante o turno do jogador."""
-        print(f"[DEBUG] Clique detectado em {pos}, turno atual: {self.battle_manager.state}")
+        log.debug("Clique detectado em %s, turno atual: %s", pos, self.battle_manager.state)
 
         if self.battle_manager.state != BattleState.PLAYER_TURN:
-            print("[DEBUG] Não é turno do jogador.")
+            log.debug("Não é turno do jogador.")
             return False
 
         if self.battle_manager.animation_manager.has_active_animations():
-            print("[DEBUG] Animação em execução, clique ignorado.")
+            log.debug("Animação em execução, clique ignorado.")
             return False
 
-        # Botão de fim de turno
-        if END_TURN_BUTTON.collidepoint(pos):
-            print("[DEBUG] Botão de fim de turno clicado.")
-            self.battle_manager.turn_manager.end_player_turn()
-            return True
+        # Um único teste no mapa de cliques: o objeto visível no topo recebe o clique
+        hit = self.battle_manager.hit_map.query(pos)
+        kind, target = hit if hit is not None else (None, None)
 
-        # Clique em carta
-        if self._handle_card_click(pos):
+        if kind == "end_turn":
+            log.debug("Botão de fim de turno clicado.")
+            self.battle_manager.turn_manager.end_player_turn()
+            self.battle_manager.game.latency.mark("fim_de_turno")
             return True
 
-        # Clique em inimigo
-        if self._handle_enemy_click(pos):
-            return True
+        if kind == "card":
+            log.debug("Carta %s clicada em %s", target, pos)
+            if self._process_card_click(target, pos):
+                return True
 
-        # Clique no próprio player
-        if self._handle_player_click(pos):
-            return True
+        elif kind == "enemy":
+            if self._handle_enemy_click(target):
+                return True
 
-        print("[DEBUG] Clique não atingiu nada válido.")
-        return False
+        elif kind == "player":
+            if self._handle_player_click(target):
+                return True
 
-    # -------------------------
-    # Clique em carta
-    # -------------------------
-    def _handle_card_click(self, pos):
-        """Verifica se clicou em carta e trata ataque/defesa."""
-        for i, card_pos in enumerate(self.battle_manager.hand_renderer.card_positions):
-            rect = pygame.Rect(
-                card_pos,
-                (self.battle_manager.hand_renderer.CARD_WIDTH,
-                 self.battle_manager.hand_renderer.CARD_HEIGHT)
-            )
-            if rect.collidepoint(pos):
-                print(f"[DEBUG] Carta {i} clicada na posição {card_pos}")
-                return self._process_card_click(i, pos)
+        log.debug("Clique não atingiu nada válido.")
         return False
 
     def _process_card_click(self, card_index, pos):
         """Processa o clique em uma carta específica."""
         card = self.battle_manager.game.player.hand[card_index]
-        # Debug detalhado da carta
-        print("\n[DEBUG] ===== Carta Clicada =====")
-        print(f"Índice: {card_index}")
-        print(card)  # usa __str__ -> tipo, valor, elemento, usos, energia
-        print(f"Estado: {card.state}")
-        print(f"Efeito de status: {card.status_effect}")
-        print(f"Args do efeito: {card.status_kwargs}")
-        print("===============================\n")
+        log.debug("Carta clicada: índice=%s %s | estado=%s | efeito=%s %s",
+                  card_index, card, card.state, card.status_effect, card.status_kwargs)
 
-        self.battle_manager.game.player.select_card_by_index(card_index)
+        if self.battle_manager.game.player.select_card_by_index(card_index):
+            self.battle_manager.game.latency.mark("carta_selecionada")
 
         if card.card_type == CardType.ATAQUE.value:
-            print("[DEBUG] Carta de ATAQUE selecionada. Aguardando clique em inimigo.")
+            log.debug("Carta de ATAQUE selecionada. Aguardando clique em inimigo.")
             return True
 
         elif card.card_type == CardType.DEFESA.value:
-            print("[DEBUG] Carta de DEFESA selecionada. Esperando duplo clique.")
+            log.debug("Carta de DEFESA selecionada. Esperando duplo clique.")
             return self._handle_defense_card_click(card_index)
 
         elif card.card_type in (CardType.BUFF.value, CardType.DEBUFF.value):
-            print(f"[DEBUG] Carta {card.card_type} selecionada. Aguardando clique em alvo.")
+            log.debug("Carta %s selecionada. Aguardando clique em alvo.", card.card_type)
             return True
 
         return False
@@ -94,64 +80,55 @@ class InputManager:
         if (self.last_card_clicked == card_index and
             (now - self.last_click_time) < self.double_click_threshold):
             card = self.battle_manager.game.player.hand[card_index]
-            print("[DEBUG] Duplo clique detectado na carta de DEFESA. Aplicando defesa.")
+            log.debug("Duplo clique detectado na carta de DEFESA. Aplicando defesa.")
             self._resolve_defense_card(card)
             return True
         else:
             self.last_card_clicked = card_index
             self.last_click_time = now
-            print("[DEBUG] Primeiro clique em carta de DEFESA.")
+            log.debug("Primeiro clique em carta de DEFESA.")
             return True
 
     # -------------------------
     # Clique em inimigo (REVISADO)
     # -------------------------
-    def _handle_enemy_click(self, pos):
-        """Verifica se clicou em inimigo com carta selecionada."""
+    def _handle_enemy_click(self, enemy):
+        """Usa as cartas selecionadas no inimigo clicado."""
         selected_cards = self.battle_manager.game.player.get_selected_cards()
         if not selected_cards:
             return False
 
-        for enemy in self.battle_manager.enemies:
-            if enemy.rect.collidepoint(pos):
-                print(f"[DEBUG] Inimigo {enemy.name} clicado. HP={enemy.health}")
-                if enemy.health <= 0:
-                    print("[DEBUG] Inimigo já está morto. Cancelando.")
-                    self.battle_manager.game.player.reset_selection()
-                    return False
-                
-                # A lógica agora está unificada aqui. Chama a função de resolução de efeito
-                # para o primeiro inimigo clicado.
-                self._resolve_card_effects(enemy)
-                
-                # Depois que o efeito for resolvido, limpa a seleção
-                self.battle_manager.game.player.reset_selection()
-                self.battle_manager.hand_renderer.update_card_positions()
-                return True
-                
-        return False
+        log.debug("Inimigo %s clicado. HP=%s", enemy.name, enemy.health)
+        if enemy.health <= 0:
+            log.debug("Inimigo já está morto. Cancelando.")
+            self.battle_manager.game.player.reset_selection()
+            return False
+
+        # A lógica agora está unificada aqui. Chama a função de resolução de efeito
+        # para o inimigo visível no topo do ponto clicado.
+        self._resolve_card_effects(enemy)
+        self.battle_manager.game.latency.mark("carta_usada")
+
+        # Depois que o efeito for resolvido, limpa a seleção
+        self.battle_manager.game.player.reset_selection()
+        self.battle_manager.hand_renderer.update_card_positions()
+        return True
 
     # -------------------------
     # Clique no player
     # -------------------------
-    def _handle_player_click(self, pos):
+    def _handle_player_click(self, player):
         """Permite usar buffs e defesa no próprio player."""
-        selected_cards = self.battle_manager.game.player.get_selected_cards()
+        selected_cards = player.get_selected_cards()
         if not selected_cards:
             return False
 
-        player = self.battle_manager.game.player
-        # A nova lógica de clique em inimigo já tem a responsabilidade de limpar a seleção.
-        # Esta função é para tratar cliques em cartas que afetam o próprio jogador.
-        # A lógica para buffs e defesa deve ser chamada aqui.
-        if player.rect.collidepoint(pos):
-            print("[DEBUG] Player clicado. Aplicando efeitos.")
-            self._resolve_card_effects(player)
-            self.battle_manager.game.player.reset_selection()
-            self.battle_manager.hand_renderer.update_card_positions()
-            return True
-
-        return False
+        log.debug("Player clicado. Aplicando efeitos.")
+        self._resolve_card_effects(player)
+        self.battle_manager.game.latency.mark("carta_usada")
+        player.reset_selection()
+        self.battle_manager.hand_renderer.update_card_positions()
+        return True
 
     # -------------------------
     # Aplicação de efeitos (REVISADO)
@@ -159,21 +136,19 @@ class InputManager:
     def _resolve_card_effects(self, target):
         """Aplica efeitos das cartas selecionadas no alvo."""
         if hasattr(target, "health") and target.health <= 0:
-            print("[DEBUG] Tentou aplicar efeito em alvo morto. Cancelando.")
+            log.debug("Tentou aplicar efeito em alvo morto. Cancelando.")
             return
 
         for card in self.battle_manager.game.player.get_selected_cards():
-            print(f"[DEBUG] Aplicando {card.card_type} em {target.name if hasattr(target, 'name') else 'Player'}")
+            log.debug("Aplicando %s em %s", card.card_type, target.name if hasattr(target, 'name') else 'Player')
 
             # Lógica para cartas de ATAQUE
             if card.card_type == CardType.ATAQUE and target != self.battle_manager.game.player:
                 base_damage = card.value
-                final_damage = self.battle_manager.status_manager.calculate_player_damage(base_damage, card)
-                print(f"[DEBUG] Dano calculado={final_damage}")
+                final_damage = self.battle_manager.status_manager.calculate_player_damage(base_damage, card, target)
+                log.debug("Dano calculado=%s", final_damage)
                 
-                # O dano está sendo aplicado corretamente aqui:
-                self.battle_manager.apply_damage_to_enemy(target, final_damage)
-                self.battle_manager.animation_manager.spawn_damage_animation(target, final_damage)
+                self.battle_manager.apply_damage_to_enemy(target, final_damage, source=card)
 
             # Lógica para cartas de DEFESA
             elif card.card_type == CardType.DEFESA and target == self.battle_manager.game.player:
@@ -182,22 +157,20 @@ class InputManager:
             # Lógica para cartas de BUFF
             elif card.card_type == CardType.BUFF: 
                 if hasattr(card, 'status_effect'):
-                    print(f"[DEBUG] Aplicando BUFF {card.status_effect}")
                     self.battle_manager.status_manager.apply_status_to_target(
-                        target, card.status_effect, **card.status_kwargs)
+                        target, card.status_effect, source=card, **card.status_kwargs)
 
             # Lógica para cartas de DEBUFF
             elif card.card_type == CardType.DEBUFF and target != self.battle_manager.game.player:
                 if hasattr(card, 'status_effect'):
-                    print(f"[DEBUG] Aplicando DEBUFF {card.status_effect}")
                     self.battle_manager.status_manager.apply_status_to_target(
-                        target, card.status_effect, **card.status_kwargs)
+                        target, card.status_effect, source=card, **card.status_kwargs)
 
-            card.use()
+            self.battle_manager.use_card(card, target)
 
     def _resolve_defense_card(self, card):
         """Aplica carta de defesa diretamente no jogador."""
-        print(f"[DEBUG] Aplicando DEFESA ao jogador. Valor={card.value}")
-        self.battle_manager.game.player.shield += card.value
-        card.use()
+        player = self.battle_manager.game.player
+        self.battle_manager.gain_shield(player, card.value, source=card)
+        self.battle_manager.use_card(card, player)
         self.battle_manager.hand_renderer.update_card_positions()
\ No newline at end of file
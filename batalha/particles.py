@@ -0,0 +1,143 @@
+"""
+Partículas dos efeitos elementais das cartas.
+
+Todo o estado vive em arrays NumPy pré-alocados (posição, velocidade, vida,
+elemento) com capacidade fixa: emitir sobrescreve as partículas mais antigas
+em anel e a atualização é vetorizada. O desenho usa "carimbos" pré-renderizados
+por elemento e nível de transparência, enviados num único `blits`.
+
+NumPy é opcional: sem ele o sistema fica desligado e nada é desenhado.
+"""
+import time
+
+import pygame
+
+from config import ELEMENTS, ELEMENT_COLORS
+import rng as game_rng
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+FADE_LEVELS = 4          # níveis de alpha dos carimbos
+STAMP_RADIUS = 3
+BUDGET_MS = 2.0          # tempo máximo por frame para update + draw
+
+# Comportamento por elemento: (gravidade px/ms², velocidade inicial px/ms, vida ms)
+ELEMENT_BEHAVIOR = {
+    'Fogo':  (-0.0004, 0.12, 700),   # sobe como brasas
+    'Terra': (0.0012, 0.18, 600),    # estilhaços pesados
+    'Água':  (0.0008, 0.14, 800),    # respingos
+    'Ar':    (0.0, 0.20, 500),       # rajada sem peso
+}
+
+
+class ParticleSystem:
+    def __init__(self, capacity=4096, budget_ms=BUDGET_MS):
+        self.enabled = np is not None
+        self.capacity = capacity
+        self.budget_ms = budget_ms
+        self.draw_stride = 1     # desenha 1 a cada N partículas se estourar o orçamento
+        self._cursor = 0
+        self._spent_ms = 0.0
+        if not self.enabled:
+            return
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)       # ms restantes
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.element = np.zeros(capacity, dtype=np.int8)       # índice em ELEMENTS
+        # Gerador vetorizado semeado pelo fluxo "fx": partículas reproduzíveis com JOGO_SEED
+        self._rng = np.random.default_rng(game_rng.get_stream("fx").getrandbits(64))
+
+        self._stamps = None
+
+    # -------------------------
+    # Emissão
+    # -------------------------
+    def emit(self, element, x, y, count=40):
+        """Emite `count` partículas do `element` a partir de (x, y)."""
+        if not self.enabled or element not in ELEMENT_BEHAVIOR:
+            return
+        count = min(count, self.capacity)
+        gravity, speed, life = ELEMENT_BEHAVIOR[element]
+
+        idx = (self._cursor + np.arange(count)) % self.capacity
+        self._cursor = (self._cursor + count) % self.capacity
+
+        angle = self._rng.uniform(0, 2 * np.pi, count)
+        magnitude = self._rng.uniform(0.3, 1.0, count) * speed
+        self.pos[idx] = (x, y)
+        self.vel[idx, 0] = np.cos(angle) * magnitude
+        self.vel[idx, 1] = np.sin(angle) * magnitude
+        lifetimes = self._rng.uniform(0.6, 1.0, count) * life
+        self.life[idx] = lifetimes
+        self.max_life[idx] = lifetimes
+        self.gravity[idx] = gravity
+        self.element[idx] = ELEMENTS.index(element)
+
+    # -------------------------
+    # Atualização e desenho
+    # -------------------------
+    def update(self, dt):
+        if not self.enabled:
+            return
+        started = time.perf_counter()
+        alive = self.life > 0
+        if alive.any():
+            self.vel[alive, 1] += self.gravity[alive] * dt
+            self.pos[alive] += self.vel[alive] * dt
+            self.life[alive] -= dt
+        self._spent_ms = (time.perf_counter() - started) * 1000
+
+    def draw(self, surface):
+        if not self.enabled:
+            return
+        started = time.perf_counter()
+        idx = np.flatnonzero(self.life > 0)
+        if idx.size:
+            idx = idx[::self.draw_stride]
+            if self._stamps is None:
+                self._stamps = self._build_stamps()
+            fade = np.minimum((self.life[idx] / self.max_life[idx] * FADE_LEVELS).astype(np.int32),
+                              FADE_LEVELS - 1)
+            points = (self.pos[idx] - STAMP_RADIUS).astype(np.int32).tolist()
+            stamps = self._stamps
+            surface.blits(
+                [(stamps[e][f], p) for e, f, p in zip(self.element[idx].tolist(), fade.tolist(), points)],
+                doreturn=False)
+
+        spent = self._spent_ms + (time.perf_counter() - started) * 1000
+        self._adapt_budget(spent)
+
+    def _adapt_budget(self, spent_ms):
+        """Desenha menos partículas quando o frame estoura o orçamento, e volta aos poucos."""
+        if spent_ms > self.budget_ms:
+            self.draw_stride = min(self.draw_stride + 1, 8)
+        elif spent_ms < self.budget_ms * 0.5 and self.draw_stride > 1:
+            self.draw_stride -= 1
+
+    def _build_stamps(self):
+        """Carimbos [elemento][nível de fade] pré-renderizados."""
+        stamps = []
+        size = STAMP_RADIUS * 2
+        for element in ELEMENTS:
+            color = ELEMENT_COLORS[element]
+            levels = []
+            for level in range(FADE_LEVELS):
+                alpha = int(255 * (level + 1) / FADE_LEVELS)
+                stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(stamp, (*color, alpha), (STAMP_RADIUS, STAMP_RADIUS), STAMP_RADIUS)
+                levels.append(stamp)
+            stamps.append(levels)
+        return stamps
+
+    def active_count(self):
+        return int(np.count_nonzero(self.life > 0)) if self.enabled else 0
+
+    def clear(self):
+        if self.enabled:
+            self.life[:] = 0
@@ -1,13 +1,34 @@
 import pygame
 from batalha.battle_state import BattleState
+from batalha.battle_events import DamageDealt, Healed, StatusApplied, TurnEnded
+from batalha.hit_test import Z_PLAYER
 from batalha.ui import draw_end_turn_button, draw_player_status
 from characters.hand_renderer import draw_card
 
+HEALTH_BAR_COLORKEY = (255, 0, 255)
+
 
 class RenderManager:
     def __init__(self, battle_manager):
         self.battle_manager = battle_manager
 
+        # Textos de status dos inimigos só são re-renderizados quando um
+        # evento relevante chega, em vez de a cada frame.
+        self._enemy_status_cache = {}
+        log = battle_manager.battle_log
+        log.subscribe(StatusApplied, self._invalidate_enemy_status)
+        log.subscribe(TurnEnded, self._invalidate_enemy_status)
+        log.subscribe(DamageDealt, self._invalidate_enemy_status)
+
+        # Camada com todas as barras de vida dos inimigos
+        self._health_bar_layer = None
+        self._health_bar_origin = (0, 0)
+        log.subscribe(DamageDealt, self.invalidate_health_bars)
+        log.subscribe(Healed, self.invalidate_health_bars)
+
+    def _invalidate_enemy_status(self, event):
+        self._enemy_status_cache.clear()
+
     def draw(self, surface):
         """Renderiza toda a cena da batalha."""
         surface.fill((50, 50, 80))
@@ -18,6 +39,7 @@ class RenderManager:
         
         self._draw_player_status(surface)
         self._draw_enemy_status(surface)
+        self.battle_manager.particles.draw(surface)
         self.battle_manager.animation_manager.draw(surface)
         
         if (self.battle_manager.state == BattleState.PLAYER_TURN and 
@@ -27,32 +49,67 @@ class RenderManager:
         self._draw_battle_state(surface)
 
     def _draw_enemies(self, surface):
-        self.battle_manager.enemies.draw(surface)
-        for enemy in self.battle_manager.enemies:
-            if enemy.health > 0:
-                self._draw_health_bar(surface, enemy)
+        # Um único blits para todos os sprites (compartilhados) da formação
+        surface.blits([(enemy.image, enemy.rect) for enemy in self.battle_manager.enemy_draw_order],
+                      doreturn=False)
+
+        if self._health_bar_layer is None:
+            self._build_health_bar_layer()
+        if self._health_bar_layer is not None:
+            surface.blit(self._health_bar_layer, self._health_bar_origin)
+
+    def invalidate_health_bars(self, event=None):
+        self._health_bar_layer = None
 
-    def _draw_health_bar(self, surface, enemy):
+    def _build_health_bar_layer(self):
+        """Desenha todas as barras de vida numa camada única, refeita só quando há dano."""
+        alive = [enemy for enemy in self.battle_manager.enemy_draw_order if enemy.health > 0]
+        if not alive:
+            return
+
+        bounds = pygame.Rect(alive[0].rect.x, alive[0].rect.y - 20, alive[0].rect.width, 10)
+        bounds.unionall_ip([pygame.Rect(e.rect.x, e.rect.y - 20, e.rect.width, 10) for e in alive])
+
+        layer = pygame.Surface(bounds.size)
+        layer.fill(HEALTH_BAR_COLORKEY)
+        layer.set_colorkey(HEALTH_BAR_COLORKEY, pygame.RLEACCEL)
+        for enemy in alive:
+            self._draw_health_bar(layer, enemy, -bounds.x, -bounds.y)
+
+        self._health_bar_layer = layer
+        self._health_bar_origin = bounds.topleft
+
+    def _draw_health_bar(self, surface, enemy, offset_x=0, offset_y=0):
         ratio = enemy.health / enemy.max_health
-        pygame.draw.rect(surface, (255, 0, 0), 
-            (enemy.rect.x, enemy.rect.y - 20, enemy.rect.width, 10))
-        pygame.draw.rect(surface, (0, 255, 0), 
-            (enemy.rect.x, enemy.rect.y - 20, enemy.rect.width * ratio, 10))
+        x = enemy.rect.x + offset_x
+        y = enemy.rect.y - 20 + offset_y
+        pygame.draw.rect(surface, (255, 0, 0), (x, y, enemy.rect.width, 10))
+        pygame.draw.rect(surface, (0, 255, 0), (x, y, enemy.rect.width * ratio, 10))
 
     def _draw_player_status(self, surface):
-        draw_player_status(surface, self.battle_manager.game.player, 50, 340)
+        player = self.battle_manager.game.player
+        draw_player_status(surface, player, 50, 340)
+        self.battle_manager.hit_map.register("player", player.rect, Z_PLAYER, "player", player)
 
     def _draw_enemy_status(self, surface):
         for enemy in self.battle_manager.enemies:
             if enemy.health > 0 and hasattr(enemy, 'status_effects'):
                 status_y = enemy.rect.y - 40
-                for status, data in enemy.status_effects.items():
-                    duration = data.get('duration', '∞')
-                    text = f"{status}: {duration}"
-                    status_surface = self.battle_manager.font.render(text, True, (255, 255, 0))
+                for status_surface in self._enemy_status_surfaces(enemy):
                     surface.blit(status_surface, (enemy.rect.x, status_y))
                     status_y -= 15
 
+    def _enemy_status_surfaces(self, enemy):
+        surfaces = self._enemy_status_cache.get(enemy)
+        if surfaces is None:
+            surfaces = []
+            for status, data in enemy.status_effects.items():
+                duration = data.get('duration', '∞')
+                text = f"{status}: {duration}"
+                surfaces.append(self.battle_manager.font.render(text, True, (255, 255, 0)))
+            self._enemy_status_cache[enemy] = surfaces
+        return surfaces
+
     def _draw_battle_state(self, surface):
         if self.battle_manager.state in [BattleState.VICTORY, BattleState.DEFEAT]:
             self._draw_overlay_message(
@@ -64,6 +121,11 @@ class RenderManager:
             text = "Seu turno! Selecione cartas e ataque os inimigos." if self.battle_manager.state == BattleState.PLAYER_TURN else "Turno do inimigo! Aguarde..."
             self._draw_text_center(surface, text, (255, 255, 255), y=10)
 
+            speed_label = self.battle_manager.turn_manager.speed_label
+            if speed_label != "x1":
+                rendered = self.battle_manager.font.render(f"Velocidade: {speed_label} [F]", True, (200, 200, 200))
+                surface.blit(rendered, (10, 10))
+
     def _draw_overlay_message(self, text, color):
         overlay = pygame.Surface((self.battle_manager.game.screen_width, self.battle_manager.game.screen_height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
@@ -0,0 +1,32 @@
+class SpatialGrid:
+    """
+    Índice espacial em grade uniforme para retângulos.
+
+    Cada item é registrado nas células que seu retângulo cobre; uma consulta
+    por ponto só testa os itens da célula do ponto, em vez de todos.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._items = []
+
+    def clear(self):
+        self._cells.clear()
+        self._items.clear()
+
+    def insert(self, rect, item):
+        cell = self.cell_size
+        entry = (rect, item)
+        self._items.append(entry)
+        for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+            for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                self._cells.setdefault((cx, cy), []).append(entry)
+
+    def query_point(self, pos):
+        """Itens cujo retângulo contém `pos`, na ordem de inserção."""
+        key = (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        return [item for rect, item in self._cells.get(key, ()) if rect.collidepoint(pos)]
+
+    def __len__(self):
+        return len(self._items)
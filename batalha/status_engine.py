@@ -0,0 +1,229 @@
+"""
+Motor único de efeitos de status.
+
+Todo status (do jogador ou de inimigos) é descrito por uma `StatusDefinition`
+no registro `STATUS_DEFINITIONS`: regra de acúmulo, efeito por turno e
+modificadores de atributo. Cada entidade mantém em `status_modifiers` o
+agregado dos modificadores ativos, recalculado só quando os status mudam,
+de forma que o cálculo de dano vira uma leitura de atributos.
+"""
+from log import get_logger
+
+log = get_logger("status")
+
+
+# -----------------------------
+# Modificadores agregados
+# -----------------------------
+class StatusModifiers:
+    """Soma dos modificadores de todos os status ativos de uma entidade."""
+    __slots__ = ("attack_flat", "damage_mult", "incoming_mult", "dodge_chance", "speed_mult")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.attack_flat = 0
+        self.damage_mult = 1.0
+        self.incoming_mult = 1.0
+        self.dodge_chance = 0.0
+        self.speed_mult = 1.0
+
+
+class StatusDefinition:
+    """
+    Definição de um status.
+
+    stacking: "refresh" (valores novos, maior duração), "stack" (soma a
+              intensidade e mantém a maior duração) ou "replace".
+    on_tick:  função (context, target, data) chamada uma vez por turno.
+    modify:   função (modifiers, data) que contribui para o agregado.
+    """
+    __slots__ = ("name", "stacking", "on_tick", "modify")
+
+    def __init__(self, name, stacking="refresh", on_tick=None, modify=None):
+        self.name = name
+        self.stacking = stacking
+        self.on_tick = on_tick
+        self.modify = modify
+
+
+STACKABLE_KEYS = ("power", "damage", "heal")
+
+
+# -----------------------------
+# Efeitos por turno
+# -----------------------------
+def _tick_damage(context, target, data):
+    context.damage(target, data.get("damage", data.get("power", 1)))
+
+
+def _tick_heal(context, target, data):
+    context.heal(target, data.get("heal", data.get("power", 2)))
+
+
+def _tick_shield(context, target, data):
+    context.shield(target, data.get("power", 1))
+
+
+# -----------------------------
+# Modificadores
+# -----------------------------
+def _mod_attack(modifiers, data):
+    modifiers.attack_flat += data.get("power", 0)
+
+
+def _mod_weakness(modifiers, data):
+    modifiers.damage_mult *= data.get("multiplier", 0.75)
+
+
+def _mod_vulnerability(modifiers, data):
+    modifiers.incoming_mult *= data.get("multiplier", 1.5)
+
+
+def _mod_dodge(modifiers, data):
+    modifiers.dodge_chance = max(modifiers.dodge_chance, data.get("chance", 0.5))
+
+
+def _mod_slow(modifiers, data):
+    modifiers.speed_mult *= data.get("multiplier", 0.5)
+
+
+STATUS_DEFINITIONS = {
+    definition.name: definition for definition in (
+        StatusDefinition("veneno", "stack", on_tick=_tick_damage),
+        StatusDefinition("queimadura", "stack", on_tick=_tick_damage),
+        StatusDefinition("regeneração", "refresh", on_tick=_tick_heal),
+        StatusDefinition("defesa_up", "refresh", on_tick=_tick_shield),
+        StatusDefinition("força", "stack", modify=_mod_attack),
+        StatusDefinition("fraqueza", "refresh", modify=_mod_weakness),
+        StatusDefinition("vulnerabilidade", "refresh", modify=_mod_vulnerability),
+        StatusDefinition("esquiva", "refresh", modify=_mod_dodge),
+        StatusDefinition("lentidao", "refresh", modify=_mod_slow),
+        StatusDefinition("confusao", "refresh"),
+    )
+}
+
+# Nomes antigos ou alternativos usados por cartas e inimigos
+STATUS_ALIASES = {
+    "regeneracao": "regeneração",
+    "regen": "regeneração",
+    "vulneravel": "vulnerabilidade",
+    "ataque_up": "força",
+    "fortalecido": "força",
+    "buff": "força",
+}
+
+
+def canonical_name(status):
+    return STATUS_ALIASES.get(status, status)
+
+
+def get_definition(status):
+    return STATUS_DEFINITIONS.get(canonical_name(status))
+
+
+# -----------------------------
+# Operações sobre entidades
+# -----------------------------
+def add_status(entity, status, kwargs):
+    """Aplica `status` respeitando a regra de acúmulo da definição."""
+    status = canonical_name(status)
+    definition = STATUS_DEFINITIONS.get(status)
+    current = entity.status_effects.get(status)
+    data = dict(kwargs)
+
+    if current is not None and definition is not None and definition.stacking != "replace":
+        if definition.stacking == "stack":
+            for key in STACKABLE_KEYS:
+                if key in data and key in current:
+                    data[key] += current[key]
+        if "duration" in current:
+            data["duration"] = max(current["duration"], data.get("duration", 0))
+
+    entity.status_effects[status] = data
+    recompute_modifiers(entity)
+    return data
+
+
+def remove_status(entity, status):
+    status = canonical_name(status)
+    if status in entity.status_effects:
+        del entity.status_effects[status]
+        recompute_modifiers(entity)
+        return True
+    return False
+
+
+def recompute_modifiers(entity):
+    """Recalcula o agregado de modificadores da entidade."""
+    modifiers = entity.status_modifiers
+    modifiers.reset()
+    for status, data in entity.status_effects.items():
+        definition = STATUS_DEFINITIONS.get(status)
+        if definition is not None and definition.modify is not None:
+            definition.modify(modifiers, data)
+
+
+def tick(entity, context):
+    """
+    Um turno de status: aplica o efeito de cada status, reduz a duração e
+    remove os expirados. Retorna a lista de status removidos.
+    """
+    expired = []
+    for status, data in list(entity.status_effects.items()):
+        definition = STATUS_DEFINITIONS.get(status)
+        if definition is not None and definition.on_tick is not None:
+            definition.on_tick(context, entity, data)
+
+        if "duration" in data:
+            data["duration"] -= 1
+            if data["duration"] <= 0:
+                expired.append(status)
+
+    for status in expired:
+        log.debug("Status %s de %s expirou.", status, getattr(entity, "name", "?"))
+        del entity.status_effects[status]
+    if expired:
+        recompute_modifiers(entity)
+    return expired
+
+
+class DirectContext:
+    """Contexto de tick fora da batalha: altera a entidade diretamente."""
+
+    def damage(self, target, amount):
+        target.take_damage(amount)
+
+    def heal(self, target, amount):
+        target.heal(amount)
+
+    def shield(self, target, amount):
+        target.shield += amount
+
+
+DIRECT_CONTEXT = DirectContext()
+
+
+class StatusHolder:
+    """Mixin com a interface de status compartilhada por Player e Enemy."""
+
+    def _init_status(self):
+        self.status_effects = {}  # {"veneno": {"damage": 2, "duration": 3}}
+        self.status_modifiers = StatusModifiers()
+
+    def add_status(self, status: str, **kwargs):
+        """Adiciona ou acumula um status (buff/debuff)."""
+        data = add_status(self, status, kwargs)
+        log.debug("%s ganhou status: %s %s", self.name, canonical_name(status), data)
+
+    def has_status(self, status: str):
+        return canonical_name(status) in self.status_effects
+
+    def remove_status(self, status: str):
+        if remove_status(self, status):
+            log.debug("%s perdeu o status %s", self.name, canonical_name(status))
+
+    def tick_status(self, context=DIRECT_CONTEXT):
+        """Aplica os efeitos por turno e reduz a duração dos status."""
+        return tick(self, context)
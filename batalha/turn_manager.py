@@ -1,23 +1,38 @@
 from batalha.battle_state import BattleState
+from batalha.battle_events import DamageDealt
+from batalha.action_scheduler import ActionScheduler
+
+# Prioridades na linha do tempo (menor executa antes no mesmo instante)
+PRIORITY_ATTACK = 0
+PRIORITY_END_OF_TURN = 10
+PRIORITY_TURN_END = 20
+
+# Modos de velocidade do turno inimigo: escala de tempo (None = instantâneo)
+SPEED_MODES = (1.0, 3.0, None)
+
 
 class TurnManager:
     def __init__(self, battle_manager):
         self.battle_manager = battle_manager
-        self.enemy_actions_queue = []
-        self.enemy_attack_timer = 0
-        self.enemy_attack_interval = 600
+        self.scheduler = ActionScheduler()
+        self.enemy_attack_interval = 600  # ms por ação, com velocidade 1.0
         self.enemy_turn_started = False
+        self._turn_end_time = 0.0
+        self._speed_mode = 0
+        # Inimigo morto não age mais: suas ações pendentes saem da linha do tempo
+        battle_manager.battle_log.subscribe(DamageDealt, self._on_damage_dealt)
 
     def reset_player_turn(self):
         """Prepara o turno do jogador."""
         self.battle_manager.game.player.reset_energy()
         self.battle_manager.game.player.reset_selection()
-        self.battle_manager.hand_renderer.set_alignment("center", 
+        self.battle_manager.hand_renderer.set_alignment("center",
             self.battle_manager.game.screen_height - 150)
 
     def end_player_turn(self):
         """Finaliza o turno do jogador."""
         if self.battle_manager.state == BattleState.PLAYER_TURN:
+            self.battle_manager.end_turn("player")
             self.battle_manager.state = BattleState.ENEMY_TURN
             self.enemy_turn_started = False
 
@@ -25,28 +40,39 @@ class TurnManager:
         """Inicia o turno dos inimigos."""
         if self.enemy_turn_started:
             return
-            
-        self.enemy_turn_started = True
-        self.battle_manager.status_manager.apply_status_effects()
-        self.battle_manager.game.player.tick_status()
 
-        if self.battle_manager.check_battle_end_conditions():
-            return
+        self.enemy_turn_started = True
 
-        # Coleta ações dos inimigos
-        self.enemy_actions_queue = [
-            (enemy, enemy.attack_value)
-            for enemy in self.battle_manager.enemies 
-            if enemy.health > 0 and enemy.choose_action() == "attack"
+        # Agenda as ações dos inimigos: os mais rápidos agem antes e gastam
+        # menos tempo na linha do tempo.
+        attackers = [
+            enemy for enemy in self.battle_manager.enemies
+            if enemy.health > 0 and enemy.choose_action() in ("attack", "power_attack")
         ]
+        attackers.sort(key=self.combatant_speed, reverse=True)
 
-        if not self.enemy_actions_queue:
-            self.end_enemy_turn()
-        else:
-            self.enemy_attack_timer = self.enemy_attack_interval
+        delay = 0.0
+        for enemy in attackers:
+            delay += self.enemy_attack_interval / self.combatant_speed(enemy)
+            self.scheduler.schedule(delay, self._enemy_attack, enemy, PRIORITY_ATTACK)
+
+        self._turn_end_time = self.scheduler.now + delay
+        self.scheduler.schedule_at(self._turn_end_time, self._finish_enemy_turn,
+                                   priority=PRIORITY_TURN_END)
+
+        # Um único tick de status por turno (veneno, regeneração...), para o
+        # jogador e cada inimigo vivo, no fim do turno inimigo
+        for combatant in (self.battle_manager.game.player,
+                          *(enemy for enemy in self.battle_manager.enemies if enemy.health > 0)):
+            self.schedule_end_of_turn(self._tick_status, combatant)
+
+    def schedule_end_of_turn(self, action, actor=None):
+        """Agenda um efeito para o fim do turno inimigo atual (ex.: veneno)."""
+        self.scheduler.schedule_at(self._turn_end_time, action, actor, PRIORITY_END_OF_TURN)
 
     def end_enemy_turn(self):
         """Finaliza o turno dos inimigos."""
+        self.battle_manager.end_turn("enemy")
         self.battle_manager.state = BattleState.PLAYER_TURN
         self.reset_player_turn()
         self.enemy_turn_started = False
@@ -56,25 +82,60 @@ class TurnManager:
         if self.battle_manager.state == BattleState.ENEMY_TURN:
             if not self.enemy_turn_started:
                 self.start_enemy_turn()
-            self._process_enemy_actions(dt)
+            self.scheduler.update(dt)
+
+    # -------------------------
+    # Velocidade
+    # -------------------------
+    def combatant_speed(self, combatant):
+        """Velocidade efetiva: atributo `speed` com os modificadores de status."""
+        speed = getattr(combatant, "speed", 1.0)
+        modifiers = getattr(combatant, "status_modifiers", None)
+        if modifiers is not None:
+            speed *= modifiers.speed_mult
+        return max(0.1, speed)
 
-    def _process_enemy_actions(self, dt):
-        """Processa as ações dos inimigos."""
-        if not self.enemy_actions_queue:
+    def cycle_speed_mode(self):
+        """Alterna entre velocidade normal, acelerada e resolução instantânea."""
+        self._speed_mode = (self._speed_mode + 1) % len(SPEED_MODES)
+        self.set_speed_mode(SPEED_MODES[self._speed_mode])
+
+    def set_speed_mode(self, time_scale):
+        """`time_scale` None resolve o turno inimigo instantaneamente."""
+        self.scheduler.instant = time_scale is None
+        self.scheduler.time_scale = time_scale or 1.0
+
+    @property
+    def speed_label(self):
+        time_scale = SPEED_MODES[self._speed_mode]
+        return "Instantâneo" if time_scale is None else f"x{time_scale:g}"
+
+    # -------------------------
+    # Ações agendadas
+    # -------------------------
+    def _enemy_attack(self, enemy):
+        """Ataque de um inimigo, executado pela linha do tempo."""
+        if enemy.health <= 0 or self.battle_manager.state != BattleState.ENEMY_TURN:
+            return
+
+        final_damage = self.battle_manager.status_manager.calculate_enemy_damage(enemy.attack_value, enemy)
+        self.battle_manager.deal_damage(self.battle_manager.game.player, final_damage, source=enemy)
+
+        if self.battle_manager.check_battle_end_conditions():
+            self.scheduler.clear()
+
+    def _tick_status(self, combatant):
+        if combatant.health <= 0 or self.battle_manager.state != BattleState.ENEMY_TURN:
             return
+        self.battle_manager.status_manager.apply_status_effects([combatant])
+        if self.battle_manager.check_battle_end_conditions():
+            self.scheduler.clear()
 
-        self.enemy_attack_timer -= dt
-        if self.enemy_attack_timer <= 0:
-            enemy, base_damage = self.enemy_actions_queue.pop(0)
-            
-            final_damage = self.battle_manager.status_manager.calculate_enemy_damage(base_damage, enemy)
-            self.battle_manager.game.player.take_damage(final_damage)
-            self.battle_manager.animation_manager.spawn_damage_animation(
-                self.battle_manager.game.player, final_damage, is_player=True)
-
-            if self.battle_manager.check_battle_end_conditions():
-                return
-
-            self.enemy_attack_timer = self.enemy_attack_interval if self.enemy_actions_queue else 0
-            if not self.enemy_actions_queue:
-                self.end_enemy_turn()
\ No newline at end of file
+    def _on_damage_dealt(self, event):
+        target = event.target
+        if target in self.battle_manager.enemies and target.health <= 0:
+            self.scheduler.cancel_actor(target)
+
+    def _finish_enemy_turn(self, _actor):
+        if self.battle_manager.state == BattleState.ENEMY_TURN:
+            self.end_enemy_turn()
@@ -1,5 +1,5 @@
 import pygame
-from config import WHITE, FONT
+from config import WHITE, get_font
 
 def draw_player_status(surface, player, x, y):
     """
@@ -10,8 +10,10 @@ def draw_player_status(surface, player, x, y):
     - Ícones de efeitos ativos (status_effects)
     - Define player.rect para permitir clique no jogador
     """
+    font = get_font()
+
     # Nome
-    name_text = FONT.render(player.name, True, WHITE)
+    name_text = font.render(player.name, True, WHITE)
     surface.blit(name_text, (x, y))
 
     # ------------------- VIDA -------------------
@@ -40,8 +42,8 @@ def draw_player_status(surface, player, x, y):
     else:
         text_str = f"{player.health}/{player.max_health}"
 
-    life_text = FONT.render(text_str, True, WHITE)
-    shadow = FONT.render(text_str, True, (0, 0, 0))
+    life_text = font.render(text_str, True, WHITE)
+    shadow = font.render(text_str, True, (0, 0, 0))
     shadow_rect = shadow.get_rect(center=(x + bar_width // 2 + 1, y + 30 + bar_height // 2 + 1))
     surface.blit(shadow, shadow_rect)
     life_rect = life_text.get_rect(center=(x + bar_width // 2, y + 30 + bar_height // 2))
@@ -54,8 +56,8 @@ def draw_player_status(surface, player, x, y):
     pygame.draw.rect(surface, (0, 200, 255), (x, y + 55, int(bar_width * energy_ratio), bar_height), border_radius=4)
     pygame.draw.rect(surface, WHITE, (x, y + 55, bar_width, bar_height), 2, border_radius=4)
 
-    energy_text = FONT.render(f"{player.energy}/{player.max_energy}", True, WHITE)
-    shadow = FONT.render(f"{player.energy}/{player.max_energy}", True, (0, 0, 0))
+    energy_text = font.render(f"{player.energy}/{player.max_energy}", True, WHITE)
+    shadow = font.render(f"{player.energy}/{player.max_energy}", True, (0, 0, 0))
     shadow_rect = shadow.get_rect(center=(x + bar_width // 2 + 1, y + 55 + bar_height // 2 + 1))
     surface.blit(shadow, shadow_rect)
     energy_rect = energy_text.get_rect(center=(x + bar_width // 2, y + 55 + bar_height // 2))
@@ -75,7 +77,7 @@ def draw_player_status(surface, player, x, y):
             pygame.draw.rect(surface, WHITE, (offset_x, offset_y + i * (icon_size + spacing), icon_size, icon_size), 2, border_radius=3)
 
             duration = str(data.get("duration", 0))
-            duration_text = FONT.render(duration, True, WHITE)
+            duration_text = font.render(duration, True, WHITE)
             duration_rect = duration_text.get_rect(center=(offset_x + icon_size // 2, offset_y + i * (icon_size + spacing) + icon_size // 2))
             surface.blit(duration_text, duration_rect)
 
@@ -0,0 +1,112 @@
+"""
+Núcleo do benchmark: medição com aquecimento, percentis e comparação
+com uma linha de base salva em JSON.
+"""
+import json
+import os
+import platform
+import time
+from typing import NamedTuple
+
+
+class Result(NamedTuple):
+    name: str
+    iterations: int
+    median_us: float
+    p95_us: float
+    p99_us: float
+    mean_us: float
+
+
+def percentile(sorted_samples, fraction):
+    """Percentil por posição mais próxima (amostras já ordenadas)."""
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def measure(name, func, warmup=20, iterations=200, min_time=0.25, max_time=3.0):
+    """
+    Executa `func` `warmup` vezes sem medir e depois cronometra cada chamada:
+    pelo menos `iterations` vezes (ou até somar `min_time` segundos), sem
+    passar de `max_time` segundos em casos lentos.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    clock = time.perf_counter_ns
+    started_at = time.perf_counter()
+    while True:
+        started = clock()
+        func()
+        samples.append((clock() - started) / 1000)
+        elapsed = time.perf_counter() - started_at
+        if len(samples) >= iterations and elapsed >= min_time:
+            break
+        if elapsed >= max_time and len(samples) >= 5:
+            break
+
+    samples.sort()
+    return Result(name, len(samples), percentile(samples, 0.50), percentile(samples, 0.95),
+                  percentile(samples, 0.99), sum(samples) / len(samples))
+
+
+# -----------------------------
+# Linha de base
+# -----------------------------
+def save_baseline(path, results):
+    import pygame
+
+    data = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.platform(),
+        },
+        "results": {result.name: result._asdict() for result in results},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold):
+    """
+    Linhas (resultado, mediana da base, variação) e a lista de regressões:
+    casos cuja mediana piorou mais que `threshold` (0.10 = 10%).
+    """
+    rows = []
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            rows.append((result, None, None))
+            continue
+        change = result.median_us / base["median_us"] - 1 if base["median_us"] else 0.0
+        rows.append((result, base["median_us"], change))
+        if change > threshold:
+            regressions.append(result.name)
+    return rows, regressions
+
+
+def format_table(rows, threshold):
+    lines = [f"{'caso':<38} {'n':>6} {'mediana':>10} {'p95':>10} {'p99':>10} {'base':>10} {'var.':>8}"]
+    for result, base, change in rows:
+        base_text = f"{base:10.1f}" if base is not None else f"{'-':>10}"
+        if change is None:
+            change_text = f"{'-':>8}"
+        else:
+            flag = " !" if change > threshold else ""
+            change_text = f"{change * 100:+7.1f}%{flag}"
+        lines.append(f"{result.name:<38} {result.iterations:>6} {result.median_us:10.1f} "
+                     f"{result.p95_us:10.1f} {result.p99_us:10.1f} {base_text} {change_text}")
+    lines.append("(tempos em µs por chamada)")
+    return "\n".join(lines)
@@ -0,0 +1,88 @@
+"""
+Perfil do tempo de import dos módulos do jogo (`python -X importtime`).
+
+Cada alvo é importado num processo Python novo, então o tempo medido é o
+de uma partida a frio. Mostra os imports mais caros (tempo acumulado) e
+se o pygame, o SDL ou o NumPy foram carregados no caminho:
+
+    python benchmarks/import_time.py                  # lógica pura + jogo completo
+    python benchmarks/import_time.py game -n 30       # só `game`, 30 linhas
+    python benchmarks/import_time.py --pure-only      # falha se a lógica puxar o pygame
+
+A lógica de cartas e batalha (PURE_MODULES) não deve importar o pygame:
+com `--pure-only` o script sai com código 1 se isso acontecer.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PURE_MODULES = (
+    "characters.cards", "characters.card_library", "characters.card_zones",
+    "characters.player", "batalha.status_engine", "batalha.status_manager",
+    "batalha.turn_manager", "batalha.action_scheduler", "batalha.battle_events",
+    "rng", "save_game",
+)
+HEAVY_MODULES = ("pygame", "numpy")
+
+
+def profile_import(modules):
+    """(linhas [(próprio µs, acumulado µs, módulo)], módulos pesados carregados)."""
+    code = (f"import {', '.join(modules)}; import sys; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True,
+                            env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(own), int(cumulative), name.rstrip()))
+    heavy = [name for name in result.stdout.strip().split(",") if name]
+    return rows, heavy
+
+
+def format_report(title, modules, rows, heavy, limit):
+    # Total: linhas de primeiro nível dos alvos (os imports aninhados já estão nelas;
+    # a inicialização do interpretador, como `site`, fica de fora)
+    total = sum(cumulative for _, cumulative, name in rows
+                if not name.startswith("  ") and name.strip() in modules)
+    lines = [f"{title}: {total / 1000:.1f} ms, pesados: {', '.join(heavy) or 'nenhum'}",
+             f"{'próprio':>10} {'acumulado':>10}  módulo"]
+    for own, cumulative, name in sorted(rows, key=lambda row: -row[1])[:limit]:
+        lines.append(f"{own / 1000:8.1f}ms {cumulative / 1000:8.1f}ms  {name}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfil do tempo de import do jogo.")
+    parser.add_argument("modules", nargs="*", help="módulos a importar (padrão: lógica pura e `game`)")
+    parser.add_argument("-n", "--limit", type=int, default=15, help="linhas por relatório")
+    parser.add_argument("--pure-only", action="store_true", help="só a lógica pura; falha se puxar o pygame")
+    args = parser.parse_args(argv)
+
+    targets = [("lógica pura", PURE_MODULES)]
+    if args.modules:
+        targets = [(" ".join(args.modules), args.modules)]
+    elif not args.pure_only:
+        targets.append(("game", ("game",)))
+
+    status = 0
+    for title, modules in targets:
+        rows, heavy = profile_import(modules)
+        print(format_report(title, modules, rows, heavy, args.limit))
+        print()
+        if modules is PURE_MODULES and "pygame" in heavy:
+            print("A lógica pura importou o pygame.")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Benchmarks dos caminhos quentes de renderização e batalha.
+
+Roda com o driver de vídeo "dummy" do SDL (sem janela), a partir da raiz
+do projeto ou de qualquer lugar:
+
+    python benchmarks/run_benchmarks.py                 # mede e compara com a base
+    python benchmarks/run_benchmarks.py --save          # grava a nova linha de base
+    python benchmarks/run_benchmarks.py -k hand -k map  # só casos com esses trechos no nome
+
+Sai com código 1 quando algum caso fica mais lento que a base além do
+limite (`--threshold`, padrão 10% na mediana).
+"""
+import argparse
+import copy
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("JOGO_SEED", "1234")   # mesmas cartas e rolagens em toda execução
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)   # assets usam caminhos relativos à raiz
+
+import pygame  # noqa: E402
+
+from harness import measure, save_baseline, load_baseline, compare, format_table  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "baseline.json")
+SCREEN_SIZE = (800, 600)
+MAP_SIZES = ((30, 20), (100, 100), (250, 250))
+HAND_SIZES = (5, 20, 50)
+ENEMIES = [
+    {"name": "Goblin", "health": 30, "attack": 1, "image": "goblin.png"},
+    {"name": "Orc", "health": 50, "attack": 1, "image": "orc.png"},
+    {"name": "Slime", "health": 40, "attack": 1, "image": "slime.png"},
+]
+
+
+# -----------------------------
+# Preparação dos casos
+# -----------------------------
+def _resized_map(base, width, height):
+    """Cópia do mapa com as camadas repetidas até `width` x `height` tiles."""
+    tiled = copy.copy(base)
+    tiled.width, tiled.height = width, height
+    tiled.layers = []
+    for layer in base.layers:
+        source, source_width, source_height = layer["data"], layer["width"], layer["height"]
+        data = [source[(row % source_height) * source_width + col % source_width]
+                for row in range(height) for col in range(width)]
+        tiled.layers.append(dict(layer, width=width, height=height, data=data))
+    return tiled
+
+
+def map_cases(screen):
+    from jogo_principal.camera import Camera
+    from jogo_principal.tileset import TiledMap
+
+    base = TiledMap("assets/mapa.tmj")
+    for width, height in MAP_SIZES:
+        tiled = base if (width, height) == (base.width, base.height) else _resized_map(base, width, height)
+        map_width, map_height = width * tiled.tilewidth, height * tiled.tileheight
+        positions = {"topo": (0, 0), "centro": (map_width // 2, map_height // 2),
+                     "canto": (map_width, map_height)}
+        for label, position in positions.items():
+            camera = Camera(*SCREEN_SIZE, map_width, map_height)
+            camera.update(position)
+            yield f"map.draw {width}x{height} {label}", (lambda m=tiled, c=camera: m.draw(screen, c))
+
+
+def _battle(game):
+    from states.batalha import Batalha
+
+    return Batalha(game, ENEMIES).battle_manager
+
+
+def card_cases(screen, game):
+    from characters.card_library import generate_deck
+    from characters.card_zones import HAND
+    from characters.hand_renderer import HandRenderer, draw_card
+    from characters.player import Player
+
+    card = generate_deck(1)[0]
+    yield "draw_card", lambda: draw_card(screen, card, 100, 100, width=90, height=124)
+
+    for size in HAND_SIZES:
+        player = Player()
+        player.zones.reset(generate_deck(size), HAND)
+        renderer = HandRenderer(player, *SCREEN_SIZE)
+        for _ in range(200):
+            renderer.update(16)   # cartas já assentadas no leque
+        yield f"hand.draw_hand {size} cartas", (lambda r=renderer: r.draw_hand(screen, draw_card))
+
+
+def battle_cases(screen, game):
+    from batalha.ui import draw_player_status
+
+    player = game.player
+    yield "draw_player_status", lambda: draw_player_status(screen, player, 50, 340)
+
+    bm = _battle(game)
+    yield "render_manager.draw", lambda: bm.render_manager.draw(screen)
+    yield "battle_manager.update", lambda: bm.update(16)
+
+    # Pipeline completo de dano: cálculo com modificadores -> evento -> aplicação
+    # (escudo, vida, feedback) -> tick de status de todos os combatentes.
+    bm = _battle(game)
+    status = bm.status_manager
+    enemies = list(bm.enemies)
+    attack = next((card for card in player.zones.cards if card.value > 0), player.zones.cards[0])
+    for entity in (player, *enemies):
+        entity.max_health = entity.health = 10 ** 9
+    long = 10 ** 9
+    player.add_status("regeneração", heal=1, duration=long)
+    player.add_status("força", power=2, duration=long)
+    for enemy in enemies:
+        enemy.add_status("veneno", damage=1, duration=long)
+        enemy.add_status("vulnerabilidade", duration=long)
+
+    def damage_pipeline():
+        for enemy in enemies:
+            bm.deal_damage(enemy, status.calculate_player_damage(attack.value, attack, enemy), source=player)
+        status.apply_status_effects([player, *enemies])
+
+    yield "status.damage_pipeline", damage_pipeline
+
+
+# -----------------------------
+# Execução
+# -----------------------------
+def collect_cases(screen, game):
+    yield from map_cases(screen)
+    yield from card_cases(screen, game)
+    yield from battle_cases(screen, game)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="filters", action="append", default=[],
+                        help="roda só casos cujo nome contém o trecho (pode repetir)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="arquivo JSON da linha de base")
+    parser.add_argument("--save", action="store_true", help="grava os resultados como nova linha de base")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="piora máxima aceita na mediana (0.10 = 10%%)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    from game import Game
+
+    game = Game()
+    screen = game.SCREEN
+
+    results = []
+    for name, func in collect_cases(screen, game):
+        if args.filters and not any(f in name for f in args.filters):
+            continue
+        results.append(measure(name, func, warmup=args.warmup, iterations=args.iterations))
+        print(f"  {name}: {results[-1].median_us:.1f} µs", file=sys.stderr)
+
+    baseline = {}
+    if not args.save and os.path.exists(args.baseline):
+        baseline = load_baseline(args.baseline)
+    rows, regressions = compare(results, baseline, args.threshold)
+    print(format_table(rows, args.threshold))
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Linha de base gravada em {args.baseline}")
+    elif regressions:
+        print(f"\nRegressões acima de {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Biblioteca de cartas definida em dados (assets/cards.json).
+
+O arquivo é validado uma única vez e compilado em tabelas indexadas (por
+tipo, elemento, custo e raridade) e em pesos acumulados, para sorteios
+ponderados por busca binária. A forma compilada fica em `.cache/` e é
+reaproveitada enquanto o arquivo-fonte não mudar (mesmo tamanho e mtime,
+ou o mesmo hash quando vem do pacote de assets).
+"""
+import json
+import os
+import pickle
+from bisect import bisect_right
+from itertools import accumulate
+
+from asset_bundle import read_asset, asset_stamp
+from config import ELEMENTS
+from characters.cards import (CardInstance, CardType, define_card,
+                              DEFAULT_MAX_USES, DEFAULT_ENERGY_COST, DEFAULT_RARITY)
+from batalha.status_engine import get_definition as get_status_definition
+from log import get_logger
+import rng as game_rng
+
+log = get_logger("cartas")
+
+CARDS_PATH = os.path.join("assets", "cards.json")
+CACHE_DIR = ".cache"
+COMPILED_FORMAT = 1   # aumente quando a estrutura compilada mudar
+
+CARD_FIELDS = {"id", "type", "value", "element", "rarity", "weight",
+               "max_uses", "energy_cost", "status_effect", "status_kwargs"}
+INDEXED_FIELDS = ("type", "element", "cost", "rarity")
+
+
+# -----------------------------
+# Validação e compilação
+# -----------------------------
+def _validate_card(raw, rarities, seen):
+    """Lista de erros de uma entrada do arquivo (vazia se estiver válida)."""
+    if not isinstance(raw, dict):
+        return [f"entrada inválida: {raw!r}"]
+    card_id = raw.get("id")
+    errors = []
+    if not isinstance(card_id, str) or not card_id:
+        return [f"carta sem id: {raw!r}"]
+    if card_id in seen:
+        errors.append(f"{card_id}: id repetido")
+    unknown = set(raw) - CARD_FIELDS
+    if unknown:
+        errors.append(f"{card_id}: campos desconhecidos {sorted(unknown)}")
+    if raw.get("type") not in {card_type.value for card_type in CardType}:
+        errors.append(f"{card_id}: tipo inválido {raw.get('type')!r}")
+    if raw.get("element") not in ELEMENTS:
+        errors.append(f"{card_id}: elemento inválido {raw.get('element')!r}")
+    if not isinstance(raw.get("value"), int):
+        errors.append(f"{card_id}: valor precisa ser inteiro")
+    for field, minimum in (("max_uses", 1), ("energy_cost", 0)):
+        if field in raw and (not isinstance(raw[field], int) or raw[field] < minimum):
+            errors.append(f"{card_id}: {field} precisa ser inteiro >= {minimum}")
+    rarity = raw.get("rarity", DEFAULT_RARITY)
+    if rarity not in rarities:
+        errors.append(f"{card_id}: raridade desconhecida {rarity!r}")
+    weight = raw.get("weight", rarities.get(rarity, 1))
+    if not isinstance(weight, (int, float)) or weight <= 0:
+        errors.append(f"{card_id}: peso precisa ser positivo")
+    status = raw.get("status_effect")
+    if status is not None and get_status_definition(status) is None:
+        errors.append(f"{card_id}: status desconhecido {status!r}")
+    if not isinstance(raw.get("status_kwargs", {}), dict):
+        errors.append(f"{card_id}: status_kwargs precisa ser um objeto")
+    return errors
+
+
+def compile_library(data):
+    """Valida os dados do arquivo e produz a forma compilada (só tipos simples, serializável)."""
+    rarities = data.get("rarities") or {DEFAULT_RARITY: 1}
+    errors = []
+    seen = set()
+    rows = []
+    for raw in data.get("cards", ()):
+        card_errors = _validate_card(raw, rarities, seen)
+        errors.extend(card_errors)
+        if card_errors:
+            continue
+        seen.add(raw["id"])
+        rarity = raw.get("rarity", DEFAULT_RARITY)
+        rows.append((
+            raw["id"], raw["type"], raw["value"], raw["element"],
+            raw.get("max_uses", DEFAULT_MAX_USES),
+            raw.get("energy_cost", DEFAULT_ENERGY_COST),
+            raw.get("status_effect"), raw.get("status_kwargs") or {},
+            rarity, float(raw.get("weight", rarities[rarity])),
+        ))
+    if errors:
+        raise ValueError("Biblioteca de cartas inválida:\n  " + "\n  ".join(errors))
+
+    # Índices: valor do campo -> posições das cartas (em ordem)
+    indexes = {field: {} for field in INDEXED_FIELDS}
+    for position, row in enumerate(rows):
+        card_type, element, cost, rarity = row[1], row[3], row[5], row[8]
+        for field, key in zip(INDEXED_FIELDS, (card_type, element, cost, rarity)):
+            indexes[field].setdefault(key, []).append(position)
+
+    return {
+        "format": COMPILED_FORMAT,
+        "rows": rows,
+        "indexes": indexes,
+        "cumulative": list(accumulate(row[9] for row in rows)),
+    }
+
+
+# -----------------------------
+# Biblioteca compilada
+# -----------------------------
+class CardLibrary:
+    """Definições de cartas com tabelas de busca e sorteio ponderado."""
+
+    def __init__(self, compiled):
+        self.definitions = [
+            define_card(card_id, CardType(card_type), value, element, max_uses, energy_cost,
+                        status_effect, status_kwargs, rarity, weight)
+            for (card_id, card_type, value, element, max_uses, energy_cost,
+                 status_effect, status_kwargs, rarity, weight) in compiled["rows"]
+        ]
+        self.by_id = {definition.card_id: definition for definition in self.definitions}
+        self._indexes = compiled["indexes"]
+        # Filtro -> (posições, pesos acumulados); a biblioteca inteira já vem pronta
+        self._pools = {(): (range(len(self.definitions)), compiled["cumulative"])}
+
+    def __len__(self):
+        return len(self.definitions)
+
+    def __getitem__(self, card_id):
+        return self.by_id[card_id]
+
+    def __contains__(self, card_id):
+        return card_id in self.by_id
+
+    def find(self, card_type=None, element=None, cost=None, rarity=None):
+        """Definições que atendem a todos os filtros informados."""
+        return [self.definitions[i] for i in self._pool(card_type, element, cost, rarity)[0]]
+
+    def _pool(self, card_type=None, element=None, cost=None, rarity=None):
+        if isinstance(card_type, CardType):
+            card_type = card_type.value
+        key = tuple((field, value) for field, value in
+                    zip(INDEXED_FIELDS, (card_type, element, cost, rarity)) if value is not None)
+        pool = self._pools.get(key)
+        if pool is None:
+            # Interseção começando pela menor lista do índice
+            lists = sorted((self._indexes[field].get(value, []) for field, value in key), key=len)
+            positions = lists[0]
+            for other in lists[1:]:
+                other = set(other)
+                positions = [i for i in positions if i in other]
+            pool = self._pools[key] = (
+                positions, list(accumulate(self.definitions[i].weight for i in positions)))
+        return pool
+
+    def draw(self, rng=None, **filters):
+        """Sorteia uma definição (ponderada pelo peso), opcionalmente filtrada."""
+        rng = rng or game_rng.get_stream("loot")
+        positions, cumulative = self._pool(**filters)
+        if not positions:
+            raise LookupError(f"Nenhuma carta atende a {filters}")
+        index = bisect_right(cumulative, rng.random() * cumulative[-1])
+        return self.definitions[positions[min(index, len(positions) - 1)]]
+
+    def deck(self, size, rng=None, **filters):
+        """Novas cartas sorteadas da biblioteca."""
+        rng = rng or game_rng.get_stream("loot")
+        return [CardInstance(self.draw(rng, **filters)) for _ in range(size)]
+
+
+# -----------------------------
+# Carregamento com cache em disco
+# -----------------------------
+def _cache_path(source):
+    return os.path.join(CACHE_DIR, os.path.basename(source) + ".compiled.pickle")
+
+
+def _load_cached(source, stamp):
+    try:
+        with open(_cache_path(source), "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if cached.get("stamp") != stamp or cached.get("compiled", {}).get("format") != COMPILED_FORMAT:
+        return None
+    return cached["compiled"]
+
+
+def _store_cached(source, stamp, compiled):
+    path = _cache_path(source)
+    temp_path = path + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump({"stamp": stamp, "compiled": compiled}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as exc:
+        log.warning("Não foi possível gravar o cache da biblioteca de cartas: %s", exc)
+
+
+def load_library(source=CARDS_PATH, use_cache=True):
+    """Carrega a biblioteca de `source`, reaproveitando a forma compilada se ela estiver em dia."""
+    # Lido pela camada de assets: funciona também só com o pacote (assets.pak)
+    stamp = asset_stamp(source)
+    compiled = _load_cached(source, stamp) if use_cache else None
+    if compiled is None:
+        compiled = compile_library(json.loads(str(read_asset(source), "utf-8")))
+        log.info("Biblioteca de cartas compilada: %s cartas de %s", len(compiled["rows"]), source)
+        if use_cache:
+            _store_cached(source, stamp, compiled)
+    return CardLibrary(compiled)
+
+
+_library = None
+
+
+def get_library():
+    """Biblioteca padrão do jogo, carregada na primeira chamada."""
+    global _library
+    if _library is None:
+        _library = load_library()
+    return _library
+
+
+def generate_deck(size=10, rng=None):
+    return get_library().deck(size, rng or game_rng.get_stream("deck"))
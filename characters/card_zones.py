@@ -0,0 +1,154 @@
+"""
+Zonas de cartas (deck, mão, descarte e exaustão) baseadas em índices.
+
+Cada carta da coleção recebe um índice fixo. Dois arrays pré-alocados
+guardam, por índice, a zona em que a carta está e sua posição dentro da
+lista daquela zona; as zonas são listas de índices. Assim, saber onde
+uma carta está é O(1) e movê-la também (troca com a última da lista),
+sem `list.remove`. A mão é a exceção: preserva a ordem em que as cartas
+foram compradas, então remover dela desloca só as cartas à direita.
+"""
+import random
+from array import array
+from collections.abc import Sequence
+
+DECK, HAND, DISCARD, EXHAUST = range(4)
+ZONE_NAMES = ("deck", "mão", "descarte", "exaustão")
+NO_ZONE = -1
+
+
+class ZoneView(Sequence):
+    """Visão somente leitura das cartas de uma zona, na ordem da zona."""
+    __slots__ = ("_zones", "_zone")
+
+    def __init__(self, zones, zone):
+        self._zones = zones
+        self._zone = zone
+
+    def __len__(self):
+        return len(self._zones.indices[self._zone])
+
+    def __getitem__(self, position):
+        cards = self._zones.cards
+        indices = self._zones.indices[self._zone]
+        if isinstance(position, slice):
+            return [cards[i] for i in indices[position]]
+        return cards[indices[position]]
+
+    def __iter__(self):
+        cards = self._zones.cards
+        return (cards[i] for i in self._zones.indices[self._zone])
+
+    def __contains__(self, card):
+        return self._zones.zone_of(card) == self._zone
+
+    def __repr__(self):
+        return f"<{ZONE_NAMES[self._zone]}: {len(self)} cartas>"
+
+
+class CardZones:
+    def __init__(self, cards=()):
+        self.reset(cards)
+
+    def reset(self, cards, zone=DECK):
+        """Recomeça com a coleção `cards`, todas na zona `zone`."""
+        self.cards = list(cards)
+        count = len(self.cards)
+        self._index_of = {id(card): i for i, card in enumerate(self.cards)}
+        self._zone = array("b", [zone]) * count
+        self._slot = array("l", range(count))
+        self.indices = [[] for _ in ZONE_NAMES]
+        self.indices[zone] = list(range(count))
+
+    def view(self, zone):
+        return ZoneView(self, zone)
+
+    # -------------------------------
+    # Consultas
+    # -------------------------------
+    def index_of(self, card):
+        return self._index_of.get(id(card))
+
+    def zone_of(self, card):
+        index = self._index_of.get(id(card))
+        return NO_ZONE if index is None else self._zone[index]
+
+    def count(self, zone):
+        return len(self.indices[zone])
+
+    # -------------------------------
+    # Movimentos
+    # -------------------------------
+    def add(self, card, zone):
+        """Inclui uma carta nova na coleção, no fim da zona."""
+        index = len(self.cards)
+        self.cards.append(card)
+        self._index_of[id(card)] = index
+        self._zone.append(zone)
+        self._slot.append(len(self.indices[zone]))
+        self.indices[zone].append(index)
+        return index
+
+    def _detach(self, index):
+        zone = self._zone[index]
+        indices = self.indices[zone]
+        slot = self._slot[index]
+        if zone == HAND:
+            # Mantém a ordem da mão: só as cartas à direita mudam de posição
+            del indices[slot]
+            for position in range(slot, len(indices)):
+                self._slot[indices[position]] = position
+        else:
+            last = indices.pop()
+            if last != index:
+                indices[slot] = last
+                self._slot[last] = slot
+
+    def _attach(self, index, zone):
+        indices = self.indices[zone]
+        self._zone[index] = zone
+        self._slot[index] = len(indices)
+        indices.append(index)
+
+    def move(self, card, zone):
+        """Move a carta para o fim (topo) de `zone`. Retorna False se ela não é da coleção."""
+        index = self._index_of.get(id(card))
+        if index is None:
+            return False
+        if self._zone[index] != zone:
+            self._detach(index)
+            self._attach(index, zone)
+        return True
+
+    def move_all(self, source, destination):
+        """Move todas as cartas de `source` para o fim de `destination`, na mesma ordem."""
+        moved = self.indices[source]
+        if not moved or source == destination:
+            return []
+        self.indices[source] = []
+        indices = self.indices[destination]
+        for index in moved:
+            self._zone[index] = destination
+            self._slot[index] = len(indices)
+            indices.append(index)
+        return [self.cards[index] for index in moved]
+
+    def pop(self, source, destination):
+        """Tira a carta do topo (fim) de `source` e a coloca em `destination`."""
+        indices = self.indices[source]
+        if not indices:
+            return None
+        index = indices.pop()
+        self._attach(index, destination)
+        return self.cards[index]
+
+    def shuffle(self, zone, rng=random):
+        """Fisher–Yates no próprio array de índices da zona."""
+        indices = self.indices[zone]
+        slots = self._slot
+        for i in range(len(indices) - 1, 0, -1):
+            j = int(rng.random() * (i + 1))
+            indices[i], indices[j] = indices[j], indices[i]
+            slots[indices[i]] = i
+        if indices:
+            slots[indices[0]] = 0
@@ -1,6 +1,12 @@
-import random
 from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
 from config import ELEMENTS
+from log import get_logger
+
+log = get_logger("cartas")
 
 
 class CardState(Enum):
@@ -18,103 +24,87 @@ class CardType(Enum):
     ESPECIAL = "Especial"
 
 
-# -----------------------------
-# Biblioteca de Cartas baseada no Player
-# -----------------------------
-CARD_LIBRARY = {
-    # ATAQUES
-    "ataque_fraco": {"type": CardType.ATAQUE, "value": 6, "element": "Fogo"},
-    "ataque_medio": {"type": CardType.ATAQUE, "value": 12, "element": "Água"},
-    "ataque_forte": {"type": CardType.ATAQUE, "value": 20, "element": "Terra"},
-
-    # DEFESAS
-    "defesa_basica": {"type": CardType.DEFESA, "value": 8, "element": "Terra"},
-    "defesa_forte": {"type": CardType.DEFESA, "value": 14, "element": "Água"},
-
-    # ESQUIVA
-    "esquiva_basica": {"type": CardType.ESQUIVA, "value": 0, "element": "Ar"},
-
-    # BUFFS
-    "buff_ataque": {
-        "type": CardType.BUFF,
-        "value": 2,
-        "element": "Fogo",
-        "status_effect": "ataque_up",
-        "status_kwargs": {"duration": 2, "power": 2},
-    },
-    "buff_defesa": {
-        "type": CardType.BUFF,
-        "value": 3,
-        "element": "Terra",
-        "status_effect": "defesa_up",
-        "status_kwargs": {"duration": 2, "power": 3},
-    },
-    "buff_regeneracao": {
-        "type": CardType.BUFF,
-        "value": 0,
-        "element": "Água",
-        "status_effect": "regeneracao",
-        "status_kwargs": {"duration": 3, "power": 2},
-    },
-
-    # DEBUFFS
-    "debuff_queimadura": {
-        "type": CardType.DEBUFF,
-        "value": 2,
-        "element": "Fogo",
-        "status_effect": "queimadura",
-        "status_kwargs": {"duration": 3, "damage": 2},
-    },
-    "debuff_lentidao": {
-        "type": CardType.DEBUFF,
-        "value": -1,
-        "element": "Terra",
-        "status_effect": "lentidao",
-        "status_kwargs": {"duration": 2, "power": -1},
-    },
-    "debuff_confusao": {
-        "type": CardType.DEBUFF,
-        "value": 0,
-        "element": "Ar",
-        "status_effect": "confusao",
-        "status_kwargs": {"duration": 2},
-    },
-
-    # ESPECIAIS
-    "especial_explosao": {"type": CardType.ESPECIAL, "value": 25, "element": "Fogo"},
-    "especial_tsunami": {"type": CardType.ESPECIAL, "value": 20, "element": "Água"},
-}
-
-
-class Card:
-    DEFAULT_MAX_USES = 5
-    DEFAULT_ENERGY_COST = 1
-
-    def __init__(self, card_type: CardType, value: int, element: str,
-                 max_uses=None, energy_cost=None, status_effect=None, status_kwargs=None):
-        if not isinstance(card_type, CardType):
-            raise ValueError(f"Tipo de carta inválido: {card_type}")
-
-        if element not in ELEMENTS:
-            raise ValueError(f"Elemento inválido: {element}")
-
-        self.card_type = card_type
-        self.value = value
-        self.element = element
-        self.status_effect = status_effect
-        self.status_kwargs = status_kwargs or {}
-
+DEFAULT_MAX_USES = 5
+DEFAULT_ENERGY_COST = 1
+DEFAULT_RARITY = "comum"
+
+
+class CardDefinition(NamedTuple):
+    """
+    Dados imutáveis de uma carta. Cada combinação existe uma única vez
+    (ver `define_card`) e é compartilhada por todas as cópias da carta.
+    """
+    card_id: str
+    card_type: CardType
+    value: int
+    element: str
+    max_uses: int
+    energy_cost: int
+    status_effect: Optional[str]
+    status_kwargs: Mapping
+    rarity: str = DEFAULT_RARITY
+    weight: float = 1.0       # peso no sorteio de cartas
+
+
+_EMPTY_KWARGS = MappingProxyType({})
+_interned = {}
+
+
+def define_card(card_id, card_type, value, element, max_uses=None, energy_cost=None,
+                status_effect=None, status_kwargs=None, rarity=DEFAULT_RARITY, weight=1.0):
+    """Valida e devolve a definição interna (compartilhada) com estes dados."""
+    if not isinstance(card_type, CardType):
+        raise ValueError(f"Tipo de carta inválido: {card_type}")
+
+    if element not in ELEMENTS:
+        raise ValueError(f"Elemento inválido: {element}")
+
+    max_uses = max_uses or DEFAULT_MAX_USES
+    energy_cost = energy_cost if energy_cost is not None else DEFAULT_ENERGY_COST
+    kwargs_key = tuple(sorted(status_kwargs.items())) if status_kwargs else ()
+    key = (card_id, card_type, value, element, max_uses, energy_cost, status_effect, kwargs_key,
+           rarity, weight)
+
+    definition = _interned.get(key)
+    if definition is None:
+        definition = _interned[key] = CardDefinition(
+            card_id, card_type, value, element, max_uses, energy_cost, status_effect,
+            MappingProxyType(dict(status_kwargs)) if status_kwargs else _EMPTY_KWARGS,
+            rarity, weight)
+    return definition
+
+
+def _definition_property(name):
+    getter = attrgetter(f"definition.{name}")
+    return property(getter, doc=f"`{name}` da definição compartilhada.")
+
+
+class CardInstance:
+    """
+    Uma cópia de carta no deck: só o estado mutável (usos e estado) e uma
+    referência à definição. Os dados da carta são lidos da definição.
+    """
+    __slots__ = ("definition", "uses_left", "state")
+
+    card_id = _definition_property("card_id")
+    card_type = _definition_property("card_type")
+    value = _definition_property("value")
+    element = _definition_property("element")
+    max_uses = _definition_property("max_uses")
+    energy_cost = _definition_property("energy_cost")
+    status_effect = _definition_property("status_effect")
+    status_kwargs = _definition_property("status_kwargs")
+
+    def __init__(self, definition: CardDefinition):
+        self.definition = definition
         self.state = CardState.IDLE
-        self.max_uses = max_uses or self.DEFAULT_MAX_USES
-        self.uses_left = self.max_uses
-        self.energy_cost = energy_cost if energy_cost is not None else self.DEFAULT_ENERGY_COST
+        self.uses_left = definition.max_uses
 
     def __str__(self):
         return f"[{self.card_type.value}] {self.element} {self.value} | Usos {self.uses_left}/{self.max_uses} | Energia {self.energy_cost}"
 
     def clone(self, keep_state=False):
-        new_card = Card(self.card_type, self.value, self.element,
-                        self.max_uses, self.energy_cost, self.status_effect, self.status_kwargs)
+        new_card = CardInstance(self.definition)
         if keep_state:
             new_card.uses_left = self.uses_left
             new_card.state = self.state
@@ -170,51 +160,33 @@ class Card:
     def _apply_attack(self, user, target):
         if target and hasattr(target, "take_damage"):
             target.take_damage(self.value)
-            print(f"{user.name} atacou {target.name} causando {self.value} de dano!")
+            log.debug("%s atacou %s causando %s de dano!", user.name, target.name, self.value)
 
     def _apply_defense(self, user):
         if hasattr(user, "add_shield"):
             user.add_shield(self.value)
-            print(f"{user.name} ganhou {self.value} de escudo!")
+            log.debug("%s ganhou %s de escudo!", user.name, self.value)
 
     def _apply_dodge(self, user):
         if hasattr(user, "add_status"):
             user.add_status("esquiva", duration=1)
-            print(f"{user.name} se preparou para esquivar!")
+            log.debug("%s se preparou para esquivar!", user.name)
 
     def _apply_buff(self, user):
         if hasattr(user, "add_status"):
             status_name = self.status_effect if self.status_effect else "buff"
             user.add_status(status_name, power=self.value, **self.status_kwargs)
-            print(f"{user.name} recebeu buff: {status_name}!")
+            log.debug("%s recebeu buff: %s!", user.name, status_name)
 
     def _apply_debuff(self, target):
         if hasattr(target, "add_status"):
             status_name = self.status_effect if self.status_effect else "debuff"
             target.add_status(status_name, power=self.value, **self.status_kwargs)
-            print(f"{target.name} recebeu debuff: {status_name}!")
+            log.debug("%s recebeu debuff: %s!", target.name, status_name)
 
     def _apply_special(self, user, target):
         if target and hasattr(target, "take_damage"):
             target.take_damage(self.value)
             if hasattr(user, "heal"):
                 user.heal(self.value // 2)
-            print(f"{user.name} usou especial causando {self.value} de dano!")
-
-
-def generate_deck(size=10):
-    deck = []
-    card_ids = list(CARD_LIBRARY.keys())
-    for _ in range(size):
-        card_id = random.choice(card_ids)
-        data = CARD_LIBRARY[card_id]
-        deck.append(Card(
-            card_type=data["type"],
-            value=data["value"],
-            element=data["element"],
-            max_uses=data.get("max_uses"),
-            energy_cost=data.get("energy_cost"),
-            status_effect=data.get("status_effect"),
-            status_kwargs=data.get("status_kwargs"),
-        ))
-    return deck
+            log.debug("%s usou especial causando %s de dano!", user.name, self.value)
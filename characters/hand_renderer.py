@@ -1,21 +1,42 @@
+from bisect import bisect_right
+
 import pygame
 from config import CARD_COLORS, TEXT_COLOR, ELEMENT_COLORS, GOLD, BLACK, WHITE, get_element_icons
+from batalha.hit_test import HitTestMap, Z_CARD
 
 class HandRenderer:
-    """Renderiza a mão de um jogador com hover e escala animada."""
+    """
+    Renderiza a mão de um jogador em leque, com hover e escala animada.
+
+    As posições calculadas em `update_card_positions` são só alvos: cada
+    carta guarda sua posição e escala atuais e desliza até o alvo em
+    `update(dt)`, então comprar ou jogar cartas não faz a mão "pular".
+    A mão inteira é um único item no mapa de cliques; a carta sob o mouse
+    é achada por busca binária nas bordas esquerdas (sempre ordenadas).
+    """
 
     CARD_WIDTH = 90
     CARD_HEIGHT = 124
     HOVER_SCALE = 1.2
-    SCALE_SPEED = 0.1
+    HOVER_LIFT = 20
+    SCALE_SPEED = 0.1     # fração do caminho por frame de 16 ms
+    MOVE_SPEED = 0.2
+    ARC_HEIGHT = 30       # quanto as pontas do leque descem, com a mão cheia
+    SIDE_MARGIN = 50
 
-    def __init__(self, player, screen_width=800, hand_y=400, align="center"):
+    def __init__(self, player, screen_width=800, hand_y=400, align="center", hit_map=None):
         self.player = player
         self.screen_width = screen_width
         self.hand_y = hand_y
         self.align = align
-        self.card_positions = []
+        self.card_positions = []   # posição atual [x, y] de cada carta
         self.card_scales = []
+        self._targets = []
+        self._cards = []
+        self._lefts = []
+        # A mão fica registrada no mapa de cliques da batalha
+        self.hit_map = hit_map if hit_map is not None else HitTestMap()
+        self.hovered_index = None
         self.update_card_positions()
 
     def set_alignment(self, align, y=None):
@@ -24,50 +45,151 @@ class HandRenderer:
             self.hand_y = y
         self.update_card_positions()
 
-    def update_card_positions(self):
-        num_cards = len(self.player.hand)
-        if num_cards == 0:
-            self.card_positions = []
-            self.card_scales = []
-            return
-
-        spacing = min(self.CARD_WIDTH, self.screen_width // (num_cards + 1))
+    # -------------------------
+    # Layout
+    # -------------------------
+    def _layout(self, num_cards):
+        """Posições-alvo em arco: espaçamento encolhe (sobrepõe) conforme a mão cresce."""
+        usable = self.screen_width - 2 * self.SIDE_MARGIN
+        spread = max(1, usable - self.CARD_WIDTH)   # tela estreita: cartas empilhadas
+        if num_cards > 1:
+            spacing = min(self.CARD_WIDTH, spread / (num_cards - 1))
+        else:
+            spacing = 0
         total_width = spacing * (num_cards - 1)
 
         if self.align == "left":
-            start_x = 50
+            start_x = self.SIDE_MARGIN
         elif self.align == "right":
-            start_x = self.screen_width - total_width - 50
+            start_x = self.screen_width - total_width - self.CARD_WIDTH - self.SIDE_MARGIN
         else:
-            start_x = (self.screen_width - total_width) // 2
+            start_x = (self.screen_width - total_width - self.CARD_WIDTH) / 2
+
+        # Curvatura proporcional à largura do leque: mãos pequenas ficam quase retas
+        arc = self.ARC_HEIGHT * total_width / spread
+        middle = (num_cards - 1) / 2
+        targets = []
+        for i in range(num_cards):
+            u = (i - middle) / middle if middle else 0.0
+            targets.append((start_x + i * spacing, self.hand_y + arc * u * u))
+        return targets
+
+    def update_card_positions(self):
+        """Recalcula os alvos; cartas que já estavam na mão mantêm posição e escala atuais."""
+        hand = self.player.hand
+        previous = {id(card): (pos, scale)
+                    for card, pos, scale in zip(self._cards, self.card_positions, self.card_scales)}
+        spawn = (self.screen_width + self.CARD_WIDTH, self.hand_y)   # novas cartas chegam pela direita
+
+        self._targets = self._layout(len(hand))
+        self.card_positions = []
+        self.card_scales = []
+        for card in hand:
+            pos, scale = previous.get(id(card), (spawn, 1.0))
+            self.card_positions.append([pos[0], pos[1]])
+            self.card_scales.append(scale)
+        self._cards = list(hand)
+        self.hovered_index = None
+        self._sync_bounds()
 
-        self.card_positions = [(start_x + i * spacing, self.hand_y) for i in range(num_cards)]
-        self.card_scales = [1.0 for _ in range(num_cards)]
+    def update(self, dt=16):
+        """Desliza posições e escalas em direção aos alvos (independente do frame rate)."""
+        hand = self.player.hand
+        if len(hand) != len(self._cards) or any(a is not b for a, b in zip(self._cards, hand)):
+            self.update_card_positions()
+        frames = dt / 16
+        move = 1 - (1 - self.MOVE_SPEED) ** frames
+        grow = 1 - (1 - self.SCALE_SPEED) ** frames
+
+        hovered = self.hovered_index
+        for idx, (pos, target) in enumerate(zip(self.card_positions, self._targets)):
+            pos[0] += (target[0] - pos[0]) * move
+            pos[1] += (target[1] - pos[1]) * move
+            target_scale = self.HOVER_SCALE if idx == hovered else 1.0
+            self.card_scales[idx] += (target_scale - self.card_scales[idx]) * grow
+        self._lefts = [pos[0] for pos in self.card_positions]
+
+    # -------------------------
+    # Mapa de cliques
+    # -------------------------
+    def _sync_bounds(self):
+        """
+        Atualiza as bordas para a busca binária e registra a área da mão no
+        mapa de cliques. A área vem do layout final (alvos), então só muda
+        quando a mão muda, não a cada frame enquanto as cartas deslizam.
+        """
+        self._lefts = [pos[0] for pos in self.card_positions]
+        if not self._targets:
+            self.hit_map.unregister("hand")
+            return
+        left = self._targets[0][0]
+        right = self._targets[-1][0] + self.CARD_WIDTH
+        top = min(y for _, y in self._targets)
+        bottom = max(y for _, y in self._targets) + self.CARD_HEIGHT
+        bounds = pygame.Rect(int(left), int(top), int(right - left), int(bottom - top) + 1)
+        # Folga para a carta em hover, que cresce e sobe
+        grow_x = int(self.CARD_WIDTH * (self.HOVER_SCALE - 1))
+        grow_y = int(self.CARD_HEIGHT * (self.HOVER_SCALE - 1)) + 2 * self.HOVER_LIFT
+        self.hit_map.register("hand", bounds.inflate(grow_x, grow_y), Z_CARD, "card",
+                              resolve=self._card_index_at)
+
+    def _hover_rect(self, idx):
+        """Retângulo visível da carta em hover (ampliada e levantada)."""
+        x, y = self.card_positions[idx]
+        width = int(self.CARD_WIDTH * self.HOVER_SCALE)
+        height = int(self.CARD_HEIGHT * self.HOVER_SCALE)
+        rect = pygame.Rect(0, 0, width, height)
+        rect.center = (x + self.CARD_WIDTH // 2, y + self.CARD_HEIGHT // 2 - self.HOVER_LIFT)
+        return rect
+
+    def _card_index_at(self, pos):
+        """Carta no topo em `pos`: a em hover primeiro, depois a mais à direita que cobre x."""
+        x, y = pos
+        hovered = self.hovered_index
+        if hovered is not None and hovered < len(self.card_positions) \
+                and self._hover_rect(hovered).collidepoint(pos):
+            return hovered
+
+        # Só as cartas cuja faixa horizontal contém x, da direita (topo) para a esquerda
+        lefts = self._lefts
+        idx = bisect_right(lefts, x) - 1
+        while idx >= 0 and x < lefts[idx] + self.CARD_WIDTH:
+            card_y = self.card_positions[idx][1]
+            if card_y <= y < card_y + self.CARD_HEIGHT:
+                return idx
+            idx -= 1
+        return None
+
+    def card_at(self, pos):
+        """Índice da carta visível no topo em `pos`, ou None."""
+        hit = self.hit_map.query(pos, kind="card")
+        return hit[1] if hit is not None else None
 
     def draw_hand(self, screen, draw_card_func):
-        """Desenha todas as cartas da mão."""
-        mouse_pos = pygame.mouse.get_pos()
+        """Desenha todas as cartas da mão; a carta em hover é desenhada por último."""
+        self.hovered_index = self.card_at(pygame.mouse.get_pos())
 
-        for idx, card in enumerate(self.player.hand):
-            x, y = self.card_positions[idx]
-            card_rect = pygame.Rect(x, y, self.CARD_WIDTH, self.CARD_HEIGHT)
+        order = [idx for idx in range(len(self.card_positions)) if idx != self.hovered_index]
+        if self.hovered_index is not None:
+            order.append(self.hovered_index)
 
-            hovering = card_rect.collidepoint(mouse_pos)
-            target_scale = self.HOVER_SCALE if hovering else 1.0
-            self.card_scales[idx] += (target_scale - self.card_scales[idx]) * self.SCALE_SPEED
+        for idx in order:
+            card = self._cards[idx]
+            x, y = self.card_positions[idx]
+            scale = self.card_scales[idx]
 
-            scaled_width = int(self.CARD_WIDTH * self.card_scales[idx])
-            scaled_height = int(self.CARD_HEIGHT * self.card_scales[idx])
+            scaled_width = int(self.CARD_WIDTH * scale)
+            scaled_height = int(self.CARD_HEIGHT * scale)
 
             offset_x = (scaled_width - self.CARD_WIDTH) // 2
             offset_y = (scaled_height - self.CARD_HEIGHT) // 2
-            hover_offset_y = -20 if hovering else 0
+            hover_offset_y = -self.HOVER_LIFT if idx == self.hovered_index else 0
 
             draw_card_func(
                 screen,
                 card,
-                x - offset_x,
-                y - offset_y + hover_offset_y,
+                int(x) - offset_x,
+                int(y) - offset_y + hover_offset_y,
                 selected=(card.state == "selected"),
                 width=scaled_width,
                 height=scaled_height
@@ -78,6 +200,28 @@ class HandRenderer:
 # Largura da borda da carta
 CARD_BORDER_WIDTH = 3
 
+_fonts = {}
+
+
+def _card_font(size, bold=True):
+    """Fontes do desenho de cartas, criadas uma vez (SysFont é caro por chamada)."""
+    font = _fonts.get((size, bold))
+    if font is None:
+        font = _fonts[(size, bold)] = pygame.font.SysFont("arial", size, bold=bold)
+    return font
+
+def warm_card_faces(cards):
+    """
+    Desenha cada carta distinta uma vez fora da tela, para que fontes e
+    ícones usados por `draw_card` já existam quando a batalha começar.
+    """
+    scratch = pygame.Surface((HandRenderer.CARD_WIDTH, HandRenderer.CARD_HEIGHT + 20))
+    seen = set()
+    for card in cards:
+        if card.card_id not in seen:
+            seen.add(card.card_id)
+            draw_card(scratch, card, 0, 20, width=HandRenderer.CARD_WIDTH, height=HandRenderer.CARD_HEIGHT)
+
 # -----------------------------
 # Função draw_card
 # -----------------------------
@@ -102,9 +246,9 @@ def draw_card(screen, card, x, y, selected=False, width=100, height=150):
     pygame.draw.rect(screen, border_color, card_rect, CARD_BORDER_WIDTH, border_radius=10)
     
     # Fonte para textos
-    font_small = pygame.font.SysFont("arial", 12, bold=True)
-    font_medium = pygame.font.SysFont("arial", 14, bold=True)
-    font_large = pygame.font.SysFont("arial", 16, bold=True)
+    font_small = _card_font(12)
+    font_medium = _card_font(14)
+    font_large = _card_font(16)
     
     # Desenha o tipo da carta (no topo)
     type_text = font_medium.render(card.card_type.value, True, BLACK)
@@ -129,7 +273,7 @@ def draw_card(screen, card, x, y, selected=False, width=100, height=150):
     pygame.draw.circle(screen, (180, 160, 60), (energy_circle_x, energy_circle_y), energy_circle_radius, 2)
     
     # Texto do custo dentro do círculo
-    energy_font = pygame.font.SysFont("arial", 12, bold=True)
+    energy_font = _card_font(12)
     energy_text = energy_font.render(str(card.energy_cost), True, BLACK)
     screen.blit(energy_text, (energy_circle_x - energy_text.get_width()//2, 
                              energy_circle_y - energy_text.get_height()//2))
@@ -149,7 +293,7 @@ def draw_card(screen, card, x, y, selected=False, width=100, height=150):
             pygame.draw.rect(screen, (0, 200, 0), (bar_x, bar_y, filled_width, bar_height))
         
         # Texto com usos (acima da barra)
-        uses_font = pygame.font.SysFont("arial", 10)
+        uses_font = _card_font(10, bold=False)
         uses_text = uses_font.render(f"{card.uses_left}/{card.max_uses}", True, WHITE)
         text_bg = pygame.Rect(bar_x + bar_width//2 - uses_text.get_width()//2 - 2, 
                              bar_y - uses_text.get_height() - 2,
@@ -1,9 +1,10 @@
 
 class NPC:
-    def __init__(self, nome, rect, dialogo_data):
+    def __init__(self, nome, rect, dialogo_data, encontro=None):
         self.nome = nome
         self.rect = rect
         self.dialogo_data = dialogo_data  # dados do diálogo desse NPC
+        self.encontro = encontro          # inimigos da batalha que o NPC inicia, se houver
 
     def interagir(self, dialogo_manager):
         """Chama o diálogo do NPC"""
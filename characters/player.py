@@ -1,9 +1,14 @@
-import random
-from characters.cards import Card, CardState
+from characters.cards import CardInstance, CardState
+from characters.card_zones import CardZones, DECK, HAND, DISCARD, EXHAUST
 from config import PLAYER_HEALTH
+from batalha.status_engine import StatusHolder
+from log import get_logger
+import rng as game_rng
 
+log = get_logger("player")
 
-class Player:
+
+class Player(StatusHolder):
     """Representa o jogador: vida, energia, deck, mão, escudo e efeitos de batalha."""
 
     def __init__(self, name="Jogador", max_energy=3, max_health=PLAYER_HEALTH):
@@ -16,15 +21,21 @@ class Player:
 
         # Defesa e status
         self.shield = 0  # escudo que absorve dano
-        self.status_effects = {}  # Ex: {"força": {"power": 2, "duration": 3}}
+        self._init_status()  # status_effects + modificadores agregados
+
+        # Deck, mão, descarte e exaustão: zonas de uma única coleção de cartas
+        self.zones = CardZones()
+        self.deck = self.zones.view(DECK)
+        self.hand = self.zones.view(HAND)
+        self.discard_pile = self.zones.view(DISCARD)
+        self.exhaust_pile = self.zones.view(EXHAUST)
 
-        # Deck, mão e descarte
-        self.deck = []
-        self.hand = []
-        self.discard_pile = []
+        # Fluxos aleatórios próprios: embaralhar não afeta as rolagens de combate
+        self.deck_rng = game_rng.get_stream("deck")
+        self.combat_rng = game_rng.get_stream("combat")
 
-        # Cartas selecionadas
-        self.selected_cards = []
+        # Cartas selecionadas (dict ordenado: remoção O(1))
+        self.selected_cards = {}
 
     # -------------------------------
     # Vida, escudo e energia
@@ -32,30 +43,22 @@ class Player:
     def take_damage(self, amount: int):
         """Recebe dano levando em conta escudo e status."""
         # Verifica se esquiva o ataque
-        if self.has_status("esquiva"):
-            if random.random() < 0.5:  # 50% chance de esquivar
-                print(f"{self.name} esquivou do ataque!")
-                self.remove_status("esquiva")
-                return False  # Não morreu
+        dodge_chance = self.status_modifiers.dodge_chance
+        if dodge_chance and self.combat_rng.random() < dodge_chance:
+            log.debug("%s esquivou do ataque!", self.name)
+            self.remove_status("esquiva")
+            return False  # Não morreu
 
         if self.shield > 0:
             absorbed = min(amount, self.shield)
             self.shield -= absorbed
             amount -= absorbed
-            print(f"{self.name} bloqueou {absorbed} de dano com escudo!")
-
-        # Aplica vulnerabilidade
-        if self.has_status("vulnerabilidade") or self.has_status("vulneravel"):
-            multiplier = self.status_effects.get(
-                "vulnerabilidade",
-                self.status_effects.get("vulneravel", {})
-            ).get("multiplier", 1.5)
-            amount = int(amount * multiplier)
-            print(f"O dano foi aumentado para {amount} devido à vulnerabilidade!")
+            log.debug("%s bloqueou %s de dano com escudo!", self.name, absorbed)
 
+        # Vulnerabilidade já entra no cálculo de dano (StatusManager)
         if amount > 0:
             self.health = max(0, self.health - amount)
-            print(f"{self.name} recebeu {amount} de dano! Vida atual: {self.health}")
+            log.debug("%s recebeu %s de dano! Vida atual: %s", self.name, amount, self.health)
 
         return self.health <= 0  # retorna True se morreu
 
@@ -65,7 +68,7 @@ class Player:
         self.health = min(self.max_health, self.health + amount)
         healed = self.health - old_health
         if healed > 0:
-            print(f"{self.name} curou {healed} de vida.")
+            log.debug("%s curou %s de vida.", self.name, healed)
         return healed
 
     def is_alive(self):
@@ -90,87 +93,57 @@ class Player:
     # Escudo
     def add_shield(self, amount=1):
         self.shield += amount
-        print(f"{self.name} ganhou {amount} de escudo (total: {self.shield})")
-
-    # -------------------------------
-    # Status
-    # -------------------------------
-    def add_status(self, status: str, **kwargs):
-        """Adiciona ou atualiza efeitos de status (buffs/debuffs)."""
-        self.status_effects[status] = kwargs.copy()  # Usa copy para evitar referências
-        print(f"{self.name} ganhou status: {status} {kwargs}")
-
-    def has_status(self, status: str):
-        return status in self.status_effects
-
-    def remove_status(self, status: str):
-        if status in self.status_effects:
-            del self.status_effects[status]
-            print(f"{self.name} perdeu o status {status}")
-
-    def tick_status(self):
-        """Reduz duração dos status e aplica efeitos recorrentes por turno."""
-        expired = []
-        for status, data in list(self.status_effects.items()):
-            # Exemplo de status recorrentes
-            if status == "veneno":
-                dmg = data.get("power", 1)
-                self.take_damage(dmg)
-                print(f"{self.name} sofreu {dmg} de dano por veneno!")
-            if status == "regeneracao":
-                heal = data.get("power", 1)
-                self.heal(heal)
-                print(f"{self.name} regenerou {heal} de vida!")
-
-            if "duration" in data:
-                data["duration"] -= 1
-                if data["duration"] <= 0:
-                    expired.append(status)
-        for s in expired:
-            self.remove_status(s)
+        log.debug("%s ganhou %s de escudo (total: %s)", self.name, amount, self.shield)
 
     # -------------------------------
     # Deck e cartas
     # -------------------------------
     def set_deck(self, deck):
-        """Configura um novo deck embaralhado."""
-        self.deck = [card.clone() for card in deck]
-        random.shuffle(self.deck)
-        self.hand.clear()
-        self.discard_pile.clear()
+        """Configura um novo deck embaralhado (as cartas passam a ser do jogador)."""
+        for card in deck:
+            card.reset()
+        self.zones.reset(deck, DECK)
+        self.zones.shuffle(DECK, self.deck_rng)
+        self.selected_cards.clear()
 
     def draw_card(self, amount=1):
         """Compra cartas do deck, reembaralhando o descarte se necessário."""
         for _ in range(amount):
             if not self.deck:
                 self.reshuffle_discard_into_deck()
-            if self.deck:
-                self.hand.append(self.deck.pop())
+            if self.zones.pop(DECK, HAND) is None:
+                break
 
     def discard_card(self, card):
         """Descarta carta da mão para a pilha de descarte."""
-        if card in self.hand:
-            self.hand.remove(card)
         card.state = CardState.EXHAUSTED
-        self.discard_pile.append(card)
+        if not self.zones.move(card, DISCARD):
+            self.zones.add(card, DISCARD)
+
+    def exhaust_card(self, card):
+        """Remove a carta do ciclo deck/descarte até o fim da batalha."""
+        card.state = CardState.EXHAUSTED
+        if not self.zones.move(card, EXHAUST):
+            self.zones.add(card, EXHAUST)
 
     def discard_hand(self):
         """Descarta todas as cartas da mão."""
-        while self.hand:
-            self.discard_card(self.hand[0])
+        for card in self.zones.move_all(HAND, DISCARD):
+            card.state = CardState.EXHAUSTED
 
     def reshuffle_discard_into_deck(self):
         """Reembaralha o descarte de volta para o deck."""
         if not self.discard_pile:
             return
-        self.deck = [card.clone() for card in self.discard_pile]
-        random.shuffle(self.deck)
-        self.discard_pile.clear()
+        # As próprias cartas voltam ao deck, renovadas; nada é copiado
+        for card in self.zones.move_all(DISCARD, DECK):
+            card.reset()
+        self.zones.shuffle(DECK, self.deck_rng)
 
     # -------------------------------
     # Seleção e uso de cartas
     # -------------------------------
-    def can_play_card(self, card: Card):
+    def can_play_card(self, card: CardInstance):
         """Verifica se o jogador pode jogar uma carta."""
         return self.energy >= card.energy_cost and card.is_active()
 
@@ -181,7 +154,7 @@ class Player:
         if card.state == CardState.SELECTED:
             return False
         card.state = CardState.SELECTED
-        self.selected_cards.append(card)
+        self.selected_cards[card] = None
         self.lose_energy(card.energy_cost)
         return True
 
@@ -189,7 +162,7 @@ class Player:
         """Deseleciona carta e devolve energia."""
         if card in self.selected_cards:
             card.state = CardState.IDLE
-            self.selected_cards.remove(card)
+            del self.selected_cards[card]
             self.gain_energy(card.energy_cost)
             return True
         return False
@@ -227,8 +200,7 @@ class Player:
             return False
         card.use(self, target)
         self.discard_card(card)
-        if card in self.selected_cards:
-            self.selected_cards.remove(card)
+        self.selected_cards.pop(card, None)
         return True
 
     # -------------------------------
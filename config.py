@@ -1,18 +1,15 @@
 # ============================================================
 # CONFIGURAÇÕES DO JOGO - config.py
 # ============================================================
+# Só constantes: importar este módulo não importa o pygame nem abre
+# arquivos. Recursos (fontes, ícones) são criados na primeira chamada de
+# `get_font`/`get_element_icons`, então a lógica de cartas e batalha pode
+# ser importada em processos sem SDL (ferramentas, simulações).
 
-import pygame
-
-# Inicializar pygame ANTES de usar qualquer módulo
-pygame.init()
-
-# Carregando a fonte personalizada
+# Fonte personalizada
 font_path = "assets/Font.ttf"
 FONT_SIZE       = 8
 FONT_SMALL_SIZE = 12
-FONT       = pygame.font.Font(font_path, FONT_SIZE)
-FONT_SMALL = pygame.font.Font(font_path, FONT_SMALL_SIZE)
 
 # Cores por estado
 CARD_COLORS = {
@@ -76,17 +73,47 @@ CARD_VALUE_RANGES = {
 CARD_WIDTH  = 100
 CARD_HEIGHT = 150
 
+# ---------------------------
+# Recursos criados sob demanda
+# ---------------------------
+_fonts = {}
 ELEMENT_ICONS = None
 
+
+def get_font(size=FONT_SIZE):
+    """Fonte do jogo no tamanho `size`, criada (e o módulo de fontes iniciado) na primeira vez."""
+    font = _fonts.get(size)
+    if font is None:
+        import pygame
+        from assets import open_asset
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = _fonts[size] = pygame.font.Font(open_asset(font_path), size)
+    return font
+
+
+def __getattr__(name):
+    # FONT e FONT_SMALL continuam acessíveis como atributos, mas só são criadas no uso
+    if name == "FONT":
+        return get_font(FONT_SIZE)
+    if name == "FONT_SMALL":
+        return get_font(FONT_SMALL_SIZE)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_element_icons():
     """Carrega os ícones apenas quando necessário"""
     global ELEMENT_ICONS
     if ELEMENT_ICONS is None:
+        import pygame
+        from assets import load_surface
+
         ELEMENT_ICONS = {
-            "Fogo": pygame.image.load("assets/fogo.png").convert_alpha(),
-            "Água": pygame.image.load("assets/agua.png").convert_alpha(),
-            "Terra": pygame.image.load("assets/terra.png").convert_alpha(),
-            "Ar": pygame.image.load("assets/ar.png").convert_alpha()
+            "Fogo": load_surface("assets/fogo.png"),
+            "Água": load_surface("assets/agua.png"),
+            "Terra": load_surface("assets/terra.png"),
+            "Ar": load_surface("assets/ar.png")
         }
         # Redimensiona os ícones
         for element, icon in ELEMENT_ICONS.items():
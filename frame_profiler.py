@@ -0,0 +1,108 @@
+# ============================================================
+# PERFIL DE FRAMES - frame_profiler.py
+# ============================================================
+"""
+Captura com cProfile de exatamente N frames, ligada por tecla.
+
+F9 (durante o jogo) arma o profiler: os próximos N frames são medidos
+(eventos, update, draw e flip; a espera do `Clock.tick` fica de fora) e o
+resultado vai para `profiles/`:
+
+- `<data-hora>_<Estado>_<N>f.prof`: estatísticas do cProfile, para abrir
+  com `python -m pstats`, snakeviz etc.;
+- `<mesmo nome>.txt`: os estados ativos durante a captura e as funções
+  com maior tempo acumulado e próprio.
+
+Útil para um engasgo específico (o primeiro frame da Batalha, abrir um
+diálogo): aperte F9 logo antes. N vem de JOGO_PROFILE_FRAMES (padrão 60).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+from collections import Counter
+
+import pygame
+
+from log import get_logger
+
+log = get_logger("jogo")
+
+PROFILE_DIR = "profiles"
+PROFILE_KEY = pygame.K_F9
+DEFAULT_FRAMES = int(os.environ.get("JOGO_PROFILE_FRAMES", 60))
+TOP_FUNCTIONS = 25
+
+
+class FrameProfiler:
+    def __init__(self, frames=DEFAULT_FRAMES, output_dir=PROFILE_DIR, key=PROFILE_KEY):
+        self.frames = frames
+        self.output_dir = output_dir
+        self.key = key
+        self._remaining = 0
+        self._profile = None
+        self._states = Counter()   # nome do estado -> frames capturados
+        self._first_state = None
+
+    @property
+    def active(self):
+        return self._remaining > 0
+
+    def arm(self, frames=None):
+        """Captura os próximos `frames` frames (ignorado se já houver captura)."""
+        if self.active:
+            return
+        self._remaining = frames or self.frames
+        self._profile = cProfile.Profile()
+        self._states.clear()
+        self._first_state = None
+        log.info("Profiler armado para %s frames.", self._remaining)
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == self.key:
+                self.arm()
+
+    def begin_frame(self, state):
+        if not self.active:
+            return
+        name = type(state).__name__ if state is not None else "-"
+        if self._first_state is None:
+            self._first_state = name
+        self._states[name] += 1
+        self._profile.enable()
+
+    def end_frame(self):
+        if not self.active:
+            return
+        self._profile.disable()
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._save()
+
+    def _save(self):
+        profile, self._profile = self._profile, None
+        captured = sum(self._states.values())
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.output_dir, f"{stamp}_{self._first_state}_{captured}f")
+        os.makedirs(self.output_dir, exist_ok=True)
+        profile.dump_stats(base + ".prof")
+
+        summary = io.StringIO()
+        summary.write(f"Frames capturados: {captured}\n")
+        summary.write("Estados ativos: " + ", ".join(
+            f"{name} ({count} frames)" for name, count in self._states.items()) + "\n\n")
+        stats = pstats.Stats(profile, stream=summary)
+        stats.strip_dirs()
+        summary.write("== Por tempo acumulado ==\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        summary.write("== Por tempo próprio ==\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(summary.getvalue())
+
+        total_ms = stats.total_tt * 1000
+        log.info("Perfil de %s frames (%s) salvo em %s.prof: %.1f ms no total, %.2f ms/frame",
+                 captured, ", ".join(self._states), base, total_ms, total_ms / max(captured, 1))
@@ -4,13 +4,21 @@ import sys
 # Importações de classes e configurações
 from assets import Assets
 from characters.player import Player
-from characters.cards import generate_deck
+from characters.card_library import generate_deck
 from config import font_path
+import log as game_log
+import memory_tracker
+from frame_profiler import FrameProfiler
+from input_latency import InputLatency
+import save_game
+
+log = game_log.get_logger("jogo")
 
 # Importações dos estados do jogo
 from states.main_menu import MainMenu
 from states.jogo_principal import JogoPrincipal
 from states.caracteristicas import Caracteristicas
+from states.transicao import Transicao
 # A Batalha não é mais criada aqui, mas recebida como um objeto
 # from states.batalha import Batalha 
 
@@ -30,22 +38,28 @@ class Game:
 
         self.CLOCK = pygame.time.Clock()
         self.running = True
+        self.profiler = FrameProfiler()  # F9 captura os próximos frames com cProfile
+        self.latency = InputLatency()    # tempo entre entrada e o flip que a mostra
 
         self.assets = Assets()
         self.player = None
         self.state_stack = []
 
+        # Jogo salvo: gravação em segundo plano e posição a retomar no mapa
+        self.save_writer = save_game.SaveWriter()
+        self.resume_pos = None
+
         self.load_assets()
         self.create_player()
         self.load_initial_state()
 
     def load_assets(self):
         """Carrega todos os assets iniciais necessários para o jogo."""
-        print("Carregando fontes...")
+        log.info("Carregando fontes...")
         self.assets.load_font("default", font_path, 18)
         self.assets.load_font("small", font_path, 12)
         self.assets.load_font("large", font_path, 24)
-        print("Assets carregados com sucesso!")
+        log.info("Assets carregados com sucesso!")
 
     def create_player(self):
         """Cria a instância do jogador e configura seu deck inicial."""
@@ -53,12 +67,36 @@ class Game:
         deck = generate_deck()
         self.player.set_deck(deck)
         self.player.draw_card(5)
-        print("Jogador criado e deck configurado.")
+        log.info("Jogador criado e deck configurado.")
 
     def load_initial_state(self):
         """Cria e carrega o estado inicial do jogo na pilha."""
         self.push_state("MENU_PRINCIPAL")
 
+    # ------------------------------------------------------------------
+    # Jogo salvo
+    # ------------------------------------------------------------------
+    def autosave(self):
+        """Salva em segundo plano se há uma partida em andamento (mapa na pilha) e o jogador vive."""
+        if self.player is None or save_game.find_map_state(self) is None:
+            return
+        if self.player.health <= 0:
+            # Derrota: "Continuar" não pode retomar um jogador morto; fica o save anterior
+            log.debug("Autosave ignorado: jogador sem vida.")
+            return
+        self.save_writer.submit(save_game.snapshot(self))
+
+    def load_game(self, path=save_game.DEFAULT_SAVE_PATH):
+        """Restaura o jogo salvo. Retorna False se não houver save válido."""
+        try:
+            snap = save_game.load(path)
+        except (OSError, ValueError) as exc:
+            log.warning("Não foi possível carregar o save %s: %s", path, exc)
+            return False
+        save_game.apply(self, snap)
+        log.info("Jogo carregado de %s", path)
+        return True
+
     def get_active_state(self):
         """Retorna o estado que está no topo da pilha."""
         return self.state_stack[-1] if self.state_stack else None
@@ -76,36 +114,74 @@ class Game:
             if state == "MENU_PRINCIPAL":
                 new_state = MainMenu(self)
             elif state == "JOGO_PRINCIPAL":
-                new_state = JogoPrincipal(self)
+                # O mapa é preparado em segundo plano atrás de uma transição
+                new_state = Transicao(self, JogoPrincipal.loader(self))
             elif state == "CARACTERISTICAS":
                 new_state = Caracteristicas(self)
             else:
-                print(f"Erro: Tentativa de criar estado desconhecido pelo nome: '{state}'")
+                log.warning("Tentativa de criar estado desconhecido pelo nome: '%s'", state)
                 return
             self.state_stack.append(new_state)
 
         # Se 'state' já for uma instância de um estado, apenas a adiciona
         else:
             self.state_stack.append(state)
+        self.autosave()
+        memory_tracker.on_push(self.state_stack[-1])
 
     def pop_state(self):
         """Remove o estado do topo da pilha."""
+        self.autosave()  # antes de sair, enquanto o mapa ainda está na pilha
         if self.state_stack:
-            self.state_stack.pop()
+            memory_tracker.on_pop(self.state_stack.pop())
         if not self.state_stack:
             self.running = False
 
+    def replace_state(self, state):
+        """Troca o estado do topo por `state` (ex.: a transição pela cena já carregada)."""
+        if self.state_stack:
+            memory_tracker.on_pop(self.state_stack.pop())
+        self.push_state(state)
+
+    def load_scene(self, load):
+        """Mostra uma transição enquanto `load` (um SceneLoad) prepara a cena em segundo plano."""
+        self.push_state(Transicao(self, load))
+
     def change_state(self, state):
         """Muda o estado atual, limpando a pilha e adicionando um novo."""
+        self.autosave()
         while self.state_stack:
-            self.state_stack.pop()
+            memory_tracker.on_pop(self.state_stack.pop())
         self.push_state(state)
 
     def game_loop(self):
         """O loop principal do jogo."""
+        try:
+            self._run_frames()
+        except Exception:
+            # Guarda as últimas mensagens de log para investigar a queda
+            log.exception("Erro fatal no loop principal")
+            game_log.dump_ring_buffer("crash_log.txt")
+            raise
+        finally:
+            self.save_writer.close()
+            if memory_tracker.enabled:
+                log.info("Memória ao sair:\n%s", memory_tracker.report())
+            if self.latency:
+                log.info("Latência entrada->flip:\n%s", self.latency.report())
+            game_log.shutdown()
+
+        pygame.quit()
+        sys.exit()
+
+    def _run_frames(self):
+        """Executa frames até `running` ficar falso."""
         while self.running:
             events = pygame.event.get()
+            self.latency.poll(events)
+            self.profiler.handle_events(events)
             active_state = self.get_active_state()
+            self.profiler.begin_frame(active_state)
 
             if active_state:
                 active_state.handle_events(events)
@@ -115,11 +191,10 @@ class Game:
                 self.running = False
 
             pygame.display.flip()
+            self.latency.presented()
+            self.profiler.end_frame()
             self.CLOCK.tick(60)
 
-        pygame.quit()
-        sys.exit()
-
 if __name__ == "__main__":
     jogo = Game()
     jogo.game_loop()
\ No newline at end of file
@@ -0,0 +1,94 @@
+# ============================================================
+# LATÊNCIA DE ENTRADA - input_latency.py
+# ============================================================
+"""
+Mede o tempo entre a leitura de uma entrada e o `display.flip` que mostra
+o efeito dela ("input-to-photon", sem contar o atraso do monitor).
+
+- `poll(events)` marca o instante em que o loop leu os eventos do frame,
+  se houver alguma entrada (tecla ou clique).
+- Quem reage à entrada chama `mark("carta_selecionada")`, `mark("jogador_moveu")`
+  etc. A marca só vale se a mudança veio de uma entrada deste frame.
+- `presented()`, logo após o flip, fecha as marcas pendentes.
+
+Os percentis por marca vão para o log (canal "latencia") periodicamente e
+ao sair do jogo.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+from log import get_logger
+
+log = get_logger("latencia")
+
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+HISTORY = 1000           # amostras guardadas por marca
+REPORT_INTERVAL = 30.0   # segundos entre relatórios no log
+
+
+def _percentile(sorted_samples, fraction):
+    return sorted_samples[min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))]
+
+
+class InputLatency:
+    def __init__(self, history=HISTORY, report_interval=REPORT_INTERVAL):
+        self.history = history
+        self.report_interval = report_interval
+        self._samples = {}         # marca -> deque de ms
+        self._poll_time = None     # leitura das entradas deste frame
+        self._marks = []
+        self._last_report = time.perf_counter()
+        self._new_samples = False
+
+    def poll(self, events):
+        """Chamado logo depois de `pygame.event.get()`."""
+        self._poll_time = None
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                self._poll_time = time.perf_counter()
+                break
+
+    def mark(self, tag):
+        """Registra que uma entrada deste frame causou a mudança `tag`."""
+        if self._poll_time is not None and tag not in self._marks:
+            self._marks.append(tag)
+
+    def presented(self):
+        """Chamado logo depois de `pygame.display.flip()`."""
+        now = time.perf_counter()
+        if self._marks:
+            elapsed = (now - self._poll_time) * 1000
+            for tag in self._marks:
+                samples = self._samples.get(tag)
+                if samples is None:
+                    samples = self._samples[tag] = deque(maxlen=self.history)
+                samples.append(elapsed)
+            self._marks.clear()
+            self._new_samples = True
+        self._poll_time = None
+
+        if self._new_samples and now - self._last_report >= self.report_interval:
+            self._last_report = now
+            self._new_samples = False
+            log.info("Latência entrada->flip:\n%s", self.report())
+
+    def percentiles(self):
+        """{marca: (amostras, p50, p95, p99)} em ms."""
+        result = {}
+        for tag, samples in self._samples.items():
+            ordered = sorted(samples)
+            result[tag] = (len(ordered), _percentile(ordered, 0.50),
+                           _percentile(ordered, 0.95), _percentile(ordered, 0.99))
+        return result
+
+    def report(self):
+        lines = [f"{'marca':<22} {'n':>5} {'p50':>8} {'p95':>8} {'p99':>8}"]
+        for tag, (count, p50, p95, p99) in sorted(self.percentiles().items()):
+            lines.append(f"{tag:<22} {count:>5} {p50:7.1f}ms {p95:7.1f}ms {p99:7.1f}ms")
+        return "\n".join(lines)
+
+    def __bool__(self):
+        return bool(self._samples)
@@ -0,0 +1,76 @@
+# prefetch.py
+"""
+Pré-carregamento de encontros por proximidade.
+
+Quando o jogador chega a `PREFETCH_RADIUS` de um NPC com encontro (ex.: a
+Torre), os sprites dos inimigos são decodificados numa thread de fundo e,
+prontos, a batalha é "aquecida" na thread principal (`Batalha.warm`). Se o
+jogador se afasta além de `RELEASE_RADIUS`, as imagens que o
+pré-carregamento trouxe são liberadas. Só o encontro próximo é carregado,
+nunca todos de antemão.
+"""
+from assets import preload, release, is_loaded
+from scene_loader import SceneLoad
+from states.batalha import Batalha
+from log import get_logger
+
+log = get_logger("mapa")
+
+PREFETCH_RADIUS = 160   # px até a borda do NPC
+RELEASE_RADIUS = 240    # maior que o raio de entrada, para não oscilar na borda
+
+
+def distance_to_rect(pos, rect):
+    """Distância de `pos` até o ponto mais próximo de `rect` (0 dentro dele)."""
+    dx = max(rect.left - pos[0], 0, pos[0] - rect.right)
+    dy = max(rect.top - pos[1], 0, pos[1] - rect.bottom)
+    return (dx * dx + dy * dy) ** 0.5
+
+
+class EncounterPrefetcher:
+    def __init__(self, game, radius=PREFETCH_RADIUS, release_radius=RELEASE_RADIUS):
+        self.game = game
+        self.radius = radius
+        self.release_radius = release_radius
+        self._active = {}     # NPC -> (SceneLoad ou None quando já aquecido, imagens trazidas)
+
+    def update(self, player_pos, npcs):
+        for npc in npcs:
+            if npc.encontro is None:
+                continue
+            distance = distance_to_rect(player_pos, npc.rect)
+            if npc not in self._active:
+                if distance <= self.radius:
+                    self._start(npc)
+            elif distance > self.release_radius:
+                self._drop(npc)
+
+        for npc, (load, _) in self._active.items():
+            if load is not None and load.ready:
+                self._finish(npc, load)
+
+    def is_warm(self, npc):
+        entry = self._active.get(npc)
+        return entry is not None and entry[0] is None
+
+    def _start(self, npc):
+        # Só o que ainda não está carregado é liberado depois
+        images = [data["image"] for data in npc.encontro if not is_loaded(data["image"])]
+        load = SceneLoad(f"encontro {npc.nome}", lambda: preload(images),
+                         lambda _: Batalha.warm(self.game, npc.encontro)).start()
+        self._active[npc] = (load, images)
+        log.debug("Pré-carregando o encontro de %s", npc.nome)
+
+    def _finish(self, npc, load):
+        try:
+            load.finalize()
+        except Exception:
+            log.exception("Falha ao pré-carregar o encontro de %s", npc.nome)
+        self._active[npc] = (None, self._active[npc][1])
+
+    def _drop(self, npc):
+        load, images = self._active.pop(npc)
+        if load is not None:
+            load.wait()   # a decodificação é curta; evita a thread repor o que foi liberado
+        release(images)
+        log.debug("Encontro de %s liberado (%s imagens)", npc.nome, len(images))
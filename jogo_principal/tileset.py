@@ -2,21 +2,38 @@
 import pygame
 import json
 
+from collections import Counter
+
+import memory_tracker
+from assets import load_surface, read_asset, optimize_surface, preload
+from log import get_logger
+
+log = get_logger("mapa")
+
+def read_map(map_file):
+    """Lê o JSON do mapa e decodifica as imagens dos tilesets (sem depender da janela)."""
+    data = json.loads(str(read_asset(map_file), "utf-8"))
+    preload([ts["image"] for ts in data["tilesets"]])
+    return data
+
+
 class TiledMap:
-    def __init__(self, map_file):
-        with open(map_file, "r", encoding="utf-8") as f:
-            self.data = json.load(f)
+    def __init__(self, map_file, data=None):
+        # `data` vem de `read_map` quando o mapa foi preparado em segundo plano
+        self.data = data if data is not None else json.loads(str(read_asset(map_file), "utf-8"))
 
         self.tilewidth = self.data["tilewidth"]
         self.tileheight = self.data["tileheight"]
         self.width = self.data["width"]
         self.height = self.data["height"]
 
-        # Carregar todos os tilesets
+        # Carregar todos os tilesets. Cada tile vira uma superfície própria no
+        # formato de blit mais barato (opaca, colorkey ou alfa)
         self.tilesets = []
         self.tile_images = {}
+        self.tile_kinds = {}
         for ts in self.data["tilesets"]:
-            image = pygame.image.load(ts["image"]).convert_alpha()
+            image = load_surface(ts["image"])
             columns = ts["columns"]
             tilecount = ts["tilecount"]
             firstgid = ts["firstgid"]
@@ -25,8 +42,13 @@ class TiledMap:
                 x = (i % columns) * self.tilewidth
                 y = (i // columns) * self.tileheight
                 rect = pygame.Rect(x, y, self.tilewidth, self.tileheight)
-                tile = image.subsurface(rect)
+                tile, kind = optimize_surface(image.subsurface(rect))
+                if tile.get_parent() is None:
+                    memory_tracker.track_surface(tile, f"{ts['image']} (tiles)")
                 self.tile_images[firstgid + i] = tile
+                self.tile_kinds[firstgid + i] = kind
+
+        log.debug("Tiles por caminho de blit: %s", dict(Counter(self.tile_kinds.values())))
 
         self.layers = [layer for layer in self.data["layers"] if layer["type"] == "tilelayer"]
 
@@ -0,0 +1,149 @@
+# ============================================================
+# LOGGING DO JOGO - log.py
+# ============================================================
+"""
+Camada de log com canais por subsistema, sobre o módulo `logging`.
+
+- Cada subsistema pede seu canal com `get_logger("batalha")`.
+- As chamadas usam argumentos no estilo `%` (`log.debug("Dano %s", dano)`):
+  com o nível desligado nada é formatado, o custo é só a checagem de nível.
+  Blocos caros devem ser protegidos com `log.isEnabledFor(logging.DEBUG)`.
+- As mensagens aceitas ficam num buffer circular em memória, que pode ser
+  despejado em arquivo quando o jogo quebra (`dump_ring_buffer`).
+- A saída em arquivo é opcional e assíncrona (fila + thread de escrita).
+
+Configuração por variável de ambiente, ex.: JOGO_LOG="INFO,batalha=DEBUG"
+e JOGO_LOG_FILE="jogo.log".
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from collections import deque
+
+ROOT_CHANNEL = "jogo"
+DEFAULT_LEVEL = logging.INFO           # o que entra no buffer circular
+DEFAULT_CONSOLE_LEVEL = logging.WARNING
+RING_CAPACITY = 2000
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(name)s] %(message)s"
+
+_root = logging.getLogger(ROOT_CHANNEL)
+_root.propagate = False
+_listener = None
+
+
+class RingBufferHandler(logging.Handler):
+    """Guarda as últimas mensagens já formatadas (sem reter os argumentos)."""
+
+    def __init__(self, capacity=RING_CAPACITY):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append((record.created, record.name, record.levelname, record.getMessage()))
+
+    def dump(self, stream):
+        for created, name, levelname, message in list(self.records):
+            stamp = time.strftime("%H:%M:%S", time.localtime(created))
+            stream.write(f"{stamp} {levelname:<7} [{name}] {message}\n")
+
+
+ring_buffer = RingBufferHandler()
+
+
+def get_logger(channel):
+    """Canal de log de um subsistema (ex.: "batalha", "input", "status")."""
+    return _root.getChild(channel)
+
+
+def _parse_level(name, invalid):
+    """Nível numérico de `name`; nomes desconhecidos vão para `invalid` e viram DEFAULT_LEVEL."""
+    level = logging.getLevelName(name.strip().upper())
+    if not isinstance(level, int):
+        # getLevelName devolve "Level FOO" para nomes que não conhece
+        invalid.append(name.strip())
+        return DEFAULT_LEVEL
+    return level
+
+
+def _parse_spec(spec):
+    """
+    Interpreta "INFO,batalha=DEBUG" → (nível geral, {canal: nível}, nomes inválidos).
+    Um erro de digitação no JOGO_LOG não pode impedir o jogo de abrir.
+    """
+    level = None
+    channels = {}
+    invalid = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        if "=" in part:
+            channel, _, channel_level = part.partition("=")
+            channels[channel.strip()] = _parse_level(channel_level, invalid)
+        else:
+            level = _parse_level(part, invalid)
+    return level, channels, invalid
+
+
+def configure(spec=None, log_file=None):
+    """
+    Configura níveis e saídas. Sem argumentos, lê JOGO_LOG e JOGO_LOG_FILE.
+    Pode ser chamado de novo para trocar a configuração em tempo de execução.
+    """
+    global _listener
+    spec = spec if spec is not None else os.environ.get("JOGO_LOG", "")
+    log_file = log_file if log_file is not None else os.environ.get("JOGO_LOG_FILE")
+    level, channels, invalid = _parse_spec(spec)
+
+    shutdown()
+    for handler in list(_root.handlers):
+        _root.removeHandler(handler)
+    for name, logger in list(logging.root.manager.loggerDict.items()):
+        if name.startswith(ROOT_CHANNEL + ".") and isinstance(logger, logging.Logger):
+            logger.setLevel(logging.NOTSET)
+
+    _root.setLevel(level if level is not None else DEFAULT_LEVEL)
+    for channel, channel_level in channels.items():
+        get_logger(channel).setLevel(channel_level)
+
+    # Sem nível geral explícito o console mostra só avisos; canais com nível
+    # próprio aparecem sempre (o filtro fino fica nos próprios canais).
+    console_level = min([level if level is not None else DEFAULT_CONSOLE_LEVEL,
+                         *channels.values()])
+    console = logging.StreamHandler(sys.stderr)
+    console.setLevel(console_level)
+    console.setFormatter(logging.Formatter(LOG_FORMAT, "%H:%M:%S"))
+    _root.addHandler(console)
+    _root.addHandler(ring_buffer)
+
+    if log_file:
+        # A escrita em disco acontece numa thread própria; o jogo só enfileira.
+        log_queue = queue.SimpleQueue()
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        _listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _listener.start()
+        _root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    for name in invalid:
+        _root.warning("Nível de log desconhecido: %r; usando %s.",
+                      name, logging.getLevelName(DEFAULT_LEVEL))
+
+
+def dump_ring_buffer(path="crash_log.txt"):
+    """Grava o conteúdo do buffer circular em `path`."""
+    with open(path, "w", encoding="utf-8") as f:
+        ring_buffer.dump(f)
+    return path
+
+
+def shutdown():
+    """Esvazia a fila de escrita assíncrona e encerra a thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+configure()
@@ -0,0 +1,203 @@
+# ============================================================
+# CONTABILIDADE DE MEMÓRIA - memory_tracker.py
+# ============================================================
+"""
+Contabilidade de memória por estado do jogo, para caçar vazamentos.
+
+Desligada por padrão; liga com JOGO_MEMORY=1 (ou `enable()`). Ligada:
+
+- Cada `push_state`/`pop_state` tira um snapshot do `tracemalloc` e
+  registra no log (canal "memoria") as linhas que mais cresceram desde o
+  snapshot anterior.
+- Superfícies criadas pela camada de assets são contadas enquanto vivas
+  (largura × altura × bytes por pixel), agrupadas pelo caminho de origem.
+  Subsuperfícies compartilham os pixels do pai e não contam.
+- Estados removidos da pilha ficam sob observação (referência fraca). Se
+  algum continua vivo depois de uma coleta de lixo, o relatório mostra
+  quem ainda o referencia e quantos objetos, por tipo, ele mantém vivos.
+"""
+
+import gc
+import inspect
+import os
+import tracemalloc
+import types
+import weakref
+from collections import Counter
+
+from log import get_logger
+
+log = get_logger("memoria")
+
+TRACE_FRAMES = 10
+TOP_LINES = 10
+REACHABLE_LIMIT = 200_000   # teto de objetos percorridos por estado vazado
+# Código e definições são compartilhados por todo o jogo: a busca não entra neles
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.CodeType,
+                types.BuiltinFunctionType)
+
+enabled = False
+_previous_snapshot = None
+_surfaces = {}          # id(surface) -> (rótulo, bytes)
+_popped_states = []     # [weakref, já reportado?]
+
+
+def enable(frames=TRACE_FRAMES):
+    global enabled
+    enabled = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    log.info("Contabilidade de memória ligada (tracemalloc com %s quadros).", frames)
+
+
+def disable():
+    global enabled, _previous_snapshot
+    enabled = False
+    _previous_snapshot = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+# -----------------------------
+# Superfícies
+# -----------------------------
+def surface_bytes(surface):
+    if surface.get_parent() is not None:
+        return 0
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def track_surface(surface, label):
+    """Conta `surface` até ela ser coletada. Devolve a própria superfície."""
+    if enabled:
+        key = id(surface)
+        _surfaces[key] = (label, surface_bytes(surface))
+        weakref.finalize(surface, _surfaces.pop, key, None)
+    return surface
+
+
+def surface_report():
+    """{rótulo: (quantidade, bytes)} das superfícies vivas."""
+    report = {}
+    for label, size in _surfaces.values():
+        count, total = report.get(label, (0, 0))
+        report[label] = (count + 1, total + size)
+    return report
+
+
+# -----------------------------
+# Estados
+# -----------------------------
+def on_push(state):
+    if enabled:
+        _take_snapshot(f"push {type(state).__name__}")
+        _log_leaks()
+
+
+def on_pop(state):
+    """Chamado com o estado recém-removido; ele é verificado nas próximas trocas."""
+    if not enabled:
+        return
+    _take_snapshot(f"pop {type(state).__name__}")
+    _log_leaks()
+    _popped_states.append([weakref.ref(state), False])
+
+
+def _take_snapshot(reason):
+    global _previous_snapshot
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    current, peak = tracemalloc.get_traced_memory()
+    surfaces = sum(size for _, size in _surfaces.values())
+    log.info("[%s] memória rastreada: %.1f KiB (pico %.1f KiB), superfícies: %.1f KiB",
+             reason, current / 1024, peak / 1024, surfaces / 1024)
+    if _previous_snapshot is not None:
+        for stat in snapshot.compare_to(_previous_snapshot, "lineno")[:TOP_LINES]:
+            if stat.size_diff:
+                log.info("  %s", stat)
+    _previous_snapshot = snapshot
+
+
+def leaked_states():
+    """Estados já removidos da pilha que continuam vivos após uma coleta."""
+    gc.collect()
+    _popped_states[:] = [entry for entry in _popped_states if entry[0]() is not None]
+    return [entry[0]() for entry in _popped_states]
+
+
+def _live_roots(state):
+    """
+    Objetos que a busca não atravessa: o `Game`, o que ele guarda (jogador,
+    assets...) e os estados ainda na pilha.
+    """
+    game = getattr(state, "game", None)
+    if game is None:
+        return ()
+    stack = getattr(game, "state_stack", [])
+    return (game, *vars(game).values(), *stack)
+
+
+def reachable_from(root, limit=REACHABLE_LIMIT, exclude=()):
+    """
+    Contagem por tipo dos objetos alcançáveis a partir de `root` (sem código
+    compartilhado). A busca não entra nos objetos de `exclude`, então conta só
+    o que `root` mantém vivo além deles.
+    """
+    seen = {id(root)}
+    seen.update(id(obj) for obj in exclude if obj is not root)
+    pending = [root]
+    counts = Counter()
+    while pending and len(seen) < limit:
+        obj = pending.pop()
+        counts[type(obj).__name__] += 1
+        for child in gc.get_referents(obj):
+            if id(child) in seen or isinstance(child, SHARED_TYPES):
+                continue
+            seen.add(id(child))
+            pending.append(child)
+    return counts
+
+
+def _describe_referrer(referrer):
+    if isinstance(referrer, dict):
+        return f"dict com chaves {list(referrer)[:5]}"
+    if isinstance(referrer, (list, tuple)):
+        return f"{type(referrer).__name__} de {len(referrer)} itens"
+    return type(referrer).__name__
+
+
+def _log_leaks():
+    leaked = leaked_states()
+    for entry in _popped_states:
+        state = entry[0]()
+        if entry[1] or state is None:
+            continue
+        entry[1] = True   # cada estado vazado é reportado uma vez
+        referrers = [r for r in gc.get_referrers(state)
+                     if r is not leaked and not inspect.isframe(r)]
+        log.warning("Estado %s removido da pilha continua vivo; referenciado por: %s",
+                    type(state).__name__,
+                    ", ".join(_describe_referrer(r) for r in referrers[:5]) or "-")
+        for type_name, count in reachable_from(state, exclude=_live_roots(state)).most_common(8):
+            log.warning("    %6d %s", count, type_name)
+
+
+def report():
+    """Resumo textual: superfícies vivas por origem e estados vazados."""
+    lines = ["Superfícies vivas (camada de assets):"]
+    for label, (count, size) in sorted(surface_report().items(), key=lambda item: -item[1][1]):
+        lines.append(f"  {size / 1024:10.1f} KiB  {count:4d}x  {label}")
+    leaked = leaked_states()
+    lines.append(f"Estados removidos ainda vivos: {len(leaked)}")
+    for state in leaked:
+        counts = reachable_from(state, exclude=_live_roots(state))
+        top = ", ".join(f"{count} {type_name}" for type_name, count in counts.most_common(5))
+        lines.append(f"  {type(state).__name__}: {top}")
+    return "\n".join(lines)
+
+
+if os.environ.get("JOGO_MEMORY"):
+    enable()
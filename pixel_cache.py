@@ -0,0 +1,105 @@
+# ============================================================
+# CACHE DE PIXELS DECODIFICADOS - pixel_cache.py
+# ============================================================
+"""
+Cache em disco dos pixels já decodificados das imagens do jogo.
+
+Decodificar um PNG passa pelo zlib a cada execução. Aqui a imagem
+decodificada (e, para versões redimensionadas, já redimensionada) é
+gravada crua em `.cache/pixels/`, como sai de `pygame.image.tobytes`.
+Na próxima execução o arquivo é mapeado na memória e vira superfície
+com `pygame.image.frombuffer`, sem descompressão nenhuma.
+
+Cada entrada é identificada pelo caminho de origem e pelo tamanho alvo;
+o cabeçalho guarda um carimbo da origem (mtime + tamanho do arquivo, ou
+o hash do pacote de assets). Se a origem muda, o carimbo não confere, a
+entrada é ignorada e regravada na hora.
+
+Desliga com JOGO_PIXEL_CACHE=0.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+from log import get_logger
+
+log = get_logger("assets")
+
+CACHE_DIR = os.path.join(".cache", "pixels")
+MAGIC = b"JOGOPIX\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHII16s")   # assinatura, versão, largura, altura, carimbo
+PIXEL_FORMAT = "RGBA"
+
+enabled = os.environ.get("JOGO_PIXEL_CACHE", "1") != "0"
+
+
+def _entry_path(source, size):
+    label = "original" if size is None else f"{size[0]}x{size[1]}"
+    key = hashlib.blake2b(f"{source}|{label}".encode("utf-8"), digest_size=12).hexdigest()
+    return os.path.join(CACHE_DIR, key + ".pix")
+
+
+def _stamp_digest(stamp):
+    return hashlib.blake2b(repr(stamp).encode("utf-8"), digest_size=16).digest()
+
+
+def get(source, stamp, size=None, convert=pygame.Surface.convert_alpha):
+    """
+    Superfície de `source` (no tamanho `size`, ou original) vinda do cache,
+    já passada por `convert`; None se não houver entrada válida.
+    """
+    if not enabled:
+        return None
+    try:
+        with open(_entry_path(source, size), "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, width, height, digest = HEADER.unpack_from(data)
+            if (magic != MAGIC or version != FORMAT_VERSION or digest != _stamp_digest(stamp)
+                    or len(data) != HEADER.size + width * height * 4):
+                return None
+            view = memoryview(data)[HEADER.size:]
+            try:
+                # `convert` copia os pixels; o mmap pode fechar em seguida
+                raw = pygame.image.frombuffer(view, (width, height), PIXEL_FORMAT)
+                surface = convert(raw)
+                del raw
+            finally:
+                view.release()
+            return surface
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def put(source, stamp, surface, size=None):
+    """Grava os pixels de `surface` como a entrada de `source` no tamanho `size`."""
+    if not enabled:
+        return
+    path = _entry_path(source, size)
+    # Temporário por thread: carregamentos em segundo plano também gravam aqui
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    width, height = surface.get_size()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, width, height, _stamp_digest(stamp)))
+            f.write(pygame.image.tobytes(surface, PIXEL_FORMAT))
+        os.replace(temp_path, path)
+    except OSError as exc:
+        log.warning("Não foi possível gravar o cache de pixels de %s: %s", source, exc)
+
+
+def clear():
+    """Apaga todas as entradas do cache."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except OSError:
+            pass
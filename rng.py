@@ -0,0 +1,195 @@
+# ============================================================
+# ALEATORIEDADE DO JOGO - rng.py
+# ============================================================
+"""
+Serviço de números aleatórios determinístico, com fluxos por subsistema.
+
+- Uma semente raiz gera fluxos independentes por nome ("deck", "combat",
+  "ai", "loot"...). A semente de cada fluxo é derivada da raiz e do nome,
+  então consumir números em um fluxo não altera a sequência dos outros.
+- Fluxos e serviços podem ser divididos (`split`) para workers de simulação:
+  cada worker recebe uma sequência própria, reproduzível a partir da raiz.
+- O estado completo (`getstate`/`setstate`) é serializável com pickle,
+  para replays e jogos salvos.
+- `buffered()` entrega um gerador com buffer pré-gerado em lote, para
+  laços que só precisam de `random()` (embaralhar, sortear cartas).
+
+Semente fixa por variável de ambiente, ex.: JOGO_SEED=1234. Sem ela a
+semente vem do sistema e é registrada no log, para reproduzir a partida.
+"""
+
+import hashlib
+import os
+import random
+
+from log import get_logger
+
+log = get_logger("jogo")
+
+STREAMS = ("deck", "combat", "ai", "loot", "fx")   # "fx": efeitos visuais (partículas)
+BUFFER_CHUNK = 4096
+SEED_MASK = 0xFFFFFFFFFFFFFFFF   # sementes de 64 bits (o save grava a raiz como uint64)
+
+_numpy = None
+
+
+def _get_numpy():
+    """NumPy importado só no primeiro uso em lote (o import custa dezenas de ms), ou None."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - depende do ambiente
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def derive_seed(seed, name):
+    """Semente de 64 bits estável para o fluxo `name` a partir de `seed`."""
+    digest = hashlib.blake2b(f"{seed}/{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class RandomStream(random.Random):
+    """Um fluxo nomeado: `random.Random` com semente derivada e divisão em subfluxos."""
+
+    def __init__(self, name, seed):
+        self.name = name
+        self.stream_seed = seed
+        super().__init__(seed)
+
+    def split(self, name):
+        """Subfluxo independente (ex.: um por worker), derivado deste fluxo."""
+        return RandomStream(f"{self.name}/{name}", derive_seed(self.stream_seed, name))
+
+    def bulk(self, count):
+        """`count` floats em [0, 1) de uma vez (vetorizado com NumPy, se houver)."""
+        np = _get_numpy()
+        if np is not None:
+            return np.random.default_rng(self.getrandbits(64)).random(count).tolist()
+        draw = self.random
+        return [draw() for _ in range(count)]
+
+    def buffered(self, chunk=BUFFER_CHUNK):
+        return BufferedRandom(self, chunk)
+
+
+class BufferedRandom:
+    """
+    `random()` servido de um buffer gerado em lote pelo fluxo de origem.
+
+    O estado guarda só o ponto de recarga e a posição no buffer; restaurar
+    regenera o mesmo lote, então a sequência continua idêntica.
+    """
+    __slots__ = ("stream", "chunk", "_buffer", "_position", "_refill_state")
+
+    def __init__(self, stream, chunk=BUFFER_CHUNK):
+        self.stream = stream
+        self.chunk = chunk
+        self._buffer = []
+        self._position = 0
+        self._refill_state = None
+
+    def random(self):
+        if self._position >= len(self._buffer):
+            self._refill()
+        value = self._buffer[self._position]
+        self._position += 1
+        return value
+
+    def _refill(self):
+        self._refill_state = self.stream.getstate()
+        self._buffer = self.stream.bulk(self.chunk)
+        self._position = 0
+
+    def getstate(self):
+        return self._refill_state, self._position
+
+    def setstate(self, state):
+        refill_state, position = state
+        self._refill_state = refill_state
+        if refill_state is None:
+            self._buffer = []
+        else:
+            self.stream.setstate(refill_state)
+            self._buffer = self.stream.bulk(self.chunk)
+        self._position = position
+
+
+class RNGService:
+    """Fluxos aleatórios independentes derivados de uma única semente raiz."""
+
+    def __init__(self, seed=None):
+        self._streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Recomeça todos os fluxos a partir de `seed` (ou de uma semente do sistema)."""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "big")
+        # Negativas ou maiores que 64 bits (ex.: JOGO_SEED=-1) caem no intervalo
+        self.seed = seed & SEED_MASK
+        seed = self.seed
+        for name, stream in self._streams.items():
+            stream.stream_seed = derive_seed(seed, name)
+            stream.seed(stream.stream_seed)
+
+    def stream(self, name):
+        """Fluxo `name`; sempre o mesmo objeto, criado na primeira chamada."""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = RandomStream(name, derive_seed(self.seed, name))
+        return stream
+
+    def split(self, name):
+        """Serviço filho com raiz derivada (ex.: `split(f"worker-{i}")` por processo)."""
+        return RNGService(derive_seed(self.seed, f"split/{name}"))
+
+    def getstate(self):
+        return {
+            "seed": self.seed,
+            "streams": {name: stream.getstate() for name, stream in self._streams.items()},
+        }
+
+    def setstate(self, state):
+        """Restaura semente e fluxos; fluxos já entregues continuam válidos."""
+        self.seed = state["seed"]
+        for name, stream_state in state["streams"].items():
+            stream = self.stream(name)
+            stream.stream_seed = derive_seed(self.seed, name)
+            stream.setstate(stream_state)
+
+
+_service = None
+
+
+def service():
+    """Serviço padrão do jogo, semeado por JOGO_SEED ou pelo sistema."""
+    global _service
+    if _service is None:
+        seed = os.environ.get("JOGO_SEED")
+        _service = RNGService(int(seed) if seed else None)
+        log.info("Semente aleatória: %s", _service.seed)
+    return _service
+
+
+def get_stream(name):
+    """Fluxo `name` do serviço padrão (ex.: `get_stream("deck")`); só nomes de STREAMS."""
+    if name not in STREAMS:
+        raise ValueError(f"Fluxo aleatório desconhecido: {name!r} (use um de {STREAMS})")
+    return service().stream(name)
+
+
+def configure(seed=None):
+    """Reinicia o serviço padrão com uma nova semente."""
+    service().reseed(seed)
+    log.info("Semente aleatória: %s", _service.seed)
+
+
+def getstate():
+    return service().getstate()
+
+
+def setstate(state):
+    service().setstate(state)
@@ -0,0 +1,384 @@
+# ============================================================
+# JOGO SALVO - save_game.py
+# ============================================================
+"""
+Salvamento e carregamento do progresso num formato binário compacto.
+
+- `snapshot(game)` roda na thread principal e copia só dados simples
+  (números, strings, tuplas) do jogador, das zonas de cartas, da posição
+  no mapa e do estado dos geradores aleatórios. É barato e imutável.
+- `SaveWriter` codifica, comprime (zlib) e grava o snapshot numa thread
+  de fundo, com escrita atômica (arquivo temporário + `os.replace`). Se
+  vários autosaves chegam antes da gravação, só o mais recente é escrito.
+- `load(path)` decodifica o arquivo e `apply(game, snap)` restaura o jogo.
+
+Formato: cabeçalho fixo (assinatura, versão, tamanho descomprimido,
+CRC32) seguido do corpo comprimido. As cartas são gravadas como índices
+numa tabela de ids, em ordem, zona por zona.
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import NamedTuple, Optional
+
+from batalha.status_engine import recompute_modifiers
+from characters.cards import CardInstance, CardState
+from characters.card_library import get_library
+from characters.card_zones import ZONE_NAMES
+import rng as game_rng
+from log import get_logger
+
+log = get_logger("jogo")
+
+SAVE_DIR = "saves"
+DEFAULT_SAVE_PATH = os.path.join(SAVE_DIR, "slot1.sav")
+
+MAGIC = b"JOGOSAVE"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHII")   # assinatura, versão, tamanho descomprimido, crc32
+CARD_STATES = tuple(CardState)
+
+
+class PlayerSnapshot(NamedTuple):
+    name: str
+    health: int
+    max_health: int
+    energy: int
+    max_energy: int
+    shield: int
+    status_effects: tuple    # ((nome, ((chave, valor), ...)), ...)
+
+
+class SaveSnapshot(NamedTuple):
+    player: PlayerSnapshot
+    zones: tuple             # por zona: ((card_id, usos restantes, estado), ...)
+    map_pos: Optional[tuple]
+    rng_state: dict
+    saved_at: float
+
+
+# -----------------------------
+# Snapshot (thread principal)
+# -----------------------------
+def find_map_state(game):
+    """Estado do mapa na pilha (mesmo com uma batalha por cima), ou None."""
+    for state in reversed(game.state_stack):
+        if hasattr(state, "player_pos"):
+            return state
+    return None
+
+
+def snapshot(game):
+    """Levanta ValueError se o jogador estiver morto (um save assim não pode ser retomado)."""
+    player = game.player
+    if player.health <= 0:
+        raise ValueError("Não é possível salvar com o jogador morto")
+    map_state = find_map_state(game)
+    return SaveSnapshot(
+        player=PlayerSnapshot(
+            player.name, player.health, player.max_health,
+            player.energy, player.max_energy, player.shield,
+            tuple((name, tuple(data.items())) for name, data in player.status_effects.items()),
+        ),
+        zones=tuple(
+            tuple((card.card_id, card.uses_left, card.state) for card in player.zones.view(zone))
+            for zone in range(len(ZONE_NAMES))
+        ),
+        map_pos=tuple(map_state.player_pos) if map_state is not None else None,
+        rng_state=game_rng.getstate(),
+        saved_at=time.time(),
+    )
+
+
+# -----------------------------
+# Codificação binária
+# -----------------------------
+class _Writer:
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def pack(self, fmt, *values):
+        self.buffer += struct.pack("<" + fmt, *values)
+
+    def text(self, value):
+        data = value.encode("utf-8")
+        self.pack("H", len(data))
+        self.buffer += data
+
+    def value(self, value):
+        """Valor de status: bool, int, float, str ou None, com etiqueta de tipo."""
+        if isinstance(value, bool):
+            self.pack("c?", b"b", value)
+        elif isinstance(value, int):
+            self.pack("cq", b"i", value)
+        elif isinstance(value, float):
+            self.pack("cd", b"f", value)
+        elif isinstance(value, str):
+            self.pack("c", b"s")
+            self.text(value)
+        elif value is None:
+            self.pack("c", b"n")
+        else:
+            raise TypeError(f"Valor não serializável no save: {value!r}")
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt):
+        fmt = struct.Struct("<" + fmt)
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def text(self):
+        (size,) = self.unpack("H")
+        value = bytes(self.data[self.offset:self.offset + size]).decode("utf-8")
+        self.offset += size
+        return value
+
+    def value(self):
+        (tag,) = self.unpack("c")
+        if tag == b"b":
+            return self.unpack("?")[0]
+        if tag == b"i":
+            return self.unpack("q")[0]
+        if tag == b"f":
+            return self.unpack("d")[0]
+        if tag == b"s":
+            return self.text()
+        if tag == b"n":
+            return None
+        raise ValueError(f"Etiqueta de tipo desconhecida no save: {tag!r}")
+
+
+def encode(snap):
+    """Snapshot -> bytes (cabeçalho + corpo comprimido)."""
+    out = _Writer()
+    player = snap.player
+    out.text(player.name)
+    out.pack("iiiiid", player.health, player.max_health, player.energy,
+             player.max_energy, player.shield, snap.saved_at)
+
+    out.pack("H", len(player.status_effects))
+    for name, items in player.status_effects:
+        out.text(name)
+        out.pack("B", len(items))
+        for key, value in items:
+            out.text(key)
+            out.value(value)
+
+    # Tabela de ids de carta: cada carta vira um índice de 2 bytes
+    card_ids = sorted({card_id for zone in snap.zones for card_id, _, _ in zone})
+    id_index = {card_id: i for i, card_id in enumerate(card_ids)}
+    out.pack("H", len(card_ids))
+    for card_id in card_ids:
+        out.text(card_id)
+    out.pack("B", len(snap.zones))
+    for zone in snap.zones:
+        out.pack("H", len(zone))
+        for card_id, uses_left, state in zone:
+            out.pack("HhB", id_index[card_id], uses_left, CARD_STATES.index(state))
+
+    if snap.map_pos is None:
+        out.pack("?", False)
+    else:
+        out.pack("?dd", True, *snap.map_pos)
+
+    _encode_rng(out, snap.rng_state)
+
+    body = bytes(out.buffer)
+    return HEADER.pack(MAGIC, FORMAT_VERSION, len(body), zlib.crc32(body)) + zlib.compress(body, 6)
+
+
+def _encode_rng(out, state):
+    out.pack("Q", state["seed"])
+    out.pack("B", len(state["streams"]))
+    for name, (version, internal, gauss) in state["streams"].items():
+        out.text(name)
+        out.pack("BH", version, len(internal))
+        out.pack(f"{len(internal)}I", *internal)
+        out.pack("?d", gauss is not None, gauss or 0.0)
+
+
+def _decode_rng(reader):
+    (seed,) = reader.unpack("Q")
+    (count,) = reader.unpack("B")
+    streams = {}
+    for _ in range(count):
+        name = reader.text()
+        version, size = reader.unpack("BH")
+        internal = reader.unpack(f"{size}I")
+        has_gauss, gauss = reader.unpack("?d")
+        streams[name] = (version, internal, gauss if has_gauss else None)
+    return {"seed": seed, "streams": streams}
+
+
+def decode(data):
+    """bytes -> Snapshot. Levanta ValueError se o arquivo estiver corrompido ou for de outra versão."""
+    if len(data) < HEADER.size:
+        raise ValueError("Arquivo de save truncado")
+    magic, version, size, checksum = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Arquivo não é um save do jogo")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Versão de save não suportada: {version}")
+    try:
+        body = zlib.decompress(memoryview(data)[HEADER.size:])
+        if len(body) != size or zlib.crc32(body) != checksum:
+            raise ValueError("Save corrompido (tamanho ou CRC não conferem)")
+        return _decode_body(_Reader(body))
+    except (zlib.error, struct.error, IndexError) as exc:
+        raise ValueError(f"Save corrompido: {exc}") from exc
+
+
+def _decode_body(reader):
+    name = reader.text()
+    health, max_health, energy, max_energy, shield, saved_at = reader.unpack("iiiiid")
+
+    (status_count,) = reader.unpack("H")
+    status_effects = []
+    for _ in range(status_count):
+        status = reader.text()
+        (item_count,) = reader.unpack("B")
+        status_effects.append((status, tuple((reader.text(), reader.value()) for _ in range(item_count))))
+
+    (id_count,) = reader.unpack("H")
+    card_ids = [reader.text() for _ in range(id_count)]
+    (zone_count,) = reader.unpack("B")
+    zones = []
+    for _ in range(zone_count):
+        (card_count,) = reader.unpack("H")
+        zone = []
+        for _ in range(card_count):
+            index, uses_left, state = reader.unpack("HhB")
+            zone.append((card_ids[index], uses_left, CARD_STATES[state]))
+        zones.append(tuple(zone))
+
+    (has_pos,) = reader.unpack("?")
+    map_pos = reader.unpack("dd") if has_pos else None
+
+    return SaveSnapshot(
+        PlayerSnapshot(name, health, max_health, energy, max_energy, shield, tuple(status_effects)),
+        tuple(zones), map_pos, _decode_rng(reader), saved_at)
+
+
+# -----------------------------
+# Arquivo
+# -----------------------------
+def write_file(snap, path=DEFAULT_SAVE_PATH):
+    """Codifica e grava de forma atômica: ou fica o save antigo, ou o novo inteiro."""
+    data = encode(snap)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def has_save(path=DEFAULT_SAVE_PATH):
+    return os.path.isfile(path)
+
+
+def load(path=DEFAULT_SAVE_PATH):
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+def apply(game, snap):
+    """Restaura jogador, cartas e geradores aleatórios; a posição fica em `game.resume_pos`."""
+    player = game.player
+    data = snap.player
+    player.name = data.name
+    player.health, player.max_health = data.health, data.max_health
+    player.energy, player.max_energy = data.energy, data.max_energy
+    player.shield = data.shield
+    player.status_effects = {name: dict(items) for name, items in data.status_effects}
+    recompute_modifiers(player)
+
+    library = get_library()
+    player.zones.reset([])
+    player.selected_cards.clear()
+    for zone, cards in enumerate(snap.zones):
+        for card_id, uses_left, state in cards:
+            if card_id not in library:
+                log.warning("Carta '%s' do save não existe mais na biblioteca; ignorada.", card_id)
+                continue
+            card = CardInstance(library[card_id])
+            card.uses_left = uses_left
+            # Seleção não é restaurada (a energia gasta já está no save)
+            card.state = CardState.IDLE if state == CardState.SELECTED else state
+            player.zones.add(card, zone)
+
+    game_rng.setstate(snap.rng_state)
+    game.resume_pos = snap.map_pos
+
+
+# -----------------------------
+# Gravação em segundo plano
+# -----------------------------
+class SaveWriter:
+    """Thread de gravação: codifica, comprime e grava snapshots fora do frame."""
+
+    def __init__(self, path=DEFAULT_SAVE_PATH):
+        self.path = path
+        self._pending = None
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, snap):
+        """Agenda a gravação; um snapshot ainda não gravado é substituído pelo novo."""
+        with self._condition:
+            if self._closed:
+                return
+            self._pending = snap
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                snap, self._pending = self._pending, None
+                self._busy = True
+            try:
+                started = time.perf_counter()
+                size = write_file(snap, self.path)
+                log.debug("Jogo salvo em %s (%s bytes, %.1f ms)", self.path, size,
+                          (time.perf_counter() - started) * 1000)
+            except Exception:
+                log.exception("Falha ao salvar o jogo em %s", self.path)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Espera as gravações pendentes terminarem."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def close(self, timeout=5.0):
+        """Grava o que estiver pendente e encerra a thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
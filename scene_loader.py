@@ -0,0 +1,71 @@
+# ============================================================
+# CARREGAMENTO DE CENAS - scene_loader.py
+# ============================================================
+"""
+Carregamento de cenas em duas fases, para trocar de estado sem travar o frame.
+
+- `prepare()` roda numa thread de fundo e faz só E/S e decodificação
+  (ler JSON, decodificar imagens com `assets.preload`). Não cria
+  superfícies convertidas nem fontes e não toca no estado do jogo.
+- `finalize(dados)` roda na thread principal com o que `prepare` devolveu:
+  converte o que falta e constrói o estado.
+
+O estado `Transicao` (states/transicao.py) anima a tela enquanto a
+preparação roda e chama a finalização quando ela termina.
+"""
+
+import threading
+import time
+
+from log import get_logger
+
+log = get_logger("jogo")
+
+
+class SceneLoad:
+    def __init__(self, name, prepare, finalize):
+        self.name = name
+        self._prepare = prepare
+        self._finalize = finalize
+        self._result = None
+        self._done = threading.Event()
+        self._thread = None
+        self.error = None
+        self.prepare_ms = None
+
+    def start(self):
+        """Dispara a preparação em segundo plano (só na primeira chamada)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"cena-{self.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        started = time.perf_counter()
+        try:
+            self._result = self._prepare()
+        except Exception as exc:
+            self.error = exc   # relançado (com o traceback) por `finalize`
+        finally:
+            self.prepare_ms = (time.perf_counter() - started) * 1000
+            self._done.set()
+
+    @property
+    def ready(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def finalize(self):
+        """Constrói a cena na thread principal; repassa o erro da preparação, se houve."""
+        self.start()
+        self.wait()
+        if self.error is not None:
+            raise self.error
+        started = time.perf_counter()
+        scene = self._finalize(self._result)
+        self._result = None
+        log.info("Cena %s carregada: preparo %.1f ms (fundo), finalização %.1f ms",
+                 self.name, self.prepare_ms, (time.perf_counter() - started) * 1000)
+        return scene
@@ -2,6 +2,11 @@ import pygame
 import sys
 from batalha.battle_manager import BattleManager
 from batalha.battle_state import BattleState
+from batalha.formation import formation_layout, enemy_area
+from batalha.damage_feedback import render_damage_text
+from characters.hand_renderer import warm_card_faces
+from assets import preload, get_scaled_surface
+from scene_loader import SceneLoad
 from states.base_state import BaseState # <-- 1. Importe a classe base
 
 class Batalha(BaseState):
@@ -26,6 +31,29 @@ class Batalha(BaseState):
         # Configura a batalha com os inimigos específicos que foram passados
         self.battle_manager.setup_battle(enemies_data)
 
+    @classmethod
+    def loader(cls, game, enemies_data):
+        """Carregamento em duas fases: sprites dos inimigos decodificados em segundo plano."""
+        return SceneLoad(
+            "batalha",
+            lambda: preload([data["image"] for data in enemies_data]),
+            lambda _: cls(game, enemies_data),
+        )
+
+    @staticmethod
+    def warm(game, enemies_data):
+        """
+        Deixa prontos, na thread principal, os recursos que a batalha cria ao
+        começar: sprites no tamanho da formação, faces das cartas do jogador
+        e as fontes dos números de dano.
+        """
+        _, size = formation_layout(len(enemies_data), enemy_area(game.screen_width, game.screen_height))
+        for data in enemies_data:
+            get_scaled_surface(data["image"], (size, size))
+        player = game.player
+        warm_card_faces([*player.hand, *player.deck, *player.discard_pile])
+        render_damage_text(0, 2, 0, False, (255, 0, 0))
+
     def handle_events(self, events):
         """Gerencia a entrada do usuário durante a batalha."""
         for event in events:
@@ -40,11 +68,15 @@ class Batalha(BaseState):
             # Durante o turno do jogador, processa cliques do mouse
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 self.battle_manager.handle_click(event.pos)
+
+            # F alterna a velocidade do turno inimigo (normal, acelerado, instantâneo)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                self.battle_manager.turn_manager.cycle_speed_mode()
         pass
 
     def update(self):
         """Delega a atualização da lógica para o battle_manager."""
-        self.battle_manager.update()
+        self.battle_manager.update(self.game.CLOCK.get_time())
 
     def draw(self, surface):
         """Delega a renderização da cena de batalha para o battle_manager."""
@@ -3,11 +3,18 @@ import sys
 
 # Importações de componentes do jogo
 from jogo_principal.camera import Camera
-from jogo_principal.tileset import TiledMap
+from jogo_principal.tileset import TiledMap, read_map
 from jogo_principal.dialog import Dialogo
+from jogo_principal.prefetch import EncounterPrefetcher
 from characters.npc import NPC
 from states.batalha import Batalha
 from states.base_state import BaseState
+from scene_loader import SceneLoad
+from log import get_logger
+
+log = get_logger("mapa")
+
+MAP_FILE = "assets/mapa.tmj"
 
 # 1. Defina os dados dos inimigos para este encontro
 dados_inimigos_da_torre = [
@@ -20,12 +27,16 @@ class JogoPrincipal(BaseState):
     Estado principal do jogo, onde o jogador explora o mapa,
     interage com NPCs e entra em batalhas.
     """
-    def __init__(self, game):
+    def __init__(self, game, map_data=None):
         super().__init__(game)
         
         # --- CONFIGURAÇÕES DO JOGADOR E DO MUNDO ---
         self.player = self.game.player
         self.player_pos = [400, 300] # Posição inicial no mundo
+        if self.game.resume_pos is not None:
+            # Retomando um jogo salvo
+            self.player_pos = list(self.game.resume_pos)
+            self.game.resume_pos = None
         self.TAMANHO_JOGADOR = 20
         self.VELOCIDADE_JOGADOR = 180 # Movimento baseado em pixels por segundo
 
@@ -35,7 +46,7 @@ class JogoPrincipal(BaseState):
         self.dialogo = Dialogo(self.font_default)
 
         # --- MAPA E CÂMERA ---
-        self.mapa = TiledMap("assets/mapa.tmj")
+        self.mapa = TiledMap(MAP_FILE, map_data)
         map_width = self.mapa.width * self.mapa.tilewidth
         map_height = self.mapa.height * self.mapa.tileheight
         self.camera = Camera(self.game.screen_width, self.game.screen_height, map_width, map_height)
@@ -43,14 +54,20 @@ class JogoPrincipal(BaseState):
         # --- NPCs ---
         self.npcs = self._create_npcs()
         self.npc_interacao = None # Armazena o NPC com o qual a interação é possível
+        # Recursos da batalha de um NPC carregados quando o jogador se aproxima
+        self.prefetcher = EncounterPrefetcher(self.game)
 
         # --- CONTROLE DE TEMPO ---
-        self.clock = pygame.time.Clock()
         self.delta_time = 0
 
         # --- ESTADO INTERNO ---
         self.is_paused = False
 
+    @classmethod
+    def loader(cls, game):
+        """Carregamento em duas fases: mapa lido e decodificado em segundo plano."""
+        return SceneLoad("mapa", lambda: read_map(MAP_FILE), lambda data: cls(game, data))
+
     def _create_npcs(self):
         """Cria e retorna uma lista com todas as instâncias de NPCs do jogo."""
         return [
@@ -60,7 +77,7 @@ class JogoPrincipal(BaseState):
                 {
                     "texto": "Bem-vindo, aventureiro! Cuidado com os perigos da torre...",
                     "opcoes": ["Obrigado!", "Vou ter cuidado."],
-                    "callbacks": [lambda: print("Disse 'Obrigado!'"), lambda: print("Prometeu ter cuidado.")],
+                    "callbacks": [lambda: log.info("Disse 'Obrigado!'"), lambda: log.info("Prometeu ter cuidado.")],
                     "layout": "vertical"
                 }
             ),
@@ -71,11 +88,12 @@ class JogoPrincipal(BaseState):
                     "texto": "Deseja enfrentar os perigos da torre?",
                     "opcoes": ["Sim", "Não"],
                     "callbacks": [
-                        lambda: self.game.push_state(Batalha(self.game, dados_inimigos_da_torre)),
-                        lambda: print("O jogador recuou da torre.")
+                        lambda: self.game.load_scene(Batalha.loader(self.game, dados_inimigos_da_torre)),
+                        lambda: log.info("O jogador recuou da torre.")
                     ],
                     "layout": "horizontal"
-                }
+                },
+                encontro=dados_inimigos_da_torre
             )
         ]
 
@@ -98,13 +116,15 @@ class JogoPrincipal(BaseState):
 
     def update(self):
         """Atualiza a lógica do jogo a cada frame."""
-        # Calcula o delta_time para movimento consistente
-        self.delta_time = self.clock.tick(60) / 1000.0
+        # Tempo do último frame, medido pelo único Clock.tick do loop principal
+        # (um segundo tick aqui esperava mais um frame antes de mostrar a entrada)
+        self.delta_time = self.game.CLOCK.get_time() / 1000.0
 
         if not self.dialogo.ativo:
             self._processar_movimento()
             self._verificar_interacao()
-        
+
+        self.prefetcher.update(self.player_pos, self.npcs)
         self._update_camera()
 
     def draw(self, surface):
@@ -141,6 +161,7 @@ class JogoPrincipal(BaseState):
             elif event.key == pygame.K_e and self.npc_interacao:
                 # Interage com o NPC próximo
                 self.npc_interacao.interagir(self.dialogo)
+                self.game.latency.mark("dialogo_aberto")
 
     def _processar_movimento(self):
         """Calcula e aplica o movimento do jogador."""
@@ -155,6 +176,8 @@ class JogoPrincipal(BaseState):
 
         self.player_pos[0] += dx * self.VELOCIDADE_JOGADOR * self.delta_time
         self.player_pos[1] += dy * self.VELOCIDADE_JOGADOR * self.delta_time
+        if dx or dy:
+            self.game.latency.mark("jogador_moveu")
         
         # Garante que o jogador não saia dos limites do mapa
         self._limitar_movimento_mapa()
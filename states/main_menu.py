@@ -1,5 +1,6 @@
 import pygame
 import sys
+import save_game
 from states.base_state import BaseState # <-- 1. Importe a classe base
 
 class MainMenu(BaseState):
@@ -16,6 +17,8 @@ class MainMenu(BaseState):
 
         # Opções do menu
         self.options = ["Iniciar Jogo", "Características", "Sair"]
+        if save_game.has_save():
+            self.options.insert(0, "Continuar")
         self.selected_index = 0
 
         # Cores
@@ -47,7 +50,12 @@ class MainMenu(BaseState):
         """Executa a ação correspondente à opção de menu selecionada."""
         selected_option = self.options[self.selected_index]
 
-        if selected_option == "Iniciar Jogo":
+        if selected_option == "Continuar":
+            # Restaura o jogo salvo e volta ao mapa na posição gravada
+            if self.game.load_game():
+                self.game.push_state("JOGO_PRINCIPAL")
+
+        elif selected_option == "Iniciar Jogo":
             # Empurra o estado de jogo principal para a pilha, iniciando o jogo
             self.game.push_state("JOGO_PRINCIPAL")
         
@@ -0,0 +1,59 @@
+import pygame
+from states.base_state import BaseState
+from log import get_logger
+
+log = get_logger("jogo")
+
+FADE_MS = 250           # escurecimento mínimo antes de mostrar a nova cena
+FADE_ALPHA = 220
+DOTS_PERIOD_MS = 300
+
+
+class Transicao(BaseState):
+    """
+    Tela de transição entre cenas.
+
+    Escurece o último frame da cena anterior enquanto um `SceneLoad` prepara
+    a próxima numa thread de fundo. Quando a preparação termina (e o
+    escurecimento já passou), finaliza a cena na thread principal e se
+    troca por ela na pilha. Se o carregamento falhar, volta para a cena
+    anterior.
+    """
+    def __init__(self, game, load):
+        super().__init__(game)
+        self.load = load.start()
+        self.elapsed = 0
+        self.backdrop = game.SCREEN.copy()   # último frame mostrado
+        self.overlay = pygame.Surface(game.SCREEN.get_size())
+        self.font = game.assets.get_font("default")
+
+    def handle_events(self, events):
+        """Durante o carregamento só o fechamento da janela é atendido."""
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.game.running = False
+
+    def update(self):
+        self.elapsed += self.game.CLOCK.get_time()
+        if self.load is None or self.elapsed < FADE_MS or not self.load.ready:
+            return
+
+        load, self.load = self.load, None
+        try:
+            scene = load.finalize()
+        except Exception:
+            log.exception("Falha ao carregar a cena %s; voltando.", load.name)
+            self.game.pop_state()
+            return
+        self.game.replace_state(scene)
+
+    def draw(self, surface):
+        surface.blit(self.backdrop, (0, 0))
+        self.overlay.set_alpha(int(FADE_ALPHA * min(1.0, self.elapsed / FADE_MS)))
+        surface.blit(self.overlay, (0, 0))
+
+        if self.elapsed >= FADE_MS:
+            dots = "." * (1 + (self.elapsed // DOTS_PERIOD_MS) % 3)
+            text = self.font.render(f"Carregando{dots}", True, (220, 220, 220))
+            surface.blit(text, text.get_rect(bottomright=(self.game.screen_width - 20,
+                                                          self.game.screen_height - 20)))